@@ -0,0 +1,99 @@
+import logging
+from typing import Optional
+
+import boto3
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 애플리케이션 전역에서 공유하는 외부 클라이언트 (lifespan 에서 생성 및 정리)
+_s3_client = None
+_clova_http_session: Optional[requests.Session] = None
+_clova_executors: Optional[dict] = None
+
+
+def _create_s3_client():
+    return boto3.client(
+        "s3",
+        endpoint_url=settings.NCP_ENDPOINT,
+        aws_access_key_id=settings.NCP_ACCESS_KEY,
+        aws_secret_access_key=settings.NCP_SECRET_KEY,
+    )
+
+
+def _create_clova_http_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=settings.CLOVA_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=settings.CLOVA_HTTP_POOL_MAXSIZE,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _create_clova_executors(http_session: requests.Session) -> dict:
+    # 순환 import 방지를 위해 함수 내부에서 import
+    from app.service.clova_service import ChatCompletionExecutor, SlidingWindowExecutor
+
+    return {
+        "completion": ChatCompletionExecutor(
+            host=settings.CLOVA_COMPLETION_API_HOST,
+            api_key=settings.CLOVA_API_KEY,
+            api_key_primary_val=settings.CLOVA_API_KEY_PRIMARY_VAL,
+            http_session=http_session,
+        ),
+        "sliding_window": SlidingWindowExecutor(
+            host=settings.CLOVA_SLIDING_API_HOST,
+            api_key=settings.CLOVA_API_KEY,
+            api_key_primary_val=settings.CLOVA_API_KEY_PRIMARY_VAL,
+            http_session=http_session,
+        ),
+    }
+
+
+# S3 클라이언트 조회 (lifespan 이전 호출 시 지연 생성)
+def get_s3_client():
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = _create_s3_client()
+    return _s3_client
+
+
+# CLOVA API 커넥션 풀 세션 조회
+def get_clova_http_session() -> requests.Session:
+    global _clova_http_session
+    if _clova_http_session is None:
+        _clova_http_session = _create_clova_http_session()
+    return _clova_http_session
+
+
+# 설정 기반 CLOVA Executor 조회
+def get_clova_executors() -> dict:
+    global _clova_executors
+    if _clova_executors is None:
+        _clova_executors = _create_clova_executors(get_clova_http_session())
+    return _clova_executors
+
+
+# 애플리케이션 시작 시 클라이언트 생성
+def init_clients():
+    get_s3_client()
+    get_clova_executors()
+    logger.info("S3 클라이언트와 CLOVA 커넥션 풀이 생성되었습니다.")
+
+
+# 애플리케이션 종료 시 클라이언트 정리
+def close_clients():
+    global _s3_client, _clova_http_session, _clova_executors
+    if _clova_http_session is not None:
+        _clova_http_session.close()
+    if _s3_client is not None and hasattr(_s3_client, "close"):
+        _s3_client.close()
+    _s3_client = None
+    _clova_http_session = None
+    _clova_executors = None
+    logger.info("S3 클라이언트와 CLOVA 커넥션 풀이 정리되었습니다.")
@@ -0,0 +1,166 @@
+import gzip
+import hashlib
+import time
+from typing import Optional
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.utils.cache import TTLCache
+
+# 지원하는 압축 방식 (같은 선호도면 앞쪽 우선)
+_ENCODINGS = ("br", "gzip")
+
+# 압축 대상 Content-Type (text/*, +json, +xml 포함)
+_COMPRESSIBLE_TYPES = {"application/json", "application/javascript", "application/xml", "application/msgpack"}
+
+
+# Accept-Encoding 헤더로 압축 방식 결정 (q=0 제외, 지원하는 방식이 없으면 None)
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    if not accept_encoding:
+        return None
+
+    qualities = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding.strip().lower()] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in _ENCODINGS:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    if not content_type:
+        return False
+    media_type = content_type.split(";")[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in _COMPRESSIBLE_TYPES
+        or media_type.endswith("+json")
+        or media_type.endswith("+xml")
+    )
+
+
+def compress(body: bytes, encoding: str, cached: bool = False) -> bytes:
+    if encoding == "br":
+        quality = settings.COMPRESSION_BROTLI_CACHED_QUALITY if cached else settings.COMPRESSION_BROTLI_QUALITY
+        return brotli.compress(body, quality=quality)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def _compression_ratio() -> float:
+    bytes_in = metrics.get_counter("compression.bytes_in")
+    return round(metrics.get_counter("compression.bytes_out") / bytes_in, 4) if bytes_in else 0.0
+
+
+metrics.register_gauge("compression.ratio", _compression_ratio)
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 미들웨어 (Accept-Encoding 협상, brotli 우선 / gzip)
+    - minimum_size 이상이고 압축 가능한 Content-Type 인 단일 본문 응답만 압축 (스트리밍 응답은 그대로 전달)
+    - ETag 또는 Cache-Control: public 응답은 압축 결과를 캐시해 같은 본문을 다시 압축하지 않음
+      (캐시 항목은 한 번만 압축하므로 brotli 를 더 높은 품질로 압축)
+    - 원본 / 전송 바이트, 압축 CPU 시간, 캐시 적중을 지표로 기록
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, cache: Optional[TTLCache] = None):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache = (
+            cache
+            if cache is not None
+            else TTLCache(settings.COMPRESSION_CACHE_MAX_ENTRIES, settings.COMPRESSION_CACHE_TTL_SECONDS)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_compressed(message: Message):
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            body = message.get("body", b"")
+            if (
+                message.get("more_body", False)
+                or "content-encoding" in headers
+                or not is_compressible(headers.get("content-type"))
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            headers.add_vary_header("Accept-Encoding")
+            if len(body) >= self.minimum_size:
+                body = self._compress(body, encoding, headers)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                # 압축 표현은 원본과 바이트가 다르므로 약한 ETag 로 변경 (If-None-Match 는 약한 비교)
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _compress(self, body: bytes, encoding: str, headers: MutableHeaders) -> bytes:
+        metrics.incr("compression.bytes_in", len(body))
+        cache_key = self._cache_key(body, encoding, headers)
+        compressed = self.cache.get(cache_key) if cache_key is not None else None
+        if compressed is not None:
+            metrics.incr("compression.cache_hits")
+        else:
+            started = time.thread_time()
+            compressed = compress(body, encoding, cached=cache_key is not None)
+            metrics.observe("compression.cpu_ms", (time.thread_time() - started) * 1000)
+            if cache_key is not None:
+                metrics.incr("compression.cache_misses")
+                self.cache.set(cache_key, compressed)
+
+        metrics.incr(f"compression.responses.{encoding}")
+        metrics.incr("compression.bytes_out", len(compressed))
+        return compressed
+
+    # 캐시 가능한 응답의 압축 결과 캐시 키 (ETag 가 있으면 ETag, 없으면 본문 해시)
+    @staticmethod
+    def _cache_key(body: bytes, encoding: str, headers: MutableHeaders):
+        etag = headers.get("etag")
+        if etag:
+            return encoding, headers.get("content-type"), etag
+        if "public" in headers.get("cache-control", ""):
+            return encoding, headers.get("content-type"), hashlib.blake2b(body, digest_size=16).digest()
+        return None
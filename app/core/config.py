@@ -1,4 +1,4 @@
-from typing import Annotated, Any
+from typing import Annotated, Any, Optional
 
 from dotenv import load_dotenv
 
@@ -37,12 +37,27 @@ class Settings(BaseSettings):
     MYSQL_PORT: int
     MYSQL_DB: str
 
+    # DB 커넥션 풀 설정
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # 0 이면 제한 없음
+    DB_ECHO: bool = False  # SQL 로그 출력 여부
+
+    # 읽기 전용 Replica 설정 ("host:port" 콤마 구분, 비어 있으면 Primary 만 사용)
+    MYSQL_REPLICA_SERVERS: str = ""
+    REPLICA_HEALTH_CHECK_INTERVAL: int = 10
+
     # 클로바 스튜디오 API
     CLOVA_API_KEY: str
     CLOVA_API_KEY_PRIMARY_VAL: str
     CLOVA_SLIDING_API_HOST: str
     CLOVA_COMPLETION_API_HOST: str
     MAX_TOKEN: int
+    CLOVA_HTTP_POOL_CONNECTIONS: int = 4
+    CLOVA_HTTP_POOL_MAXSIZE: int = 20
 
     # 네이버 클라우드 클로바 보이스 API
     CLOVA_VOICE_URL: str
@@ -73,6 +88,87 @@ class Settings(BaseSettings):
     # 기본 이미지 URL
     DEFAULT_IMAGE_URL: str
 
+    # 내부 지표(/metrics) 조회 토큰 (Authorization: Bearer <토큰>, 미설정 시 엔드포인트 비공개)
+    METRICS_TOKEN: Optional[str] = None
+
+    # 재시도 요청 중복 처리 방지 (Idempotency-Key)
+    IDEMPOTENCY_TTL_SECONDS: int = 600
+    IDEMPOTENCY_MAX_ENTRIES: int = 10000
+
+    # 빠른 JSON 응답 (서비스에서 생성한 응답 모델을 재검증 없이 pydantic-core / orjson 으로 직렬화)
+    FAST_JSON_RESPONSE_ENABLED: bool = True
+
+    # 응답 압축 (brotli / gzip, 최소 크기 이상만 압축, ETag / public 응답은 압축 결과 캐시)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 요청마다 압축하는 응답
+    COMPRESSION_BROTLI_CACHED_QUALITY: int = 9  # 캐시되는 응답 (한 번만 압축)
+    COMPRESSION_CACHE_MAX_ENTRIES: int = 500
+    COMPRESSION_CACHE_TTL_SECONDS: int = 600
+
+    # 문화재 리스트 인메모리 지리 인덱스 (시작 시 heritages 적재, 비활성화 시 SQL 조회)
+    GEO_INDEX_ENABLED: bool = False
+    GEO_INDEX_CELL_SIZE: float = 0.1  # 격자 한 칸 크기 (도 단위)
+
+    # 문화재 이름 bigram 색인 (시작 시 name/name_hanja 적재, 비활성화 시 LIKE 검색)
+    NAME_INDEX_ENABLED: bool = False
+    NAME_INDEX_MAX_SQL_IDS: int = 1000  # SQL 조회 시 ID 목록 최대 수 (초과 시 LIKE 검색, 오타 보정은 상위만 사용)
+
+    # 문화재 이름 오타 보정 색인 (자모 단위 편집 거리, 이름 검색 결과가 없을 때 대체 검색)
+    FUZZY_INDEX_ENABLED: bool = False
+    FUZZY_MAX_EDIT_DISTANCE: int = 1  # 색인 크기가 (자모 길이)^거리 에 비례하므로 2 이하 권장
+
+    # 문화재 이름 자동완성 색인 (초성 검색, 비활성화 시 자동완성 API 503)
+    AUTOCOMPLETE_INDEX_ENABLED: bool = False
+
+    # 지도 마커 클러스터 색인 (줌 레벨별 격자 집계, 비활성화 시 클러스터 API 503)
+    CLUSTER_INDEX_ENABLED: bool = False
+    CLUSTER_INDEX_MAX_ZOOM: int = 16  # 이 줌 이상에서는 개별 문화재 반환
+    CLUSTER_INDEX_CELL_PIXELS: int = 64  # 클러스터 셀 한 변 픽셀 수 (256 의 약수인 2 의 거듭제곱)
+    CLUSTER_MAX_MARKERS: int = 500  # 개별 문화재 반환 최대 수 (초과 시 클러스터로 대체)
+
+    # 문화재 리스트 전체 개수 캐시 (필터, 거리 범위, 위치 셀 단위)
+    HERITAGE_COUNT_CACHE_TTL_SECONDS: int = 60
+    HERITAGE_COUNT_CACHE_MAX_ENTRIES: int = 5000
+
+    # 문화재 상세 조회 읽기 캐시 (TTL 경과 후 stale 허용 시간 동안은 기존 값 반환 + 백그라운드 갱신)
+    HERITAGE_DETAIL_CACHE_MAX_ENTRIES: int = 2000
+    HERITAGE_DETAIL_CACHE_TTL_SECONDS: int = 300
+    HERITAGE_DETAIL_CACHE_STALE_SECONDS: int = 600
+    # 문화재 상세 응답 Cache-Control max-age (CDN / 모바일 클라이언트, 이후 ETag 로 재검증)
+    HERITAGE_DETAIL_MAX_AGE_SECONDS: int = 60
+
+    # "내 주변" 리스트 후보 캐시 (geohash 셀 + 필터 단위, 요청 좌표로 정확한 거리 재정렬)
+    HERITAGE_NEARBY_CACHE_ENABLED: bool = True
+    HERITAGE_NEARBY_CACHE_PRECISION: int = 7  # geohash 자릿수 (7 ≈ 150m x 150m, 6 ≈ 1.2km x 0.6km)
+    HERITAGE_NEARBY_CACHE_MAX_RADIUS_KM: float = 10  # 이 반경 이하의 거리 범위만 캐시
+    HERITAGE_NEARBY_CACHE_MAX_CANDIDATES: int = 2000  # 셀 후보가 이보다 많으면 캐시하지 않음
+    HERITAGE_NEARBY_CACHE_TTL_SECONDS: int = 60
+    HERITAGE_NEARBY_CACHE_MAX_ENTRIES: int = 2000
+
+    # 지도 화면(경계 상자) 문화재 조회 (결과가 limit 보다 많으면 격자 셀별 고른 표본)
+    HERITAGE_BBOX_MAX_RESULTS: int = 500  # limit 최대값
+    HERITAGE_BBOX_SAMPLE_GRID: int = 8  # 표본 격자 한 변 셀 수
+
+    # 문화재별 내부 건축물 코스 캐시 (변경 커밋 시 무효화, 시작 시 채팅 세션이 많은 문화재부터 미리 적재)
+    HERITAGE_ROUTE_CACHE_MAX_ENTRIES: int = 5000
+    HERITAGE_ROUTE_CACHE_TTL_SECONDS: int = 86400
+    HERITAGE_ROUTE_CACHE_WARMUP_COUNT: int = 100
+
+    # 건축물 지오펜스 (반경 미지정 시 기본 반경 m, 현재 건축물 이탈 판정 반경 배율, 문화재별 색인 캐시)
+    GEOFENCE_DEFAULT_RADIUS_METERS: float = 30.0
+    GEOFENCE_EXIT_RADIUS_RATIO: float = 1.3
+    GEOFENCE_INDEX_MAX_HERITAGES: int = 2000
+    GEOFENCE_INDEX_TTL_SECONDS: int = 86400
+    # GPS 궤적 방문 판별 (업로드 최대 좌표 수, 방문으로 인정할 반경 내 최소 좌표 수)
+    GEOFENCE_TRAIL_MAX_POINTS: int = 20000
+    GEOFENCE_TRAIL_MIN_FIXES: int = 2
+
+    # 사용자 지정 코스 (한 번에 계획할 최대 건축물 수, 문화재별 건축물 조합 단위 계획 캐시 크기)
+    ROUTE_PLAN_MAX_BUILDINGS: int = 50
+    ROUTE_PLAN_CACHE_MAX_ENTRIES: int = 256
+
     @computed_field
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> MySQLDsn:
@@ -85,5 +181,28 @@ class Settings(BaseSettings):
             path=self.MYSQL_DB,
         )
 
+    @computed_field
+    @property
+    def SQLALCHEMY_REPLICA_DATABASE_URIS(self) -> list[str]:
+        uris = []
+        for server in self.MYSQL_REPLICA_SERVERS.split(","):
+            server = server.strip()
+            if not server:
+                continue
+            host, _, port = server.partition(":")
+            uris.append(
+                str(
+                    MultiHostUrl.build(
+                        scheme="mysql+aiomysql",
+                        username=self.MYSQL_USER,
+                        password=self.MYSQL_PASSWORD,
+                        host=host,
+                        port=int(port) if port else self.MYSQL_PORT,
+                        path=self.MYSQL_DB,
+                    )
+                )
+            )
+        return uris
+
 
 settings = Settings()
@@ -1,10 +1,197 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+import asyncio
+import contextlib
+import functools
+import itertools
+import logging
+import time
+from typing import List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+# 커넥션 체크아웃 대기 시간 / 오버플로우 발생을 기록하는 커넥션 풀
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    metrics_name = "primary"
+
+    def _do_get(self):
+        prefix = f"db.pool.{self.metrics_name}"
+        overflow_before = self._overflow
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception:
+            metrics.incr(f"{prefix}.checkout_errors")
+            raise
+        finally:
+            metrics.observe(f"{prefix}.checkout_wait_ms", (time.perf_counter() - started) * 1000)
+
+        # pool_size 를 넘어 새 연결을 만든 경우 오버플로우로 기록
+        if self._overflow > overflow_before and self._overflow > 0:
+            metrics.incr(f"{prefix}.overflow_events")
+        return connection
+
+
+def _register_pool_gauges(name: str, engine: AsyncEngine):
+    prefix = f"db.pool.{name}"
+    capacity = settings.DB_POOL_SIZE + max(settings.DB_MAX_OVERFLOW, 0)
+
+    metrics.register_gauge(f"{prefix}.checked_out", lambda: engine.sync_engine.pool.checkedout())
+    metrics.register_gauge(f"{prefix}.overflow", lambda: max(engine.sync_engine.pool.overflow(), 0))
+    metrics.register_gauge(
+        f"{prefix}.utilization",
+        lambda: round(engine.sync_engine.pool.checkedout() / capacity, 3) if capacity else 0.0,
+    )
+
+
+# 설정 기반 비동기 엔진 생성 (애플리케이션 전체에서 하나의 풀을 공유)
+def create_engine_from_settings(url: str, name: str = "primary") -> AsyncEngine:
+    pool_class = type(
+        f"{InstrumentedAsyncAdaptedQueuePool.__name__}_{name}",
+        (InstrumentedAsyncAdaptedQueuePool,),
+        {"metrics_name": name},
+    )
+
+    new_engine = create_async_engine(
+        url,
+        echo=settings.DB_ECHO,
+        poolclass=pool_class,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+    # SELECT 문 실행 시간 제한 (MySQL max_execution_time, 밀리초)
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+
+        @event.listens_for(new_engine.sync_engine, "connect")
+        def set_statement_timeout(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute(f"SET SESSION max_execution_time = {int(settings.DB_STATEMENT_TIMEOUT_MS)}")
+            cursor.close()
+
+    _register_pool_gauges(name, new_engine)
+    return new_engine
+
+
+class ReplicaRouter:
+    """
+    읽기 전용 Replica 라운드 로빈 선택기
+    - 주기적인 헬스 체크로 응답하지 않는 Replica 는 제외
+    - 사용 가능한 Replica 가 없으면 None 을 반환해 Primary 로 처리
+    """
+
+    def __init__(self, engines: List[AsyncEngine]):
+        self.engines = engines
+        self._healthy = [True] * len(engines)
+        self._counter = itertools.count()
+
+    def next_engine(self) -> Optional[AsyncEngine]:
+        healthy_engines = [
+            replica_engine for replica_engine, healthy in zip(self.engines, self._healthy, strict=True) if healthy
+        ]
+        if not healthy_engines:
+            return None
+        return healthy_engines[next(self._counter) % len(healthy_engines)]
 
-engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI), echo=True)
+    async def check_health(self):
+        for index, replica_engine in enumerate(self.engines):
+            try:
+                async with replica_engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+                healthy = True
+            except Exception as e:
+                logger.warning(f"Replica {replica_engine.url.host} 헬스 체크 실패: {str(e)}")
+                healthy = False
+
+            if healthy != self._healthy[index]:
+                logger.info(f"Replica {replica_engine.url.host} 상태 변경: {'정상' if healthy else '비정상'}")
+            self._healthy[index] = healthy
+
+    async def run_health_checks(self, interval: float):
+        while True:
+            await self.check_health()
+            await asyncio.sleep(interval)
+
+    async def dispose(self):
+        for replica_engine in self.engines:
+            await replica_engine.dispose()
+
+
+class RoutingSession(Session):
+    """
+    읽기 전용 Repository 메서드(@read_only)의 쿼리를 Replica 로 보내는 세션
+    - 쓰기(flush, DML)가 발생한 세션은 이후 모든 쿼리를 Primary 로 고정 (read-your-writes)
+    - primary_only 구간(use_primary)의 조회는 @read_only 메서드라도 Primary 로 보냄
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or (clause is not None and getattr(clause, "is_dml", False)):
+            self.info["pinned_primary"] = True
+        elif self.info.get("read_only") and not (self.info.get("pinned_primary") or self.info.get("primary_only")):
+            replica_engine = replica_router.next_engine()
+            if replica_engine is not None:
+                return replica_engine.sync_engine
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_primary_after_flush(session, flush_context):
+    session.info["pinned_primary"] = True
+
+
+# Repository 읽기 전용 메서드 표시 (Replica 라우팅 대상)
+def read_only(method):
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        info = getattr(self.db, "info", None)
+        if not isinstance(info, dict):
+            return await method(self, *args, **kwargs)
+
+        previous = info.get("read_only", False)
+        info["read_only"] = True
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            info["read_only"] = previous
+
+    return wrapper
+
+
+# 구간 안의 조회를 Primary 로 고정 (캐시 무효화 직후 재적재처럼 Replica 지연을 허용할 수 없는 조회)
+@contextlib.asynccontextmanager
+async def use_primary(db):
+    info = getattr(db, "info", None)
+    if not isinstance(info, dict):
+        yield
+        return
+
+    previous = info.get("primary_only", False)
+    info["primary_only"] = True
+    try:
+        yield
+    finally:
+        info["primary_only"] = previous
+
+
+engine = create_engine_from_settings(str(settings.SQLALCHEMY_DATABASE_URI))
+
+replica_router = ReplicaRouter(
+    [
+        create_engine_from_settings(uri, name=f"replica{index}")
+        for index, uri in enumerate(settings.SQLALCHEMY_REPLICA_DATABASE_URIS)
+    ]
+)
 
 Base = declarative_base()
 
@@ -13,5 +200,6 @@ AsyncSessionLocal = sessionmaker(
     autoflush=False,  # True인 경우 쿼리 작업 실행 전 보류 중인 DB 변경 사항을 자동으로 Flush
     bind=engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
     expire_on_commit=False,
 )
@@ -1,8 +1,22 @@
+import hmac
 from typing import Optional
 
-from fastapi import Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import AsyncSessionLocal
+from app.repository.chat_repository import ChatRepository
+from app.repository.heritage_repository import HeritageRepository
+from app.repository.image_repository import ImageRepository
+from app.repository.user_repository import UserRepository
+from app.service.autocomplete_service import AutocompleteService
+from app.service.chat_service import ChatService
+from app.service.geofence_service import GeofenceService
+from app.service.heritage_cluster_service import HeritageClusterService
+from app.service.heritage_service import HeritageService
+from app.service.image_service import ImageService
+from app.service.route_planner_service import RoutePlannerService
 
 
 async def get_db():
@@ -13,6 +27,77 @@ async def get_db():
         # await session.close()
 
 
+# 요청 단위 Repository 주입 (같은 요청에서는 하나의 DB 세션 공유)
+def get_user_repository(db: AsyncSession = Depends(get_db)) -> UserRepository:
+    return UserRepository(db)
+
+
+def get_chat_repository(db: AsyncSession = Depends(get_db)) -> ChatRepository:
+    return ChatRepository(db)
+
+
+def get_heritage_repository(db: AsyncSession = Depends(get_db)) -> HeritageRepository:
+    return HeritageRepository(db)
+
+
+def get_image_repository(db: AsyncSession = Depends(get_db)) -> ImageRepository:
+    return ImageRepository(db)
+
+
+# 서비스 주입 (S3 클라이언트, CLOVA Executor 는 애플리케이션 전역 객체 재사용)
+def get_chat_service(
+    db: AsyncSession = Depends(get_db),
+    user_repository: UserRepository = Depends(get_user_repository),
+    chat_repository: ChatRepository = Depends(get_chat_repository),
+    heritage_repository: HeritageRepository = Depends(get_heritage_repository),
+) -> ChatService:
+    return ChatService(
+        db,
+        user_repository=user_repository,
+        chat_repository=chat_repository,
+        heritage_repository=heritage_repository,
+    )
+
+
+def get_heritage_service(
+    db: AsyncSession = Depends(get_db),
+    heritage_repository: HeritageRepository = Depends(get_heritage_repository),
+) -> HeritageService:
+    return HeritageService(db, heritage_repository=heritage_repository)
+
+
+def get_image_service(
+    db: AsyncSession = Depends(get_db),
+    heritage_repository: HeritageRepository = Depends(get_heritage_repository),
+    image_repository: ImageRepository = Depends(get_image_repository),
+) -> ImageService:
+    return ImageService(db, heritage_repository=heritage_repository, image_repository=image_repository)
+
+
+# 지오펜스는 문화재별 최초 요청 시에만 DB 조회
+def get_geofence_service(
+    db: AsyncSession = Depends(get_db),
+    heritage_repository: HeritageRepository = Depends(get_heritage_repository),
+) -> GeofenceService:
+    return GeofenceService(db, heritage_repository=heritage_repository)
+
+
+def get_route_planner_service(
+    db: AsyncSession = Depends(get_db),
+    heritage_repository: HeritageRepository = Depends(get_heritage_repository),
+) -> RoutePlannerService:
+    return RoutePlannerService(db, heritage_repository=heritage_repository)
+
+
+# 자동완성은 인메모리 색인만 사용하므로 DB 세션 주입 없음
+def get_autocomplete_service() -> AutocompleteService:
+    return AutocompleteService()
+
+
+def get_heritage_cluster_service() -> HeritageClusterService:
+    return HeritageClusterService()
+
+
 async def get_token(Authorization: Optional[str] = Header(None)) -> str:
     if not Authorization:
         raise HTTPException(
@@ -44,3 +129,27 @@ async def get_token(Authorization: Optional[str] = Header(None)) -> str:
         )
 
     return token
+
+
+async def get_idempotency_key(idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")) -> Optional[str]:
+    if idempotency_key is None:
+        return None
+
+    idempotency_key = idempotency_key.strip()
+    if not idempotency_key or len(idempotency_key) > 255:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 Idempotency-Key 헤더",
+        )
+
+    return idempotency_key
+
+
+# 내부 지표 조회 토큰 확인 (METRICS_TOKEN 미설정 시 엔드포인트 비공개)
+async def verify_metrics_token(Authorization: Optional[str] = Header(None)):
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    token = await get_token(Authorization)
+    if not hmac.compare_digest(token.encode(), settings.METRICS_TOKEN.encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="유효하지 않은 지표 조회 토큰")
@@ -0,0 +1,90 @@
+import asyncio
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from app.core.config import settings
+from app.error.chat_exception import IdempotencyKeyMismatchException
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# 요청 본문 지문 생성 (같은 키로 다른 요청이 들어오는지 확인용)
+def make_request_fingerprint(*parts: Any) -> str:
+    raw = "|".join(part.model_dump_json() if hasattr(part, "model_dump_json") else str(part) for part in parts)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class IdempotencyStore:
+    """
+    Idempotency-Key 별 응답 저장소 (프로세스 단위 인메모리)
+    - 완료된 응답은 TTL 동안 저장되어 재시도 시 그대로 반환
+    - 첫 요청이 처리 중이면 재시도 요청은 같은 결과를 기다림
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self._responses = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._in_flight: Dict[str, Tuple[str, asyncio.Future]] = {}
+
+    async def run(
+        self,
+        scope: str,
+        idempotency_key: Optional[str],
+        fingerprint: str,
+        operation: Callable[[], Awaitable[T]],
+    ) -> T:
+        # 키가 없는 요청은 기존과 동일하게 처리
+        if not idempotency_key:
+            return await operation()
+
+        # 엔드포인트(scope) 별로 키 공간 분리
+        key = f"{scope}:{idempotency_key}"
+
+        stored = self._responses.get(key)
+        if stored is not None:
+            stored_fingerprint, response = stored
+            if stored_fingerprint != fingerprint:
+                raise IdempotencyKeyMismatchException(idempotency_key)
+            logger.info(f"Idempotency-Key '{key}'에 저장된 응답을 반환합니다.")
+            return response
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            in_flight_fingerprint, future = in_flight
+            if in_flight_fingerprint != fingerprint:
+                raise IdempotencyKeyMismatchException(idempotency_key)
+            logger.info(f"Idempotency-Key '{key}'의 첫 요청이 처리 중이므로 결과를 기다립니다.")
+            # 대기 중인 요청이 취소되어도 첫 요청에는 영향이 없도록 shield 처리
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = (fingerprint, future)
+        try:
+            response = await operation()
+        except BaseException as e:
+            # 실패한 응답은 저장하지 않고, 대기 중인 재시도 요청에도 같은 오류 전달
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # 대기자가 없는 경우 "exception was never retrieved" 경고 방지
+                future.exception()
+            raise
+        else:
+            self._responses.set(key, (fingerprint, response))
+            future.set_result(response)
+            return response
+        finally:
+            self._in_flight.pop(key, None)
+
+    def clear(self):
+        self._responses.clear()
+
+
+idempotency_store = IdempotencyStore(
+    ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS,
+    max_entries=settings.IDEMPOTENCY_MAX_ENTRIES,
+)
@@ -0,0 +1,78 @@
+import threading
+from typing import Callable, Dict, Union
+
+
+# 관측 값 요약 (개수, 합계, 최댓값)
+class _Summary:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 3),
+            "avg": round(self.total / self.count, 3) if self.count else 0.0,
+            "max": round(self.max, 3),
+        }
+
+
+class MetricsRegistry:
+    """
+    프로세스 단위 인메모리 지표 저장소
+    - counter: 누적 횟수 / 바이트 수
+    - summary: 대기 시간 등 관측 값 요약
+    - gauge: 조회 시점에 계산되는 현재 값
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._summaries: Dict[str, _Summary] = {}
+        self._gauges: Dict[str, Callable[[], Union[int, float]]] = {}
+
+    def incr(self, name: str, value: float = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float):
+        with self._lock:
+            summary = self._summaries.get(name)
+            if summary is None:
+                summary = self._summaries[name] = _Summary()
+            summary.observe(value)
+
+    def register_gauge(self, name: str, getter: Callable[[], Union[int, float]]):
+        self._gauges[name] = getter
+
+    def get_counter(self, name: str) -> float:
+        return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            counters = dict(self._counters)
+            summaries = {name: summary.to_dict() for name, summary in self._summaries.items()}
+        gauges = {}
+        for name, getter in self._gauges.items():
+            try:
+                gauges[name] = getter()
+            except Exception:
+                gauges[name] = None
+        return {"counters": counters, "summaries": summaries, "gauges": gauges}
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._summaries.clear()
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,42 @@
+from decimal import Decimal
+from typing import Any, Union
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+
+def _default(value: Any):
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"JSON 으로 직렬화할 수 없는 타입입니다: {type(value).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    빠른 JSON 응답
+    - Pydantic 모델은 pydantic-core(Rust) 직렬화, 그 외 값은 orjson 으로 직렬화
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+# 서비스에서 생성한 응답 모델을 재검증 / jsonable_encoder 변환 없이 바로 직렬화
+# - response 로 주입받은 헤더 / 상태 코드를 그대로 이어받음
+# - FAST_JSON_RESPONSE_ENABLED 비활성화 시 모델을 그대로 반환해 기존 response_model 경로 사용
+def model_response(model: BaseModel, response: Response = None) -> Union[BaseModel, Response]:
+    if not settings.FAST_JSON_RESPONSE_ENABLED:
+        return model
+
+    fast_response = FastJSONResponse(model)
+    if response is not None:
+        if response.status_code:
+            fast_response.status_code = response.status_code
+        fast_response.headers.raw.extend(response.headers.raw)
+    return fast_response
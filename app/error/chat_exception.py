@@ -13,6 +13,13 @@ class SessionNotFoundException(ChatServiceException):
         super().__init__(f"세션 ID {session_id}인 채팅 세션을 찾을 수 없습니다.")
 
 
+class InvalidTrailException(ChatServiceException):
+    """GPS 궤적을 디코딩할 수 없을 때 발생하는 예외"""
+
+    def __init__(self, reason: str):
+        super().__init__(f"유효하지 않은 GPS 궤적: {reason}")
+
+
 class QuizGenerationException(ChatServiceException):
     """퀴즈 생성 중 오류가 발생했을 때 발생하는 예외"""
 
@@ -49,3 +56,10 @@ class APICallException(ChatServiceException):
         self.api_name = api_name
         self.status_code = status_code
         self.error_message = error_message
+
+
+class IdempotencyKeyMismatchException(ChatServiceException):
+    """같은 Idempotency-Key로 다른 요청 본문이 전송되었을 때 발생하는 예외"""
+
+    def __init__(self, idempotency_key: str):
+        super().__init__(f"Idempotency-Key '{idempotency_key}'는 이미 다른 요청에 사용되었습니다.")
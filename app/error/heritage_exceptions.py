@@ -39,3 +39,38 @@ class DatabaseConnectionError(HeritageServiceException):
 
     def __init__(self):
         super().__init__("데이터베이스 연결에 실패했습니다.")
+
+
+class InvalidCursorException(HeritageServiceException):
+    """페이지네이션 커서가 유효하지 않을 때 발생하는 예외"""
+
+    def __init__(self):
+        super().__init__("유효하지 않은 페이지 커서입니다.")
+
+
+class AutocompleteUnavailableException(HeritageServiceException):
+    """자동완성 색인이 준비되지 않았을 때 발생하는 예외"""
+
+    def __init__(self):
+        super().__init__("자동완성 색인이 준비되지 않았습니다.")
+
+
+class TooManyRouteBuildingsException(HeritageServiceException):
+    """사용자 지정 코스의 건축물 수가 허용 범위를 넘을 때 발생하는 예외"""
+
+    def __init__(self, max_buildings: int):
+        super().__init__(f"사용자 지정 코스는 최대 {max_buildings} 개의 건축물까지 계획할 수 있습니다.")
+
+
+class ClusterUnavailableException(HeritageServiceException):
+    """지도 클러스터 색인이 준비되지 않았을 때 발생하는 예외"""
+
+    def __init__(self):
+        super().__init__("지도 클러스터 색인이 준비되지 않았습니다.")
+
+
+class InvalidBoundingBoxException(HeritageServiceException):
+    """지도 경계 상자 형식이 유효하지 않을 때 발생하는 예외"""
+
+    def __init__(self, bbox: str):
+        super().__init__(f"유효하지 않은 경계 상자입니다: {bbox} (형식: 최소경도,최소위도,최대경도,최대위도)")
@@ -0,0 +1,204 @@
+import heapq
+import logging
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import event
+
+from app.index.catalog import HeritageRecord
+from app.index.name_index import name_keys, normalize_name
+from app.models.chat.chat_session import ChatSession
+from app.utils.cache import TTLCache
+from app.utils.geo import haversine_distances
+from app.utils.hangul import JONGSUNG_COUNT, has_no_jongsung, is_chosung, to_chosung, without_jongsung
+
+logger = logging.getLogger(__name__)
+
+# 접두 검색 범위 상한 문자
+_MAX_CHAR = "\U0010ffff"
+
+POPULAR_CACHE_MAX_ENTRIES = 1024
+POPULAR_CACHE_TTL_SECONDS = 60
+
+
+# 검색 키가 입력 중인 검색어로 시작하는지 여부
+# - 초성 자모는 음절의 초성과 비교
+# - 종성이 없는 마지막 음절은 받침을 입력 중일 수 있으므로 초성+중성만 비교
+def matches_prefix(key: str, query: str) -> bool:
+    if len(key) < len(query):
+        return False
+    last = len(query) - 1
+    for i, char in enumerate(query):
+        if is_chosung(char):
+            if to_chosung(key[i]) != char:
+                return False
+        elif i == last and has_no_jongsung(char):
+            if without_jongsung(key[i]) != char:
+                return False
+        elif key[i] != char:
+            return False
+    return True
+
+
+# 검색어 앞부분 중 음절 그대로 비교 가능한 길이
+def _exact_prefix_length(query: str) -> int:
+    for i, char in enumerate(query):
+        if is_chosung(char):
+            return i
+    return len(query) - 1 if has_no_jongsung(query[-1]) else len(query)
+
+
+class AutocompleteIndex:
+    """
+    문화재 이름 자동완성 인메모리 색인
+    - 단어 시작 위치별 이름 키와 그 초성 키를 정렬 배열로 보관하고 이분 탐색으로 접두 검색
+    - 완성형 음절, 초성(ㄱㅂㄱ), 받침 입력 중인 마지막 음절(경보 -> 경복궁) 모두 지원
+    - 인기도(채팅 세션 수) 또는 사용자 위치 기준 거리 순으로 상위 k 개 반환
+    """
+
+    def __init__(self):
+        self.is_ready = False
+        self._records: Dict[int, HeritageRecord] = {}
+        self._keys: List[Tuple[str, int]] = []
+        self._chosung_keys: List[Tuple[str, str, int]] = []
+        self.popularity: Dict[int, int] = {}
+        # 거리 계산용 좌표 배열 (문화재 ID -> 배열 위치)
+        self._positions: Dict[int, int] = {}
+        self._latitudes = np.zeros(0)
+        self._longitudes = np.zeros(0)
+        # 인기도 순 결과 캐시 (첫 글자처럼 후보가 많은 짧은 검색어 반복 조회 대비, 인기도 변화는 TTL 만큼 지연 반영)
+        self._popular_cache = TTLCache(POPULAR_CACHE_MAX_ENTRIES, POPULAR_CACHE_TTL_SECONDS)
+
+    # 카탈로그 전체 재적재
+    def rebuild(self, records: List[HeritageRecord]):
+        self._records = {record.id: record for record in records}
+        self._keys = sorted((key, record.id) for record in records for key in name_keys(record.name))
+        self._chosung_keys = sorted((to_chosung(key), key, heritage_id) for key, heritage_id in self._keys)
+        self._positions = {record.id: position for position, record in enumerate(records)}
+        self._latitudes = np.array([record.latitude or 0.0 for record in records], dtype=np.float64)
+        self._longitudes = np.array([record.longitude or 0.0 for record in records], dtype=np.float64)
+        self._popular_cache.clear()
+        self.is_ready = True
+        logger.info(f"자동완성 색인 구성 완료: {len(self._records)} 건, 키 {len(self._keys)} 개")
+
+    # 문화재 추가/수정 반영
+    def upsert(self, record: HeritageRecord):
+        self.remove(record.id)
+        self._records[record.id] = record
+        for key in name_keys(record.name):
+            insort(self._keys, (key, record.id))
+            insort(self._chosung_keys, (to_chosung(key), key, record.id))
+
+        position = self._positions.get(record.id)
+        if position is None:
+            position = self._positions[record.id] = len(self._latitudes)
+            self._latitudes = np.append(self._latitudes, 0.0)
+            self._longitudes = np.append(self._longitudes, 0.0)
+        self._latitudes[position] = record.latitude or 0.0
+        self._longitudes[position] = record.longitude or 0.0
+        self._popular_cache.clear()
+
+    # 문화재 삭제 반영
+    def remove(self, heritage_id: int):
+        record = self._records.pop(heritage_id, None)
+        if record is None:
+            return
+        for key in name_keys(record.name):
+            self._discard(self._keys, (key, heritage_id))
+            self._discard(self._chosung_keys, (to_chosung(key), key, heritage_id))
+        self._popular_cache.clear()
+
+    @staticmethod
+    def _discard(entries: list, entry: tuple):
+        position = bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            del entries[position]
+
+    def set_popularity(self, counts: Dict[int, int]):
+        self.popularity = dict(counts)
+
+    def increment_popularity(self, heritage_id: int):
+        self.popularity[heritage_id] = self.popularity.get(heritage_id, 0) + 1
+
+    # 검색어로 시작하는 문화재 ID 집합
+    def _match_ids(self, query: str) -> set:
+        exact_length = _exact_prefix_length(query)
+        if exact_length == len(query) - 1 and has_no_jongsung(query[-1]):
+            # 받침 입력 중인 마지막 음절은 같은 초성+중성 음절(받침 28종)이 연속 범위이므로 바로 범위 검색
+            last_syllable = chr(ord(query[-1]) + JONGSUNG_COUNT - 1)
+            start = bisect_left(self._keys, (query,))
+            end = bisect_left(self._keys, (query[:-1] + last_syllable + _MAX_CHAR,))
+            return {heritage_id for _, heritage_id in self._keys[start:end]}
+
+        if exact_length > 0:
+            prefix = query[:exact_length]
+            start = bisect_left(self._keys, (prefix,))
+            end = bisect_left(self._keys, (prefix + _MAX_CHAR,))
+            if exact_length == len(query):
+                return {heritage_id for _, heritage_id in self._keys[start:end]}
+            return {heritage_id for key, heritage_id in self._keys[start:end] if matches_prefix(key, query)}
+
+        # 첫 글자부터 초성/입력 중 음절이면 초성 키로 범위 검색
+        prefix = to_chosung(query)
+        start = bisect_left(self._chosung_keys, (prefix,))
+        end = bisect_left(self._chosung_keys, (prefix + _MAX_CHAR,))
+        if prefix == query:
+            return {heritage_id for _, _, heritage_id in self._chosung_keys[start:end]}
+        return {heritage_id for _, key, heritage_id in self._chosung_keys[start:end] if matches_prefix(key, query)}
+
+    # 자동완성 추천 (사용자 위치가 있으면 거리 순, 없으면 인기도 순)
+    def suggest(
+        self,
+        query: str,
+        limit: int = 10,
+        user_latitude: Optional[float] = None,
+        user_longitude: Optional[float] = None,
+    ) -> List[Tuple[HeritageRecord, Optional[float]]]:
+        query = normalize_name(query)
+        if not query:
+            return []
+
+        if user_latitude is not None and user_longitude is not None:
+            return self._nearest(list(self._match_ids(query)), limit, user_latitude, user_longitude)
+
+        cache_key = (query, limit)
+        suggestions = self._popular_cache.get(cache_key)
+        if suggestions is None:
+            top = heapq.nsmallest(
+                limit,
+                (self._records[heritage_id] for heritage_id in self._match_ids(query)),
+                key=lambda record: (-self.popularity.get(record.id, 0), len(record.name or ""), record.id),
+            )
+            suggestions = [(record, None) for record in top]
+            self._popular_cache.set(cache_key, suggestions)
+        return suggestions
+
+    # 사용자 위치에서 가까운 순 상위 k 개 (거리가 같으면 이름 길이, ID 순)
+    def _nearest(
+        self, heritage_ids: List[int], limit: int, user_latitude: float, user_longitude: float
+    ) -> List[Tuple[HeritageRecord, Optional[float]]]:
+        positions = np.array([self._positions[heritage_id] for heritage_id in heritage_ids], dtype=np.int64)
+        distances = haversine_distances(
+            user_latitude, user_longitude, self._latitudes[positions], self._longitudes[positions]
+        )
+        if limit < len(distances):
+            kth = np.partition(distances, limit - 1)[limit - 1]
+            selected = np.flatnonzero(distances <= kth)
+        else:
+            selected = np.arange(len(distances))
+
+        scored = sorted(
+            (float(distances[i]), len(self._records[heritage_ids[i]].name or ""), heritage_ids[i]) for i in selected
+        )
+        return [(self._records[heritage_id], round(distance, 1)) for distance, _, heritage_id in scored[:limit]]
+
+
+autocomplete_index = AutocompleteIndex()
+
+
+# 채팅 세션 생성 시 문화재 인기도 증가
+@event.listens_for(ChatSession, "after_insert")
+def _on_chat_session_created(mapper, connection, target):
+    if autocomplete_index.is_ready and target.heritage_id is not None:
+        autocomplete_index.increment_popularity(target.heritage_id)
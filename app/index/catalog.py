@@ -0,0 +1,158 @@
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Protocol
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session, object_session
+
+from app.models.heritage.heritage import Heritage
+from app.models.heritage.heritage_type import HeritageType
+
+logger = logging.getLogger(__name__)
+
+
+# 인메모리 인덱스에서 사용하는 문화재 요약 정보
+@dataclass(slots=True)
+class HeritageRecord:
+    id: int
+    name: str
+    name_hanja: Optional[str]
+    location_list: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    heritage_type_id: Optional[int]
+    heritage_type_name: Optional[str]
+    area_code: Optional[float]
+    era: Optional[str]
+    image_url: Optional[str]
+
+
+# 카탈로그 변경 사항을 전달받는 인덱스 인터페이스
+class CatalogListener(Protocol):
+    def rebuild(self, records: List[HeritageRecord]):
+        pass
+
+    def upsert(self, record: HeritageRecord):
+        pass
+
+    def remove(self, heritage_id: int):
+        pass
+
+
+class HeritageCatalog:
+    """
+    문화재 목록 인메모리 카탈로그
+    - 애플리케이션 시작 시 한 번 DB 에서 적재
+    - ORM 커밋 이후 변경된 문화재만 구독 중인 인덱스에 반영
+    """
+
+    def __init__(self):
+        self.records: Dict[int, HeritageRecord] = {}
+        self.type_names: Dict[int, str] = {}
+        self.is_loaded = False
+        self._listeners: List[CatalogListener] = []
+
+    @property
+    def has_listeners(self) -> bool:
+        return bool(self._listeners)
+
+    def subscribe(self, listener: CatalogListener):
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+            if self.is_loaded:
+                listener.rebuild(list(self.records.values()))
+
+    async def load(self, db: AsyncSession):
+        type_result = await db.execute(select(HeritageType.type_id, HeritageType.name))
+        self.type_names = {type_id: name for type_id, name in type_result.all()}
+
+        result = await db.execute(
+            select(
+                Heritage.id,
+                Heritage.name,
+                Heritage.name_hanja,
+                Heritage.location_list,
+                Heritage.latitude,
+                Heritage.longitude,
+                Heritage.heritage_type_id,
+                Heritage.area_code,
+                Heritage.era,
+                Heritage.image_url,
+            )
+        )
+        self.rebuild([self._to_record(row) for row in result.all()])
+        logger.info(f"문화재 카탈로그 적재 완료: {len(self.records)} 건")
+
+    def rebuild(self, records: List[HeritageRecord]):
+        self.records = {record.id: record for record in records}
+        self.is_loaded = True
+        for listener in self._listeners:
+            listener.rebuild(list(self.records.values()))
+
+    def upsert(self, record: HeritageRecord):
+        self.records[record.id] = record
+        for listener in self._listeners:
+            listener.upsert(record)
+
+    def remove(self, heritage_id: int):
+        if self.records.pop(heritage_id, None) is None:
+            return
+        for listener in self._listeners:
+            listener.remove(heritage_id)
+
+    def _to_record(self, source) -> HeritageRecord:
+        return HeritageRecord(
+            id=source.id,
+            name=source.name,
+            name_hanja=source.name_hanja,
+            location_list=source.location_list,
+            latitude=float(source.latitude) if source.latitude is not None else None,
+            longitude=float(source.longitude) if source.longitude is not None else None,
+            heritage_type_id=source.heritage_type_id,
+            heritage_type_name=self.type_names.get(source.heritage_type_id),
+            area_code=source.area_code,
+            era=source.era,
+            image_url=source.image_url,
+        )
+
+
+heritage_catalog = HeritageCatalog()
+
+
+# ORM 으로 변경된 문화재를 세션에 기록해두었다가 커밋 이후 카탈로그에 반영
+def _record_heritage_change(target: Heritage, removed: bool):
+    session = object_session(target)
+    if session is None or not heritage_catalog.is_loaded:
+        return
+    change = ("remove", target.id) if removed else ("upsert", heritage_catalog._to_record(target))
+    session.info.setdefault("heritage_changes", []).append(change)
+
+
+@event.listens_for(Heritage, "after_insert")
+@event.listens_for(Heritage, "after_update")
+def _on_heritage_saved(mapper, connection, target):
+    _record_heritage_change(target, removed=False)
+
+
+@event.listens_for(Heritage, "after_delete")
+def _on_heritage_deleted(mapper, connection, target):
+    _record_heritage_change(target, removed=True)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_heritage_changes(session):
+    for action, payload in session.info.pop("heritage_changes", []):
+        try:
+            if action == "upsert":
+                heritage_catalog.upsert(payload)
+            else:
+                heritage_catalog.remove(payload)
+        except Exception as e:
+            logger.error(f"문화재 카탈로그 반영 중 오류 발생: {str(e)}", exc_info=True)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_heritage_changes(session):
+    session.info.pop("heritage_changes", None)
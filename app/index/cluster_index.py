@@ -0,0 +1,166 @@
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.index.catalog import HeritageRecord
+
+logger = logging.getLogger(__name__)
+
+GridCell = Tuple[int, int]
+
+# 지도 타일 한 변 픽셀 수 / Web Mercator 에서 표현 가능한 최대 위도
+_TILE_PIXELS = 256
+_MAX_MERCATOR_LATITUDE = 85.05112878
+
+
+# 좌표를 2^bits x 2^bits 격자의 Web Mercator 정수 좌표로 변환 (y 는 북쪽에서 0)
+def mercator_cell(latitude: float, longitude: float, bits: int) -> GridCell:
+    scale = 1 << bits
+    latitude = min(max(latitude, -_MAX_MERCATOR_LATITUDE), _MAX_MERCATOR_LATITUDE)
+    sin_latitude = math.sin(math.radians(latitude))
+    x = int((longitude + 180) / 360 * scale)
+    y = int((0.5 - math.log((1 + sin_latitude) / (1 - sin_latitude)) / (4 * math.pi)) * scale)
+    return min(max(x, 0), scale - 1), min(max(y, 0), scale - 1)
+
+
+# 격자 셀 하나의 클러스터 집계 (중심 좌표는 소속 문화재 좌표 평균)
+@dataclass(slots=True)
+class ClusterCell:
+    ids: Set[int] = field(default_factory=set)
+    latitude_sum: float = 0.0
+    longitude_sum: float = 0.0
+
+
+# 지도 표시용 클러스터 (count 가 1 이면 해당 문화재 정보 포함)
+@dataclass(slots=True)
+class HeritageCluster:
+    latitude: float
+    longitude: float
+    count: int
+    heritage_id: Optional[int] = None
+    name: Optional[str] = None
+
+
+class ClusterIndex:
+    """
+    지도 줌 레벨별 문화재 마커 클러스터 인메모리 색인
+    - 줌 z 에서 타일 하나를 cell_pixels 픽셀 크기의 격자로 나누고, 셀별 문화재 수와 좌표 합을 미리 집계
+    - 가장 세밀한 단계의 정수 좌표만 보관하고 상위 단계 셀은 비트 시프트로 계산 (계층 격자)
+    - 카탈로그 변경은 해당 문화재가 속한 단계별 셀만 갱신
+    - max_zoom 이상에서는 클러스터 없이 개별 문화재 반환
+    """
+
+    def __init__(self, max_zoom: int, cell_pixels: int):
+        self.max_zoom = max_zoom
+        self.is_ready = False
+        # 줌 z 의 격자 한 변 셀 수 = 2^(z + cell_bits)
+        self._cell_bits = int(round(math.log2(_TILE_PIXELS / cell_pixels)))
+        self._bits = max_zoom + self._cell_bits
+        self._records: Dict[int, HeritageRecord] = {}
+        self._finest_cells: Dict[int, GridCell] = {}
+        self._levels: List[Dict[GridCell, ClusterCell]] = [{} for _ in range(max_zoom)]
+
+    # 카탈로그 전체 재적재
+    def rebuild(self, records: List[HeritageRecord]):
+        self._records, self._finest_cells = {}, {}
+        self._levels = [{} for _ in range(self.max_zoom)]
+        for record in records:
+            self._add(record)
+        self.is_ready = True
+        logger.info(f"지도 클러스터 색인 구성 완료: {len(self._records)} 건")
+
+    # 문화재 추가/수정 반영
+    def upsert(self, record: HeritageRecord):
+        self.remove(record.id)
+        self._add(record)
+
+    # 문화재 삭제 반영
+    def remove(self, heritage_id: int):
+        record = self._records.pop(heritage_id, None)
+        if record is None:
+            return
+        finest = self._finest_cells.pop(heritage_id)
+        for zoom, cells in enumerate(self._levels):
+            key = self._level_cell(finest, zoom)
+            cell = cells[key]
+            cell.ids.discard(heritage_id)
+            if not cell.ids:
+                del cells[key]
+                continue
+            cell.latitude_sum -= record.latitude
+            cell.longitude_sum -= record.longitude
+
+    def _add(self, record: HeritageRecord):
+        # 좌표가 없는 문화재는 지도에 표시하지 않음
+        if record.latitude is None or record.longitude is None:
+            return
+        finest = mercator_cell(record.latitude, record.longitude, self._bits)
+        self._records[record.id] = record
+        self._finest_cells[record.id] = finest
+        for zoom, cells in enumerate(self._levels):
+            cell = cells.get(self._level_cell(finest, zoom))
+            if cell is None:
+                cell = cells[self._level_cell(finest, zoom)] = ClusterCell()
+            cell.ids.add(record.id)
+            cell.latitude_sum += record.latitude
+            cell.longitude_sum += record.longitude
+
+    def _level_cell(self, finest: GridCell, zoom: int) -> GridCell:
+        shift = self.max_zoom - zoom
+        return finest[0] >> shift, finest[1] >> shift
+
+    # 경계 상자 안의 클러스터 조회
+    # - max_zoom 이상이면 개별 문화재, 단 max_markers 를 넘으면 가장 세밀한 클러스터로 대체
+    def clusters(
+        self, min_lat: float, min_lon: float, max_lat: float, max_lon: float, zoom: int, max_markers: int
+    ) -> List[HeritageCluster]:
+        zoom = max(zoom, 0)
+        if zoom >= self.max_zoom:
+            markers = self._markers(min_lat, min_lon, max_lat, max_lon)
+            if len(markers) <= max_markers:
+                return markers
+            zoom = self.max_zoom - 1
+
+        result = []
+        for cell in self._cells_in_bbox(min_lat, min_lon, max_lat, max_lon, zoom):
+            count = len(cell.ids)
+            if count == 1:
+                record = self._records[next(iter(cell.ids))]
+                result.append(HeritageCluster(record.latitude, record.longitude, 1, record.id, record.name))
+            else:
+                result.append(HeritageCluster(cell.latitude_sum / count, cell.longitude_sum / count, count))
+        return result
+
+    def _markers(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> List[HeritageCluster]:
+        markers = []
+        for cell in self._cells_in_bbox(min_lat, min_lon, max_lat, max_lon, self.max_zoom - 1):
+            for heritage_id in sorted(cell.ids):
+                record = self._records[heritage_id]
+                if min_lat <= record.latitude <= max_lat and min_lon <= record.longitude <= max_lon:
+                    markers.append(HeritageCluster(record.latitude, record.longitude, 1, record.id, record.name))
+        return markers
+
+    # 경계 상자와 겹치는 셀 (범위 셀 수가 전체 셀보다 많으면 전체 셀을 걸러냄)
+    def _cells_in_bbox(
+        self, min_lat: float, min_lon: float, max_lat: float, max_lon: float, zoom: int
+    ) -> Iterator[ClusterCell]:
+        cells = self._levels[zoom]
+        bits = zoom + self._cell_bits
+        min_x, min_y = mercator_cell(max_lat, min_lon, bits)
+        max_x, max_y = mercator_cell(min_lat, max_lon, bits)
+
+        if (max_x - min_x + 1) * (max_y - min_y + 1) <= len(cells):
+            for x in range(min_x, max_x + 1):
+                for y in range(min_y, max_y + 1):
+                    cell = cells.get((x, y))
+                    if cell is not None:
+                        yield cell
+        else:
+            for (x, y), cell in cells.items():
+                if min_x <= x <= max_x and min_y <= y <= max_y:
+                    yield cell
+
+
+cluster_index = ClusterIndex(settings.CLUSTER_INDEX_MAX_ZOOM, settings.CLUSTER_INDEX_CELL_PIXELS)
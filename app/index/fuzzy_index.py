@@ -0,0 +1,138 @@
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.index.catalog import HeritageRecord
+from app.index.name_index import name_keys, normalize_name
+from app.utils.hangul import decompose_jamo
+
+logger = logging.getLogger(__name__)
+
+
+# 편집 거리 (max_distance 를 넘으면 계산을 멈추고 max_distance + 1 반환)
+def bounded_levenshtein(source: str, target: str, max_distance: int) -> int:
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+
+    previous = list(range(len(target) + 1))
+    for i, source_char in enumerate(source, start=1):
+        current = [i] + [0] * len(target)
+        for j, target_char in enumerate(target, start=1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (source_char != target_char),
+            )
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+# 문자 삭제로 만들 수 있는 변형 문자열 집합 (삭제 0 ~ max_distance 회)
+def delete_variants(term: str, max_distance: int) -> Set[str]:
+    variants = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        frontier = {variant[:i] + variant[i + 1 :] for variant in frontier for i in range(len(variant))}
+        variants |= frontier
+    return variants
+
+
+# 자모 길이별 허용 편집 거리 (짧은 검색어는 오탐이 많아 제한)
+def allowed_distance(jamo_length: int, max_distance: int) -> int:
+    if jamo_length < 4:
+        return 0
+    if jamo_length < 8:
+        return min(1, max_distance)
+    return max_distance
+
+
+class FuzzyIndex:
+    """
+    문화재 이름 오타 보정 검색 색인 (자모 단위 symmetric delete)
+    - 이름 전체와 단어별 토큰을 자모로 분해한 뒤 최대 편집 거리만큼 문자를 삭제한 변형을 색인
+    - 검색어의 삭제 변형과 겹치는 토큰만 후보로 뽑아 편집 거리 재검증 (경북궁 -> 경복궁, 불굮사 -> 불국사)
+    """
+
+    def __init__(self, max_distance: int = 1):
+        self.max_distance = max_distance
+        self.is_ready = False
+        self._term_ids: Dict[str, Set[int]] = {}
+        self._variants: Dict[str, Set[str]] = {}
+        self._record_terms: Dict[int, Set[str]] = {}
+
+    # 카탈로그 전체 재적재
+    def rebuild(self, records: List[HeritageRecord]):
+        self._term_ids = {}
+        self._variants = {}
+        self._record_terms = {}
+        for record in records:
+            self._add(record)
+        self.is_ready = True
+        logger.info(f"오타 보정 색인 구성 완료: 토큰 {len(self._term_ids)} 개, 변형 {len(self._variants)} 개")
+
+    # 문화재 추가/수정 반영
+    def upsert(self, record: HeritageRecord):
+        self.remove(record.id)
+        self._add(record)
+
+    # 문화재 삭제 반영 (다른 문화재가 쓰지 않는 토큰은 변형까지 제거)
+    def remove(self, heritage_id: int):
+        for term in self._record_terms.pop(heritage_id, set()):
+            ids = self._term_ids.get(term)
+            if ids is None:
+                continue
+            ids.discard(heritage_id)
+            if ids:
+                continue
+            del self._term_ids[term]
+            for variant in delete_variants(term, self.max_distance):
+                terms = self._variants.get(variant)
+                if terms is not None:
+                    terms.discard(term)
+                    if not terms:
+                        del self._variants[variant]
+
+    def _add(self, record: HeritageRecord):
+        terms = self._terms_of(record.name)
+        self._record_terms[record.id] = terms
+        for term in terms:
+            if term not in self._term_ids:
+                self._term_ids[term] = set()
+                for variant in delete_variants(term, self.max_distance):
+                    self._variants.setdefault(variant, set()).add(term)
+            self._term_ids[term].add(record.id)
+
+    # 단어 시작 위치별 이름과 두 글자 이상 단어를 자모로 분해한 검색 토큰
+    @staticmethod
+    def _terms_of(name: Optional[str]) -> Set[str]:
+        words = [normalize_name(word) for word in (name or "").split()]
+        return {decompose_jamo(text) for text in name_keys(name) + [word for word in words if len(word) >= 2]}
+
+    # 오타 보정 검색 (편집 거리, 길이 차이, ID 순으로 정렬된 문화재 ID 목록)
+    def search(self, query: str, limit: Optional[int] = None) -> List[int]:
+        query = decompose_jamo(normalize_name(query))
+        if not query:
+            return []
+        max_distance = allowed_distance(len(query), self.max_distance)
+
+        candidates = set()
+        for variant in delete_variants(query, max_distance):
+            candidates |= self._variants.get(variant, set())
+
+        best: Dict[int, Tuple[int, int]] = {}
+        for term in candidates:
+            distance = bounded_levenshtein(query, term, max_distance)
+            if distance > max_distance:
+                continue
+            score = (distance, abs(len(term) - len(query)))
+            for heritage_id in self._term_ids[term]:
+                if heritage_id not in best or score < best[heritage_id]:
+                    best[heritage_id] = score
+
+        ranked = sorted(best, key=lambda heritage_id: (best[heritage_id], heritage_id))
+        return ranked[:limit]
+
+
+fuzzy_index = FuzzyIndex(settings.FUZZY_MAX_EDIT_DISTANCE)
@@ -0,0 +1,387 @@
+import logging
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.index.catalog import HeritageRecord
+from app.models.enums import EraCategory, SortOrder
+from app.utils.common import parse_heritage_dist_range
+from app.utils.era import normalize_era
+from app.utils.geo import EARTH_RADIUS_KM, bounding_box, haversine_distances, stratified_sample
+
+logger = logging.getLogger(__name__)
+
+GridCell = Tuple[int, int]
+
+# 인덱스 배열 컬럼 (dtype, 기본값)
+_COLUMNS = {
+    "ids": (np.int64, 0),
+    "latitudes": (np.float64, 0.0),
+    "longitudes": (np.float64, 0.0),
+    "type_ids": (np.int64, -1),
+    "area_codes": (np.float64, np.nan),
+    "era_bits": (np.int32, 0),
+    "located": (bool, False),
+    "valid": (bool, False),
+}
+
+# 격자 후보 조회 시 확인할 최대 셀 수 (초과하면 전체 배열을 벡터 연산하는 편이 빠름)
+_MAX_GRID_CELLS = 64
+
+# 근사 거리로 후보를 추릴 때 경계에서 정확한 거리로 재검증할 여유 폭 (km, 반올림 단위 0.01 보다 충분히 큼)
+_DISTANCE_MARGIN_KM = 0.02
+
+# 시대 분류별 비트 (heritage_eras 와 동일한 정규화 결과를 비트마스크로 보관)
+_ERA_BITS = {category: 1 << bit for bit, category in enumerate(EraCategory)}
+
+
+class GeoIndex:
+    """
+    문화재 리스트 조회용 인메모리 지리 인덱스
+    - 위도/경도/ID/유형/지역코드/시대를 NumPy 배열로 보관
+    - 격자(grid) 셀 단위로 거리 범위 후보를 추린 뒤 하버사인 거리를 벡터 연산
+    - SQL 경로(HeritageRepository.search_heritages)와 동일한 필터/정렬/개수 결과 반환
+    """
+
+    def __init__(self, cell_size: float = 0.1):
+        self.cell_size = cell_size
+        self.is_ready = False
+        self._records: List[HeritageRecord] = []
+        self._positions: Dict[int, int] = {}
+        self._cells: Dict[GridCell, np.ndarray] = {}
+        self._cells_dirty = True
+        self._allocate(0)
+
+    def _allocate(self, size: int):
+        for column, (dtype, fill_value) in _COLUMNS.items():
+            setattr(self, column, np.full(size, fill_value, dtype=dtype))
+        # 위도/경도를 단위 구 위의 3차원 벡터로 변환해 보관 (근사 거리 계산용)
+        self.vectors = np.zeros((size, 3), dtype=np.float64)
+
+    # 카탈로그 전체 재적재
+    def rebuild(self, records: List[HeritageRecord]):
+        self._records = sorted(records, key=lambda record: record.id)
+        self._positions = {record.id: position for position, record in enumerate(self._records)}
+        self._allocate(len(self._records))
+        for position, record in enumerate(self._records):
+            self._write(position, record)
+        self._cells_dirty = True
+        self.is_ready = True
+        logger.info(f"지리 인덱스 구성 완료: {len(self._records)} 건")
+
+    # 문화재 추가/수정 반영
+    def upsert(self, record: HeritageRecord):
+        position = self._positions.get(record.id)
+        if position is None:
+            position = len(self._records)
+            self._records.append(record)
+            self._positions[record.id] = position
+            self._grow()
+        else:
+            self._records[position] = record
+        self._write(position, record)
+        self._cells_dirty = True
+
+    # 문화재 삭제 반영 (배열 위치는 유지하고 유효 플래그만 해제)
+    def remove(self, heritage_id: int):
+        position = self._positions.pop(heritage_id, None)
+        if position is None:
+            return
+        self.valid[position] = False
+        self._cells_dirty = True
+
+    def _grow(self):
+        for column, (_, fill_value) in _COLUMNS.items():
+            setattr(self, column, np.append(getattr(self, column), fill_value))
+        self.vectors = np.vstack([self.vectors, np.zeros((1, 3))])
+
+    def _write(self, position: int, record: HeritageRecord):
+        # 좌표가 없는 문화재는 SQL 과 동일하게 거리 NULL (located 해제, 격자 / 거리 범위 / 경계 상자에서 제외)
+        self.ids[position] = record.id
+        self.located[position] = record.latitude is not None and record.longitude is not None
+        self.latitudes[position] = record.latitude if self.located[position] else 0.0
+        self.longitudes[position] = record.longitude if self.located[position] else 0.0
+        self.vectors[position] = _unit_vector(self.latitudes[position], self.longitudes[position])
+        self.type_ids[position] = record.heritage_type_id if record.heritage_type_id is not None else -1
+        self.area_codes[position] = record.area_code if record.area_code is not None else np.nan
+        self.era_bits[position] = sum(_ERA_BITS[category] for category in normalize_era(record.era))
+        self.valid[position] = True
+
+    def _cell_of(self, latitude: float, longitude: float) -> GridCell:
+        return math.floor(latitude / self.cell_size), math.floor(longitude / self.cell_size)
+
+    def _build_cells(self):
+        lat_cells = np.floor(self.latitudes / self.cell_size).astype(np.int64)
+        lon_cells = np.floor(self.longitudes / self.cell_size).astype(np.int64)
+        buckets: Dict[GridCell, List[int]] = {}
+        for position in np.flatnonzero(self.valid & self.located):
+            buckets.setdefault((int(lat_cells[position]), int(lon_cells[position])), []).append(position)
+        self._cells = {cell: np.array(positions, dtype=np.int64) for cell, positions in buckets.items()}
+        self._cells_dirty = False
+
+    # 반경 경계 상자와 겹치는 격자 셀의 후보 위치 조회 (셀 수가 많으면 None 반환 후 전체 스캔)
+    def _bbox_candidates(self, latitude: float, longitude: float, radius_km: float) -> Optional[np.ndarray]:
+        return self._grid_candidates(*bounding_box(latitude, longitude, radius_km))
+
+    # 경계 상자와 겹치는 격자 셀의 후보 위치 조회 (셀 수가 많으면 None 반환 후 전체 스캔)
+    def _grid_candidates(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> Optional[np.ndarray]:
+        if self._cells_dirty:
+            self._build_cells()
+
+        min_cell = self._cell_of(min_lat, min_lon)
+        max_cell = self._cell_of(max_lat, max_lon)
+        cell_count = (max_cell[0] - min_cell[0] + 1) * (max_cell[1] - min_cell[1] + 1)
+        if cell_count > min(len(self._cells), _MAX_GRID_CELLS):
+            return None
+
+        positions = [
+            self._cells[(lat_cell, lon_cell)]
+            for lat_cell in range(min_cell[0], max_cell[0] + 1)
+            for lon_cell in range(min_cell[1], max_cell[1] + 1)
+            if (lat_cell, lon_cell) in self._cells
+        ]
+        if not positions:
+            return np.zeros(0, dtype=np.int64)
+        return np.sort(np.concatenate(positions))
+
+    def _filter_mask(
+        self,
+        area_code: Optional[int],
+        heritage_type: Optional[List[int]],
+        era_category: Optional[EraCategory],
+    ) -> np.ndarray:
+        mask = self.valid.copy()
+        if area_code is not None:
+            mask &= self.area_codes == area_code
+        if heritage_type is not None:
+            mask &= np.isin(self.type_ids, heritage_type)
+        if era_category and era_category != EraCategory.ALL:
+            mask &= (self.era_bits & _ERA_BITS[era_category]) != 0
+        return mask
+
+    # 정렬 키 기준 상위 k 개 위치 선택 (동일 값은 ID 오름차순)
+    def _top_k(self, positions: np.ndarray, keys: np.ndarray, k: int) -> np.ndarray:
+        if k < len(positions):
+            kth = np.partition(keys, k - 1)[k - 1]
+            selected = np.flatnonzero(keys <= kth)
+            positions, keys = positions[selected], keys[selected]
+        order = np.lexsort((self.ids[positions], keys))
+        return positions[order][:k]
+
+    # 문화재 리스트 검색 (SQL 경로와 동일한 인자/결과 형식)
+    def search(
+        self,
+        limit: int,
+        offset: int,
+        user_latitude: float,
+        user_longitude: float,
+        area_code: Optional[int] = None,
+        heritage_type: Optional[List[int]] = None,
+        distance_range: Optional[str] = None,
+        era_category: Optional[EraCategory] = None,
+        sort_by: str = "id",
+        sort_order: SortOrder = SortOrder.ASC,
+        cursor: Optional[Tuple] = None,
+        heritage_ids: Optional[List[int]] = None,
+    ) -> Tuple[List[Tuple[HeritageRecord, float]], int]:
+        mask = self._filter_mask(area_code, heritage_type, era_category)
+
+        # 이름 색인 검색 결과로 제한 (순위는 검색 결과 순서, 1부터 시작)
+        ranks = None
+        if heritage_ids is not None:
+            ranks = np.zeros(len(self.ids), dtype=np.int64)
+            for rank, heritage_id in enumerate(heritage_ids, start=1):
+                position = self._positions.get(heritage_id)
+                if position is not None:
+                    ranks[position] = rank
+            mask &= ranks > 0
+
+        positions = None
+        if distance_range:
+            min_dist, max_dist = parse_heritage_dist_range(distance_range)
+            if max_dist != float("inf"):
+                candidates = self._bbox_candidates(user_latitude, user_longitude, max_dist)
+                if candidates is not None:
+                    positions = candidates[mask[candidates]]
+            if positions is None:
+                positions = np.flatnonzero(mask)
+            positions = self._filter_distance(user_latitude, user_longitude, positions, min_dist, max_dist)
+        else:
+            positions = np.flatnonzero(mask)
+        # 전체 개수는 거리 범위까지 적용한 뒤, 커서 적용 전 기준
+        total_count = len(positions)
+
+        k = offset + limit
+        if sort_by == "relevance" and ranks is not None:
+            keys = ranks[positions] if sort_order == SortOrder.ASC else -ranks[positions]
+            if cursor:
+                after = keys > (cursor[0] if sort_order == SortOrder.ASC else -cursor[0])
+                positions, keys = positions[after], keys[after]
+            page = self._top_k(positions, keys, k)[offset:]
+        else:
+            if cursor:
+                positions = self._after_cursor(user_latitude, user_longitude, positions, sort_by, sort_order, cursor)
+            if sort_by == "distance":
+                page = self._top_k_by_distance(user_latitude, user_longitude, positions, k, sort_order)[offset:]
+            else:
+                ids = self.ids[positions]
+                page = self._top_k(positions, ids if sort_order == SortOrder.ASC else -ids, k)[offset:]
+
+        page_distances = self._distances(user_latitude, user_longitude, page)
+        return [
+            (self._records[position], None if np.isnan(distance) else float(distance))
+            for position, distance in zip(page, page_distances, strict=True)
+        ], total_count
+
+    # 경계 상자 안 문화재 조회 (limit 건 초과 시 격자 셀별 고른 표본, 전체 개수 함께 반환)
+    def search_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: int,
+        area_code: Optional[int] = None,
+        heritage_type: Optional[List[int]] = None,
+        era_category: Optional[EraCategory] = None,
+        grid_size: int = 8,
+    ) -> Tuple[List[HeritageRecord], int]:
+        mask = self._filter_mask(area_code, heritage_type, era_category) & self.located
+        candidates = self._grid_candidates(min_lat, min_lon, max_lat, max_lon)
+        positions = candidates[mask[candidates]] if candidates is not None else np.flatnonzero(mask)
+
+        latitudes, longitudes = self.latitudes[positions], self.longitudes[positions]
+        inside = (latitudes >= min_lat) & (latitudes <= max_lat) & (longitudes >= min_lon) & (longitudes <= max_lon)
+        positions = positions[inside]
+
+        span = max(max_lat - min_lat, max_lon - min_lon)
+        selected = stratified_sample(
+            self.ids[positions], self.latitudes[positions], self.longitudes[positions], span, grid_size, limit
+        )
+        return [self._records[position] for position in positions[selected]], len(positions)
+
+    # 거리 범위 필터 (근사 값이 경계 부근인 후보만 정확한 거리로 재검증)
+    def _filter_distance(
+        self, latitude: float, longitude: float, positions: np.ndarray, min_dist: float, max_dist: float
+    ) -> np.ndarray:
+        terms = self._haversine_terms(latitude, longitude, positions)
+        outer = (terms >= _haversine_term(min_dist - _DISTANCE_MARGIN_KM)) & (
+            terms < _haversine_term(max_dist + _DISTANCE_MARGIN_KM)
+        )
+        inner = (terms >= _haversine_term(min_dist + _DISTANCE_MARGIN_KM)) & (
+            terms < _haversine_term(max_dist - _DISTANCE_MARGIN_KM)
+        )
+        border = np.flatnonzero(outer & ~inner)
+        if len(border):
+            distances = self._distances(latitude, longitude, positions[border])
+            outer[border] = (distances >= min_dist) & (distances < max_dist)
+        return positions[outer]
+
+    # 커서(마지막 행의 정렬 키)보다 뒤에 오는 위치만 선택 (거리 기준은 경계 부근만 정확한 거리로 재검증)
+    def _after_cursor(
+        self,
+        latitude: float,
+        longitude: float,
+        positions: np.ndarray,
+        sort_by: str,
+        sort_order: SortOrder,
+        cursor: Tuple,
+    ) -> np.ndarray:
+        ascending = sort_order == SortOrder.ASC
+        if sort_by != "distance":
+            (last_id,) = cursor
+            ids = self.ids[positions]
+            return positions[ids > last_id if ascending else ids < last_id]
+
+        # 거리 NULL 행은 오름차순에서 맨 앞, 내림차순에서 맨 뒤 (같은 거리는 ID 오름차순)
+        last_distance, last_id = cursor
+        nulls = ~self.located[positions]
+        if last_distance is None:
+            after_nulls = nulls & (self.ids[positions] > last_id)
+            return positions[after_nulls | ~nulls] if ascending else positions[after_nulls]
+
+        terms = self._haversine_terms(latitude, longitude, positions)
+        if ascending:
+            outer = terms >= _haversine_term(last_distance - _DISTANCE_MARGIN_KM)
+            inner = terms > _haversine_term(last_distance + _DISTANCE_MARGIN_KM)
+        else:
+            outer = terms <= _haversine_term(last_distance + _DISTANCE_MARGIN_KM)
+            inner = terms < _haversine_term(last_distance - _DISTANCE_MARGIN_KM)
+        border = np.flatnonzero(outer & ~inner)
+        if len(border):
+            distances = self._distances(latitude, longitude, positions[border])
+            beyond = distances > last_distance if ascending else distances < last_distance
+            outer[border] = beyond | ((distances == last_distance) & (self.ids[positions[border]] > last_id))
+        return positions[outer if ascending else outer | nulls]
+
+    # 거리순 상위 k 개 선택 (거리 NULL 행은 오름차순에서 맨 앞, 내림차순에서 맨 뒤에 ID 순으로 배치)
+    def _top_k_by_distance(
+        self, latitude: float, longitude: float, positions: np.ndarray, k: int, sort_order: SortOrder
+    ) -> np.ndarray:
+        located = self.located[positions]
+        nulls = positions[~located]
+        nulls = nulls[np.argsort(self.ids[nulls], kind="stable")]
+        if sort_order == SortOrder.ASC:
+            head = nulls[:k]
+            return np.concatenate(
+                [head, self._top_k_located(latitude, longitude, positions[located], k - len(head), True)]
+            )
+        page = self._top_k_located(latitude, longitude, positions[located], k, False)
+        return np.concatenate([page, nulls[: k - len(page)]])
+
+    # 좌표가 있는 위치의 거리순 상위 k 개 (근사 값으로 후보를 줄인 뒤 정확한 거리, ID 순으로 정렬)
+    def _top_k_located(
+        self, latitude: float, longitude: float, positions: np.ndarray, k: int, ascending: bool
+    ) -> np.ndarray:
+        if k <= 0:
+            return positions[:0]
+        if k < len(positions):
+            terms = self._haversine_terms(latitude, longitude, positions)
+            keys = terms if ascending else -terms
+            kth_position = positions[np.argpartition(keys, k - 1)[k - 1]]
+            kth_distance = self._distances(latitude, longitude, np.array([kth_position]))[0]
+            if ascending:
+                selected = terms <= _haversine_term(kth_distance + _DISTANCE_MARGIN_KM)
+            else:
+                selected = terms >= _haversine_term(kth_distance - _DISTANCE_MARGIN_KM)
+            positions = positions[selected]
+
+        distances = self._distances(latitude, longitude, positions)
+        return self._top_k(positions, distances if ascending else -distances, k)
+
+    # 하버사인 중간 값 a = sin²(d / 2R) 근사 계산 (단위 벡터 내적 a = (1 - u·v) / 2, 거리와 단조 관계)
+    # - 좌표가 없으면 NaN (거리 범위 / 커서 비교에서 항상 제외)
+    def _haversine_terms(self, latitude: float, longitude: float, positions: np.ndarray) -> np.ndarray:
+        terms = (1 - (self.vectors @ _unit_vector(latitude, longitude))[positions]) / 2
+        return np.where(self.located[positions], terms, np.nan)
+
+    # SQL 과 동일하게 소수점 둘째 자리까지 반올림한 거리(km, 좌표가 없으면 NaN)
+    def _distances(self, latitude: float, longitude: float, positions: np.ndarray) -> np.ndarray:
+        distances = haversine_distances(latitude, longitude, self.latitudes[positions], self.longitudes[positions])
+        return np.where(self.located[positions], np.round(distances, 2), np.nan)
+
+
+# 위도/경도를 단위 구 위의 3차원 벡터로 변환
+def _unit_vector(latitude: float, longitude: float) -> np.ndarray:
+    lat_radians, lon_radians = math.radians(latitude), math.radians(longitude)
+    return np.array(
+        [
+            math.sin(lat_radians),
+            math.cos(lat_radians) * math.cos(lon_radians),
+            math.cos(lat_radians) * math.sin(lon_radians),
+        ]
+    )
+
+
+# 거리(km)에 해당하는 하버사인 중간 값 (범위를 벗어나면 양 끝 값으로 고정)
+def _haversine_term(distance_km: float) -> float:
+    if distance_km <= 0:
+        return -np.inf
+    if distance_km == float("inf"):
+        return np.inf
+    return math.sin(min(distance_km / (2 * EARTH_RADIUS_KM), math.pi / 2)) ** 2
+
+
+geo_index = GeoIndex(settings.GEO_INDEX_CELL_SIZE)
@@ -0,0 +1,187 @@
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.models.heritage.heritage_building import HeritageBuilding
+from app.models.heritage.heritage_type import HeritageType
+from app.utils.cache import TTLCache
+from app.utils.geo import EARTH_RADIUS_KM
+
+EARTH_RADIUS_M = EARTH_RADIUS_KM * 1000
+
+# 궤적 판별 시 한 번에 계산할 GPS 좌표 수
+_TRAIL_CHUNK_SIZE = 4096
+
+
+# 위치 판별 결과 (building_id 가 None 이면 등록된 건축물 없음)
+@dataclass(slots=True)
+class LocateResult:
+    building_id: Optional[int]
+    name: Optional[str]
+    distance: Optional[float]
+    inside: bool
+
+
+@dataclass(slots=True)
+class HeritageGeofence:
+    """
+    문화재 한 곳의 건축물 지오펜스 (건축물 위치 + 유효 반경, 단위 m)
+    - 유효 반경 = 건축물 custom_radius > 건축물 유형 default_radius > 설정 기본값
+    - 위도 기준 평면 근사로 거리 계산 (문화재 경내 수백 m 범위에서 오차 무시 가능)
+    - 건축물 간 거리 행렬과 방문 순서 계획은 처음 필요할 때 계산해 색인과 함께 보관 (색인 제거 시 함께 제거)
+    """
+
+    ids: np.ndarray
+    names: List[str]
+    latitudes: np.ndarray
+    longitudes: np.ndarray
+    radii: np.ndarray
+    positions: Dict[int, int] = field(init=False)
+    route_plans: TTLCache = field(init=False)
+    _distance_matrix: Optional[np.ndarray] = field(init=False, default=None)
+
+    def __post_init__(self):
+        self.positions = {int(building_id): position for position, building_id in enumerate(self.ids)}
+        self.route_plans = TTLCache(settings.ROUTE_PLAN_CACHE_MAX_ENTRIES, settings.GEOFENCE_INDEX_TTL_SECONDS)
+
+    @classmethod
+    def from_rows(cls, rows) -> "HeritageGeofence":
+        # 좌표가 없는 건축물은 판별 대상에서 제외
+        rows = [row for row in rows if row.latitude is not None and row.longitude is not None]
+        return cls(
+            ids=np.array([row.id for row in rows], dtype=np.int64),
+            names=[row.name for row in rows],
+            latitudes=np.array([float(row.latitude) for row in rows], dtype=np.float64),
+            longitudes=np.array([float(row.longitude) for row in rows], dtype=np.float64),
+            radii=np.array(
+                [row.custom_radius or row.default_radius or settings.GEOFENCE_DEFAULT_RADIUS_METERS for row in rows],
+                dtype=np.float64,
+            ),
+        )
+
+    # 좌표(또는 (N, 1) 좌표 배열)에서 각 건축물까지의 거리 (m)
+    def distances(self, latitude, longitude) -> np.ndarray:
+        meters_per_degree = math.radians(1) * EARTH_RADIUS_M
+        delta_lat = (self.latitudes - latitude) * meters_per_degree
+        delta_lon = (self.longitudes - longitude) * meters_per_degree * np.cos(np.radians(latitude))
+        return np.hypot(delta_lat, delta_lon)
+
+    # 건축물 간 거리 행렬 (m, 처음 호출 시 한 번 계산)
+    def distance_matrix(self) -> np.ndarray:
+        if self._distance_matrix is None:
+            self._distance_matrix = self.distances(self.latitudes[:, None], self.longitudes[:, None])
+        return self._distance_matrix
+
+    # 현재 위치가 속한 건축물 (여러 곳이면 가장 가까운 곳, 없으면 가장 가까운 건축물)
+    # - current_building_id 의 반경 x 이탈 비율 안에 있으면 다른 건축물로 바꾸지 않음 (GPS 흔들림 히스테리시스)
+    def locate(self, latitude: float, longitude: float, current_building_id: Optional[int] = None) -> LocateResult:
+        if not len(self.ids):
+            return LocateResult(None, None, None, False)
+
+        distances = self.distances(latitude, longitude)
+        if current_building_id is not None:
+            positions = np.flatnonzero(self.ids == current_building_id)
+            if len(positions):
+                position = positions[0]
+                if distances[position] <= self.radii[position] * settings.GEOFENCE_EXIT_RADIUS_RATIO:
+                    return self._result(position, distances, inside=True)
+
+        inside = distances <= self.radii
+        if inside.any():
+            position = np.flatnonzero(inside)[np.argmin(distances[inside])]
+            return self._result(position, distances, inside=True)
+        return self._result(int(np.argmin(distances)), distances, inside=False)
+
+    # 시간순 GPS 궤적이 반경 안에 min_fixes 번 이상 들어간 건축물을 처음 진입한 순서대로 반환 (색인 위치 배열)
+    # - 궤적을 일정 개수씩 나눠 (궤적 x 건축물) 거리 행렬로 한 번에 판별해 메모리 사용량 제한
+    def visit_order(self, latitudes: np.ndarray, longitudes: np.ndarray, min_fixes: int = 1) -> np.ndarray:
+        fix_count = len(latitudes)
+        if not len(self.ids) or not fix_count:
+            return np.array([], dtype=np.int64)
+
+        first_entry = np.full(len(self.ids), fix_count, dtype=np.int64)
+        inside_counts = np.zeros(len(self.ids), dtype=np.int64)
+        for start in range(0, fix_count, _TRAIL_CHUNK_SIZE):
+            end = start + _TRAIL_CHUNK_SIZE
+            inside = self.distances(latitudes[start:end, None], longitudes[start:end, None]) <= self.radii
+            inside_counts += inside.sum(axis=0)
+            chunk_entry = np.where(inside.any(axis=0), inside.argmax(axis=0) + start, fix_count)
+            np.minimum(first_entry, chunk_entry, out=first_entry)
+
+        visited = np.flatnonzero(inside_counts >= min_fixes)
+        return visited[np.argsort(first_entry[visited], kind="stable")]
+
+    def _result(self, position: int, distances: np.ndarray, inside: bool) -> LocateResult:
+        return LocateResult(int(self.ids[position]), self.names[position], round(float(distances[position]), 1), inside)
+
+
+class GeofenceIndex:
+    """
+    문화재별 건축물 지오펜스 인메모리 색인
+    - 문화재별로 처음 요청될 때 한 번 적재하고, 이후 위치 판별은 DB 조회 없이 처리
+    - 건축물 / 건축물 유형 변경이 커밋되면 해당 문화재(유형 변경 시 전체) 색인 제거
+    """
+
+    def __init__(self, max_heritages: int):
+        self._fences = TTLCache(max_heritages, settings.GEOFENCE_INDEX_TTL_SECONDS)
+
+    def get(self, heritage_id: int) -> Optional[HeritageGeofence]:
+        return self._fences.get(heritage_id)
+
+    def set(self, heritage_id: int, fence: HeritageGeofence):
+        self._fences.set(heritage_id, fence)
+
+    def invalidate(self, heritage_id: int):
+        self._fences.pop(heritage_id)
+
+    def clear(self):
+        self._fences.clear()
+
+
+geofence_index = GeofenceIndex(settings.GEOFENCE_INDEX_MAX_HERITAGES)
+
+
+def _record_geofence_change(target, heritage_ids: Tuple[Optional[int], ...]):
+    session = object_session(target)
+    if session is None:
+        return
+    if any(heritage_id is None for heritage_id in heritage_ids):
+        session.info["geofence_invalidate_all"] = True
+        return
+    session.info.setdefault("geofence_invalidations", set()).update(heritage_ids)
+
+
+@event.listens_for(HeritageBuilding, "after_insert")
+@event.listens_for(HeritageBuilding, "after_update")
+@event.listens_for(HeritageBuilding, "after_delete")
+def _on_building_changed(mapper, connection, target):
+    history = inspect(target).attrs.heritage_id.history
+    _record_geofence_change(target, (target.heritage_id, *history.deleted))
+
+
+# 유형 기본 반경은 여러 문화재 건축물에 적용되므로 변경 시 전체 제거
+@event.listens_for(HeritageType, "after_update")
+@event.listens_for(HeritageType, "after_delete")
+def _on_building_type_changed(mapper, connection, target):
+    _record_geofence_change(target, (None,))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_geofences(session):
+    heritage_ids = session.info.pop("geofence_invalidations", set())
+    if session.info.pop("geofence_invalidate_all", False):
+        geofence_index.clear()
+        return
+    for heritage_id in heritage_ids:
+        geofence_index.invalidate(heritage_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_geofence_invalidations(session):
+    session.info.pop("geofence_invalidations", None)
+    session.info.pop("geofence_invalidate_all", None)
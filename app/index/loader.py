@@ -0,0 +1,39 @@
+import logging
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.index.autocomplete_index import autocomplete_index
+from app.index.catalog import heritage_catalog
+from app.index.cluster_index import cluster_index
+from app.index.fuzzy_index import fuzzy_index
+from app.index.geo_index import geo_index
+from app.index.name_index import name_index
+from app.repository.heritage_repository import HeritageRepository
+
+logger = logging.getLogger(__name__)
+
+
+# 설정에서 활성화된 인메모리 인덱스를 카탈로그에 등록하고 문화재 목록 적재
+async def load_heritage_indexes():
+    if settings.GEO_INDEX_ENABLED:
+        heritage_catalog.subscribe(geo_index)
+    if settings.NAME_INDEX_ENABLED:
+        heritage_catalog.subscribe(name_index)
+    if settings.FUZZY_INDEX_ENABLED:
+        heritage_catalog.subscribe(fuzzy_index)
+    if settings.AUTOCOMPLETE_INDEX_ENABLED:
+        heritage_catalog.subscribe(autocomplete_index)
+    if settings.CLUSTER_INDEX_ENABLED:
+        heritage_catalog.subscribe(cluster_index)
+
+    if not heritage_catalog.has_listeners:
+        return
+
+    # 적재 실패 시 인덱스는 준비되지 않은 상태로 남고 SQL 조회로 대체
+    try:
+        async with AsyncSessionLocal() as db:
+            await heritage_catalog.load(db)
+            if settings.AUTOCOMPLETE_INDEX_ENABLED:
+                autocomplete_index.set_popularity(await HeritageRepository(db).get_chat_session_counts())
+    except Exception as e:
+        logger.error(f"문화재 카탈로그 적재 중 오류 발생: {str(e)}", exc_info=True)
@@ -0,0 +1,118 @@
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.index.catalog import HeritageRecord
+
+logger = logging.getLogger(__name__)
+
+# 일치 품질 (값이 작을수록 상위)
+EXACT_MATCH, PREFIX_MATCH, SUBSTRING_MATCH, HANJA_MATCH = range(4)
+
+
+# 검색용 문자열 정규화 (공백 제거, 대소문자 무시)
+def normalize_name(text: Optional[str]) -> str:
+    return "".join((text or "").split()).casefold()
+
+
+# 이름의 단어 시작 위치마다 이후 문자열을 검색 키로 사용 ("서울 경복궁" -> "서울경복궁", "경복궁")
+def name_keys(name: Optional[str]) -> List[str]:
+    words = (name or "").split()
+    return list(dict.fromkeys(normalize_name("".join(words[i:])) for i in range(len(words))))
+
+
+# 문자열의 n-gram 집합 (1글자는 그대로, 그 이상은 bigram)
+def ngrams(text: str) -> Set[str]:
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+class NameIndex:
+    """
+    문화재 이름 bigram 역색인
+    - name, name_hanja 의 글자/bigram 별 문화재 ID 목록 보관
+    - 검색어 bigram 목록을 교집합으로 후보를 추린 뒤 부분 문자열 여부 재검증
+    - 일치 품질(완전 일치 > 접두 일치 > 부분 일치 > 한자 일치), 일치 위치, 이름 길이 순으로 정렬
+    """
+
+    def __init__(self):
+        self.is_ready = False
+        self._texts: Dict[int, Tuple[str, str]] = {}
+        self._postings: Dict[str, Set[int]] = {}
+
+    # 카탈로그 전체 재적재
+    def rebuild(self, records: List[HeritageRecord]):
+        self._texts = {}
+        self._postings = {}
+        for record in records:
+            self._add(record)
+        self.is_ready = True
+        logger.info(f"이름 색인 구성 완료: {len(self._texts)} 건, n-gram {len(self._postings)} 개")
+
+    # 문화재 추가/수정 반영
+    def upsert(self, record: HeritageRecord):
+        self.remove(record.id)
+        self._add(record)
+
+    # 문화재 삭제 반영
+    def remove(self, heritage_id: int):
+        texts = self._texts.pop(heritage_id, None)
+        if texts is None:
+            return
+        for gram in self._grams_of(texts):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(heritage_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def _add(self, record: HeritageRecord):
+        texts = (normalize_name(record.name), normalize_name(record.name_hanja))
+        self._texts[record.id] = texts
+        for gram in self._grams_of(texts):
+            self._postings.setdefault(gram, set()).add(record.id)
+
+    @staticmethod
+    def _grams_of(texts: Tuple[str, str]) -> Set[str]:
+        # 1글자 검색어도 색인으로 찾을 수 있도록 bigram 과 함께 글자 단위도 등록
+        grams = set()
+        for text in texts:
+            grams |= ngrams(text) | set(text)
+        return grams
+
+    # 이름 검색 (일치 품질 순으로 정렬된 문화재 ID 목록)
+    def search(self, query: str, limit: Optional[int] = None) -> List[int]:
+        query = normalize_name(query)
+        if not query:
+            return []
+
+        postings = sorted((self._postings.get(gram, set()) for gram in ngrams(query)), key=len)
+        if not postings or not postings[0]:
+            return []
+        candidates = set(postings[0]).intersection(*postings[1:])
+
+        scored = []
+        for heritage_id in candidates:
+            score = self._score(heritage_id, query)
+            if score is not None:
+                scored.append(score)
+        scored.sort()
+        return [score[-1] for score in scored[:limit]]
+
+    # (일치 품질, 일치 위치, 이름 길이, ID) 반환, 부분 문자열이 아니면 None
+    def _score(self, heritage_id: int, query: str) -> Optional[Tuple[int, int, int, int]]:
+        name, name_hanja = self._texts[heritage_id]
+        position = name.find(query)
+        if position == 0:
+            quality = EXACT_MATCH if len(name) == len(query) else PREFIX_MATCH
+            return quality, 0, len(name), heritage_id
+        if position > 0:
+            return SUBSTRING_MATCH, position, len(name), heritage_id
+
+        position = name_hanja.find(query)
+        if position >= 0:
+            return HANJA_MATCH, position, len(name), heritage_id
+        return None
+
+
+name_index = NameIndex()
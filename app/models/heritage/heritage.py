@@ -1,8 +1,26 @@
-from sqlalchemy import DECIMAL, Column, DateTime, Float, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    DECIMAL,
+    Column,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    inspect,
+)
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
+from app.models.enums import EraCategory
+from app.models.heritage.heritage_era import HeritageEra
+from app.models.types import Point
+from app.utils.common import parse_location_for_detail, parse_location_for_list
+from app.utils.era import normalize_era
 
 
 class Heritage(Base):
@@ -13,13 +31,20 @@ class Heritage(Base):
     name_hanja = Column(String(100))
     description = Column(Text)
     location = Column(String(255))
+    # location 으로부터 자동 계산되는 표시용 주소 (리스트 / 상세)
+    location_list = Column(String(255))
+    location_detail = Column(String(255))
     latitude = Column(DECIMAL(10, 8))
     longitude = Column(DECIMAL(11, 8))
+    # 위도/경도로부터 자동 동기화되는 공간 인덱스용 좌표 (거리 검색 전용, 기본 조회에서 제외)
+    location_point = deferred(Column(Point(srid=4326), nullable=False))
     category = Column(String(50))
     sub_category1 = Column(String(50))
     sub_category2 = Column(String(50))
     sub_category3 = Column(String(50))
     era = Column(String(255))
+    # era 로부터 자동 정규화되는 대표 시대 분류 (복수 시대 포함 전체 분류는 heritage_eras 에 저장)
+    era_category = Column(Enum(EraCategory), index=True)
     area_code = Column(Float)
     image_url = Column(String(255))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -31,3 +56,58 @@ class Heritage(Base):
     routes = relationship("HeritageRoute", back_populates="heritages")
     bookmarks = relationship("UserBookmark", back_populates="heritages")
     building_images = relationship("HeritageBuildingImage", back_populates="heritages")
+
+    __table_args__ = (Index("ix_heritages_location_point", "location_point", mysql_prefix="SPATIAL"),)
+
+
+# 위도/경도 변경 시 location_point 동기화 (좌표가 없는 경우 POINT(0 0) 저장)
+@event.listens_for(Heritage, "before_insert")
+@event.listens_for(Heritage, "before_update")
+def sync_location_point(mapper, connection, target):
+    state = inspect(target)
+    coordinates_changed = state.attrs.latitude.history.has_changes() or state.attrs.longitude.history.has_changes()
+    if state.persistent and not coordinates_changed:
+        return
+
+    target.location_point = (target.longitude or 0, target.latitude or 0)
+
+
+# location 변경 시 표시용 주소 동기화 (요청마다 정규식 파싱하지 않도록 저장 시 한 번 계산)
+@event.listens_for(Heritage, "before_insert")
+@event.listens_for(Heritage, "before_update")
+def sync_display_location(mapper, connection, target):
+    state = inspect(target)
+    if state.persistent and not state.attrs.location.history.has_changes():
+        return
+
+    target.location_list = parse_location_for_list(target.location)
+    target.location_detail = parse_location_for_detail(target.location)
+
+
+# era 변경 시 대표 시대 분류 동기화
+@event.listens_for(Heritage, "before_insert")
+@event.listens_for(Heritage, "before_update")
+def sync_era_category(mapper, connection, target):
+    state = inspect(target)
+    if state.persistent and not state.attrs.era.history.has_changes():
+        return
+
+    categories = normalize_era(target.era)
+    target.era_category = categories[0] if categories else None
+
+
+# era 변경 시 heritage_eras 시대 분류 목록 동기화 (검색 필터용)
+@event.listens_for(Heritage, "after_insert")
+@event.listens_for(Heritage, "after_update")
+def sync_heritage_eras(mapper, connection, target):
+    state = inspect(target)
+    if state.persistent and not state.attrs.era.history.has_changes():
+        return
+
+    table = HeritageEra.__table__
+    connection.execute(table.delete().where(table.c.heritage_id == target.id))
+    categories = normalize_era(target.era)
+    if categories:
+        connection.execute(
+            table.insert(), [{"heritage_id": target.id, "era_category": category} for category in categories]
+        )
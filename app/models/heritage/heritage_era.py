@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Enum, ForeignKey, Index, Integer
+
+from app.core.database import Base
+from app.models.enums import EraCategory
+
+
+class HeritageEra(Base):
+    __tablename__ = "heritage_eras"
+    heritage_id = Column(Integer, ForeignKey("heritages.id", ondelete="CASCADE"), primary_key=True)
+    era_category = Column(Enum(EraCategory), primary_key=True)
+
+    __table_args__ = (Index("ix_heritage_eras_era_category_heritage_id", "era_category", "heritage_id"),)
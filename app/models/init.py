@@ -3,6 +3,7 @@ from .chat.chat_session import ChatSession
 from .heritage.heritage import Heritage
 from .heritage.heritage_building import HeritageBuilding
 from .heritage.heritage_building_image import HeritageBuildingImage
+from .heritage.heritage_era import HeritageEra
 from .heritage.heritage_route import HeritageRoute
 from .heritage.heritage_route_building import HeritageRouteBuilding
 from .heritage.heritage_type import HeritageType
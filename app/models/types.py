@@ -0,0 +1,42 @@
+import re
+
+from sqlalchemy import func
+from sqlalchemy.types import UserDefinedType
+
+_POINT_WKT = re.compile(r"POINT\(\s*(\S+)\s+(\S+)\s*\)")
+
+
+class Point(UserDefinedType):
+    """MySQL POINT 공간 타입 (파이썬 값: (경도, 위도) 튜플)"""
+
+    cache_ok = True
+
+    def __init__(self, srid: int = 4326):
+        self.srid = srid
+
+    def get_col_spec(self, **kw):
+        return f"POINT SRID {self.srid}"
+
+    def bind_expression(self, bindvalue):
+        return func.ST_GeomFromText(bindvalue, self.srid, "axis-order=long-lat")
+
+    def column_expression(self, col):
+        return func.ST_AsText(col, "axis-order=long-lat")
+
+    def bind_processor(self, dialect):
+        def process(value):
+            if value is None:
+                return None
+            longitude, latitude = value
+            return f"POINT({float(longitude)} {float(latitude)})"
+
+        return process
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            if value is None:
+                return None
+            match = _POINT_WKT.match(value)
+            return (float(match.group(1)), float(match.group(2))) if match else None
+
+        return process
@@ -5,13 +5,12 @@ from typing import List, Optional
 from fastapi import logger
 from sqlalchemy import delete, desc, update, values
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import joinedload, sessionmaker
+from sqlalchemy.orm import joinedload
 from sqlalchemy.sql import func
 
-from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 from app.error.auth_exception import DatabaseOperationException, UserNotFoundException
 from app.error.chat_exception import ChatServiceException, SessionNotFoundException
 from app.error.heritage_exceptions import HeritageNotFoundException
@@ -25,10 +24,6 @@ from app.schemas.chat import VisitedBuilding
 
 logger = logging.getLogger(__name__)
 
-# Create a new async engine and session factory
-engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI), echo=True)
-SessionLocal = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
-
 
 class ChatRepository:
 
@@ -233,7 +228,8 @@ class ChatRepository:
 
     # 추천 질문 저장
     async def save_recommended_questions(self, session_id: int, questions: List[str]):
-        async with SessionLocal() as session:
+        # 요청 세션과 분리된 트랜잭션으로 저장 (공유 커넥션 풀 사용)
+        async with AsyncSessionLocal() as session:
             async with session.begin():
                 try:
                     # 기존 추천 질문이 있다면 삭제
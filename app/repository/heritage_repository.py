@@ -2,22 +2,27 @@ import json
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import Float, and_, asc, desc, func, join, tuple_, update, values
+from sqlalchemy import Float, and_, asc, case, desc, func, join, null, or_, tuple_, update, values
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import aliased, joinedload
 
+from app.core.database import read_only
 from app.models.chat.chat_session import ChatSession
 from app.models.enums import EraCategory, SortOrder
 from app.models.heritage.heritage import Heritage
 from app.models.heritage.heritage_building import HeritageBuilding
 from app.models.heritage.heritage_building_image import HeritageBuildingImage
+from app.models.heritage.heritage_era import HeritageEra
 from app.models.heritage.heritage_route import HeritageRoute
 from app.models.heritage.heritage_route_building import HeritageRouteBuilding
+from app.models.heritage.heritage_type import HeritageType
 from app.models.quiz import Quiz
 from app.schemas.heritage import HeritageBuildingInfo, HeritageRouteInfo
 from app.utils.common import parse_heritage_dist_range
+from app.utils.geo import bounding_box, bounding_box_expr, point_expr
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +33,7 @@ class HeritageRepository:
         self.db = db
 
     # 문화재 ID에 해당하는 문화재 조회
+    @read_only
     async def get_heritage_by_id(self, heritage_id: int) -> Heritage:
         result = await self.db.execute(
             select(Heritage).options(joinedload(Heritage.heritage_types)).where(Heritage.id == heritage_id)
@@ -68,6 +74,7 @@ class HeritageRepository:
         return result.scalars().first()
 
     # 문화재 건축물 이미지 조회
+    @read_only
     async def get_heritage_building_images(self, building_id: int) -> List[HeritageBuildingImage]:
         result = await self.db.execute(
             select(HeritageBuildingImage)
@@ -78,33 +85,61 @@ class HeritageRepository:
         return result.scalars().all()
 
     # 문화재 건축물 코스 조회
+    @read_only
     async def get_routes_with_buildings_by_heritages_id(self, heritage_id: int) -> List[HeritageRouteInfo]:
+        routes = await self.get_routes_with_buildings_by_heritage_ids([heritage_id])
+        return routes.get(heritage_id, [])
+
+    # 여러 문화재의 건축물 코스 일괄 조회 (문화재 ID -> 코스 목록, 코스가 없는 문화재는 제외)
+    @read_only
+    async def get_routes_with_buildings_by_heritage_ids(
+        self, heritage_ids: List[int]
+    ) -> Dict[int, List[HeritageRouteInfo]]:
         result = await self.db.execute(
             select(HeritageRoute)
             .options(joinedload(HeritageRoute.route_buildings).joinedload(HeritageRouteBuilding.buildings))
-            .where(HeritageRoute.heritage_id == heritage_id)
+            .where(HeritageRoute.heritage_id.in_(heritage_ids))
+            .order_by(HeritageRoute.id)
         )
 
-        routes = result.unique().scalars().all()
+        routes: Dict[int, List[HeritageRouteInfo]] = {}
+        for route in result.unique().scalars().all():
+            routes.setdefault(route.heritage_id, []).append(
+                HeritageRouteInfo(
+                    route_id=route.id,
+                    name=route.name,
+                    buildings=[
+                        HeritageBuildingInfo(
+                            building_id=rb.buildings.id,
+                            name=rb.buildings.name,
+                            coordinate=(
+                                rb.buildings.longitude,
+                                rb.buildings.latitude,
+                            ),
+                        )
+                        for rb in sorted(route.route_buildings, key=lambda x: x.visit_order)
+                    ],
+                )
+            )
+        return routes
 
-        return [
-            HeritageRouteInfo(
-                route_id=route.id,
-                name=route.name,
-                buildings=[
-                    HeritageBuildingInfo(
-                        building_id=rb.buildings.id,
-                        name=rb.buildings.name,
-                        coordinate=(
-                            rb.buildings.longitude,
-                            rb.buildings.latitude,
-                        ),
-                    )
-                    for rb in sorted(route.route_buildings, key=lambda x: x.visit_order)
-                ],
+    # 문화재 내부 건축물 지오펜스 조회 (건축물 위치, 건축물 반경, 건축물 유형 기본 반경)
+    @read_only
+    async def get_building_geofences(self, heritage_id: int) -> List[Row]:
+        result = await self.db.execute(
+            select(
+                HeritageBuilding.id,
+                HeritageBuilding.name,
+                HeritageBuilding.latitude,
+                HeritageBuilding.longitude,
+                HeritageBuilding.custom_radius,
+                HeritageType.default_radius,
             )
-            for route in routes
-        ]
+            .outerjoin(HeritageType, HeritageBuilding.building_type_id == HeritageType.type_id)
+            .where(HeritageBuilding.heritage_id == heritage_id)
+            .order_by(HeritageBuilding.id)
+        )
+        return result.all()
 
     # 문화재 건축물 퀴즈 조회
     async def get_quiz_by_id(self, quiz_id: int):
@@ -134,6 +169,18 @@ class HeritageRepository:
         )
         return verified_building.scalar_one_or_none() is not None
 
+    # 문화재별 채팅 세션 수 조회 (자동완성 인기도)
+    @read_only
+    async def get_chat_session_counts(self) -> Dict[int, int]:
+        result = await self.db.execute(
+            select(ChatSession.heritage_id, func.count(ChatSession.id))
+            .where(ChatSession.heritage_id.isnot(None))
+            .group_by(ChatSession.heritage_id)
+        )
+        return {heritage_id: count for heritage_id, count in result.all()}
+
+    # 문화재 리스트 검색 (리스트 응답에 필요한 컬럼만 조회, ORM 엔티티 생성 없이 Row 튜플 반환)
+    @read_only
     async def search_heritages(
         self,
         limit: int,
@@ -147,82 +194,339 @@ class HeritageRepository:
         era_category: Optional[EraCategory] = None,
         sort_by: str = "id",
         sort_order: SortOrder = SortOrder.ASC,
-        count_total: bool = False,
-    ) -> Tuple[List[Tuple[Heritage, float]], int]:
+        cursor: Optional[Tuple] = None,
+        heritage_ids: Optional[List[int]] = None,
+    ) -> List[Row]:
+        query = self._search_query(
+            limit,
+            offset,
+            user_latitude,
+            user_longitude,
+            name,
+            area_code,
+            heritage_type,
+            distance_range,
+            era_category,
+            sort_by,
+            sort_order,
+            cursor,
+            heritage_ids,
+        )
 
-        query = select(Heritage).options(joinedload(Heritage.heritage_types))
+        logger.info(f"문화재 조회 SQL 쿼리가 생성되었습니다.: {query}")
+        logger.info(
+            f"쿼리 파라미터: user_latitude={user_latitude}, user_longitude={user_longitude}, area_code={area_code}, distance_range={distance_range}, limit={limit}, offset={offset}"
+        )
 
-        # 거리 계산 표현식
-        distance_expr = func.round(
-            func.st_distance_sphere(
-                func.point(
-                    func.cast(Heritage.longitude, Float),
-                    func.cast(Heritage.latitude, Float),
-                ),
-                func.point(
-                    func.cast(user_longitude, Float),
-                    func.cast(user_latitude, Float),
+        try:
+            result = await self.db.execute(query)
+            heritages = result.all()
+            logger.info(f"쿼리 개수 결과 : {len(heritages)}")
+            return heritages
+        except Exception as e:
+            logger.error(f"쿼리 실행 중 오류 발생: {str(e)}")
+            raise
+
+    # 문화재 리스트 검색 쿼리 (id, name, location_list, heritage_type_name, image_url, distance 컬럼)
+    @classmethod
+    def _search_query(
+        cls,
+        limit: int,
+        offset: int,
+        user_latitude: float,
+        user_longitude: float,
+        name: Optional[str],
+        area_code: Optional[int],
+        heritage_type: Optional[int],
+        distance_range: Optional[str],
+        era_category: Optional[EraCategory],
+        sort_by: str,
+        sort_order: SortOrder,
+        cursor: Optional[Tuple],
+        heritage_ids: Optional[List[int]],
+    ):
+        distance_expr = cls._distance_expr(user_latitude, user_longitude)
+        query = (
+            select(
+                Heritage.id,
+                Heritage.name,
+                Heritage.location_list,
+                HeritageType.name.label("heritage_type_name"),
+                Heritage.image_url,
+                distance_expr,
+            )
+            .select_from(Heritage)
+            .outerjoin(HeritageType, Heritage.heritage_type_id == HeritageType.type_id)
+            .where(
+                *cls._build_filters(
+                    distance_expr,
+                    user_latitude,
+                    user_longitude,
+                    name,
+                    area_code,
+                    heritage_type,
+                    distance_range,
+                    era_category,
+                    heritage_ids,
+                )
+            )
+        )
+
+        # 정렬 로직 추가 (거리가 같으면 ID 오름차순, 관련도는 이름 색인 검색 결과 순서)
+        order_direction = asc if sort_order == SortOrder.ASC else desc
+        if sort_by == "distance":
+            query = query.order_by(order_direction(distance_expr), asc(Heritage.id))
+        elif sort_by == "relevance" and heritage_ids:
+            query = query.order_by(order_direction(cls._relevance_expr(heritage_ids)))
+        else:
+            query = query.order_by(order_direction(Heritage.id))
+
+        # 커서 이후 행만 조회 (keyset 페이지네이션, OFFSET 없이 이어서 조회)
+        if cursor:
+            query = query.where(cls._after_cursor(distance_expr, sort_by, sort_order, cursor, heritage_ids))
+
+        # 페이지 네이션 적용
+        return query.limit(limit).offset(offset)
+
+    # 기준 좌표 주변 거리 범위 내 후보 문화재 (리스트 응답 컬럼 + 좌표, 기준 좌표 거리순, 최대 max_rows 건)
+    @read_only
+    async def search_nearby_candidates(
+        self,
+        latitude: float,
+        longitude: float,
+        min_distance: float,
+        max_distance: float,
+        max_rows: int,
+        name: Optional[str] = None,
+        area_code: Optional[int] = None,
+        heritage_type: Optional[List[int]] = None,
+        era_category: Optional[EraCategory] = None,
+        heritage_ids: Optional[List[int]] = None,
+    ) -> List[Row]:
+        distance_expr = self._distance_expr(latitude, longitude)
+        bbox = bounding_box(latitude, longitude, max_distance)
+        query = (
+            select(
+                Heritage.id,
+                Heritage.name,
+                Heritage.location_list,
+                HeritageType.name.label("heritage_type_name"),
+                Heritage.image_url,
+                Heritage.latitude,
+                Heritage.longitude,
+                distance_expr,
+            )
+            .select_from(Heritage)
+            .outerjoin(HeritageType, Heritage.heritage_type_id == HeritageType.type_id)
+            .where(
+                *self._build_filters(
+                    distance_expr,
+                    latitude,
+                    longitude,
+                    name,
+                    area_code,
+                    heritage_type,
+                    None,
+                    era_category,
+                    heritage_ids,
                 ),
+                func.MBRContains(bounding_box_expr(*bbox), Heritage.location_point),
+                distance_expr >= min_distance,
+                distance_expr < max_distance,
             )
-            / 1000,
-            2,
-        ).label("distance")
+            .order_by(asc(distance_expr), asc(Heritage.id))
+            .limit(max_rows)
+        )
+        result = await self.db.execute(query)
+        return result.all()
 
-        query = query.add_columns(distance_expr)
+    # 문화재 리스트 검색 결과 전체 개수 (검색과 동일한 조건, 조인/정렬 없이 ID 개수만 집계)
+    @read_only
+    async def count_heritages(
+        self,
+        user_latitude: float,
+        user_longitude: float,
+        name: Optional[str] = None,
+        area_code: Optional[int] = None,
+        heritage_type: Optional[int] = None,
+        distance_range: Optional[str] = None,
+        era_category: Optional[EraCategory] = None,
+        heritage_ids: Optional[List[int]] = None,
+    ) -> int:
+        distance_expr = self._distance_expr(user_latitude, user_longitude)
+        result = await self.db.execute(
+            select(func.count(Heritage.id)).where(
+                *self._build_filters(
+                    distance_expr,
+                    user_latitude,
+                    user_longitude,
+                    name,
+                    area_code,
+                    heritage_type,
+                    distance_range,
+                    era_category,
+                    heritage_ids,
+                )
+            )
+        )
+        return result.scalar()
 
-        # 이름 필터링
-        if name:
-            query = query.where(Heritage.name.like(f"%{name}%"))
+    # 경계 상자 안 문화재를 격자 셀별로 고르게 최대 limit 건 선택 (지도 응답 행, 전체 개수)
+    # - 셀마다 ID 순 순번을 매기고 (순번, ID) 순서로 채움 (stratified_sample 과 같은 규칙을 DB 에서 전체 상자에 적용)
+    # - 행은 id, name, location_list, heritage_type_name, image_url, latitude, longitude 컬럼 (ID 순)
+    @read_only
+    async def sample_heritages_in_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        cell_size: float,
+        limit: int,
+        area_code: Optional[int] = None,
+        heritage_type: Optional[List[int]] = None,
+        era_category: Optional[EraCategory] = None,
+    ) -> Tuple[List[Row], int]:
+        latitude, longitude = Heritage.latitude, Heritage.longitude
+        ranked = (
+            select(
+                Heritage.id,
+                Heritage.name,
+                Heritage.location_list,
+                HeritageType.name.label("heritage_type_name"),
+                Heritage.image_url,
+                latitude.label("latitude"),
+                longitude.label("longitude"),
+                func.row_number()
+                .over(
+                    partition_by=(func.floor(latitude / cell_size), func.floor(longitude / cell_size)),
+                    order_by=Heritage.id,
+                )
+                .label("cell_rank"),
+                func.count().over().label("total_count"),
+            )
+            .select_from(Heritage)
+            .outerjoin(HeritageType, Heritage.heritage_type_id == HeritageType.type_id)
+            .where(*self._bbox_filters(min_lat, min_lon, max_lat, max_lon, area_code, heritage_type, era_category))
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(ranked)
+            .where(ranked.c.cell_rank <= limit)
+            .order_by(asc(ranked.c.cell_rank), asc(ranked.c.id))
+            .limit(limit)
+        )
+        rows = sorted(result.all(), key=lambda row: row.id)
+        return rows, rows[0].total_count if rows else 0
+
+    # 경계 상자 조회 조건 (공간 인덱스 + 리스트 조회와 동일한 지역/유형/시대 필터, 좌표 없는 문화재 제외)
+    @classmethod
+    def _bbox_filters(
+        cls,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        area_code: Optional[int],
+        heritage_type: Optional[List[int]],
+        era_category: Optional[EraCategory],
+    ) -> list:
+        return [
+            func.MBRContains(bounding_box_expr(min_lat, min_lon, max_lat, max_lon), Heritage.location_point),
+            Heritage.latitude.isnot(None),
+            Heritage.longitude.isnot(None),
+            *cls._build_filters(None, min_lat, min_lon, None, area_code, heritage_type, None, era_category),
+        ]
+
+    # 거리 계산 표현식 (공간 컬럼 location_point 기준)
+    # - 좌표가 없는 문화재는 location_point 가 POINT(0 0) 이므로 거리 NULL 로 처리 (거리 범위 제외, 오름차순 맨 앞)
+    @staticmethod
+    def _distance_expr(user_latitude: float, user_longitude: float):
+        return case(
+            (or_(Heritage.latitude.is_(None), Heritage.longitude.is_(None)), null()),
+            else_=func.round(
+                func.st_distance_sphere(Heritage.location_point, point_expr(user_latitude, user_longitude)) / 1000,
+                2,
+            ),
+        ).label("distance")
+
+    # 문화재 리스트 검색 조건 (검색/개수 조회 공통)
+    @staticmethod
+    def _build_filters(
+        distance_expr,
+        user_latitude: float,
+        user_longitude: float,
+        name: Optional[str],
+        area_code: Optional[int],
+        heritage_type: Optional[int],
+        distance_range: Optional[str],
+        era_category: Optional[EraCategory],
+        heritage_ids: Optional[List[int]] = None,
+    ) -> list:
+        filters = []
+
+        # 이름 필터링 (이름 색인 검색 결과가 있으면 ID 목록으로 대체)
+        if heritage_ids is not None:
+            filters.append(Heritage.id.in_(heritage_ids))
+        elif name:
+            filters.append(Heritage.name.like(f"%{name}%"))
 
         # 지역 필터링 (area_code None이 아닐 때만 적용)
         if area_code is not None:
-            query = query.where(Heritage.area_code == area_code)
+            filters.append(Heritage.area_code == area_code)
 
         # 문화재 유형 필터링
         if heritage_type is not None:
-            query = query.where(Heritage.heritage_type_id.in_(heritage_type))
+            filters.append(Heritage.heritage_type_id.in_(heritage_type))
 
-        # 시대 카테고리 필터링
+        # 시대 카테고리 필터링 (heritage_eras 인덱스 조회, 복수 시대 문화재 포함)
         if era_category and era_category != EraCategory.ALL:
-            query = query.filter(Heritage.era.like(f"%{era_category.value}"))
-
-        # 정렬 로직 추가
-        if sort_by == "distance":
-            order_column = distance_expr
-        else:
-            order_column = Heritage.id
-
-        if sort_order == SortOrder.ASC:
-            query = query.order_by(asc(order_column))
-        else:
-            query = query.order_by(desc(order_column))
-
-        # 전체 개수 계산
-        if count_total:
-            # count_query = query.with_only_columns(func.count()).order_by(None)
-            total_count = await self.db.execute(select(func.count()).select_from(query.subquery()))
-            total_count = total_count.scalar()
-        else:
-            total_count = 0
+            filters.append(
+                Heritage.id.in_(select(HeritageEra.heritage_id).where(HeritageEra.era_category == era_category))
+            )
 
         # 거리 범위 필터링
         if distance_range:
             min_dist, max_dist = parse_heritage_dist_range(distance_range)
-            query = query.where(and_(distance_expr >= min_dist, distance_expr < max_dist))
-
-        # 페이지 네이션 적용
-        query = query.limit(limit).offset(offset)
-
-        logger.info(f"문화재 조회 SQL 쿼리가 생성되었습니다.: {query}")
-        logger.info(
-            f"쿼리 파라미터: user_latitude={user_latitude}, user_longitude={user_longitude}, area_code={area_code}, distance_range={distance_range}, limit={limit}, offset={offset}"
-        )
-
-        try:
-            result = await self.db.execute(query)
-            heritages = result.unique().all()
-            logger.info(f"쿼리 개수 결과 : {len(heritages)}")
-            return heritages, total_count
-        except Exception as e:
-            logger.error(f"쿼리 실행 중 오류 발생: {str(e)}")
-            raise
+            # 공간 인덱스로 경계 상자 내 후보만 먼저 추린 뒤 정확한 거리 비교
+            if max_dist != float("inf"):
+                bbox = bounding_box(user_latitude, user_longitude, max_dist)
+                filters.append(func.MBRContains(bounding_box_expr(*bbox), Heritage.location_point))
+            filters.append(and_(distance_expr >= min_dist, distance_expr < max_dist))
+
+        return filters
+
+    # 이름 색인 검색 결과 순위 표현식 (FIELD 는 1부터 시작)
+    @staticmethod
+    def _relevance_expr(heritage_ids: List[int]):
+        return func.field(Heritage.id, *heritage_ids)
+
+    # 커서(마지막 행의 정렬 키)보다 뒤에 오는 행 조건
+    @classmethod
+    def _after_cursor(
+        cls,
+        distance_expr,
+        sort_by: str,
+        sort_order: SortOrder,
+        cursor: Tuple,
+        heritage_ids: Optional[List[int]] = None,
+    ):
+        if sort_by == "relevance" and heritage_ids:
+            (last_rank,) = cursor
+            relevance_expr = cls._relevance_expr(heritage_ids)
+            return relevance_expr > last_rank if sort_order == SortOrder.ASC else relevance_expr < last_rank
+
+        # 거리 NULL 행은 오름차순에서 맨 앞, 내림차순에서 맨 뒤 (MySQL 정렬과 동일, 같은 거리는 ID 오름차순)
+        if sort_by == "distance":
+            last_distance, last_id = cursor
+            ascending = sort_order == SortOrder.ASC
+            if last_distance is None:
+                after_nulls = and_(distance_expr.is_(None), Heritage.id > last_id)
+                return or_(after_nulls, distance_expr.isnot(None)) if ascending else after_nulls
+
+            beyond = distance_expr > last_distance if ascending else distance_expr < last_distance
+            after = or_(beyond, and_(distance_expr == last_distance, Heritage.id > last_id))
+            return after if ascending else or_(after, distance_expr.is_(None))
+
+        (last_id,) = cursor
+        return Heritage.id > last_id if sort_order == SortOrder.ASC else Heritage.id < last_id
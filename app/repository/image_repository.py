@@ -4,6 +4,7 @@ from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.core.database import read_only
 from app.error.heritage_exceptions import BuildingNotFoundException, HeritageNotFoundException
 from app.error.image_exception import ImageDeleteException, ImageNotFoundException, NoImagesFoundException
 from app.models.heritage.heritage import Heritage
@@ -62,6 +63,7 @@ class ImageRepository:
         return new_image
 
     # 내부 건축물 이미지 조회
+    @read_only
     async def get_building_images(self, heritage_id: int, building_id: int) -> List[HeritageBuildingImage]:
         result = await self.db.execute(
             select(HeritageBuildingImage)
@@ -1,5 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from app.core.deps import verify_metrics_token
+from app.core.metrics import metrics
 from app.router.v1 import chat, heritage, image, user
 
 api_router = APIRouter()
@@ -10,6 +12,12 @@ def health_check():
     return {"status": "ok"}
 
 
+# 커넥션 풀 등 서버 내부 지표 조회 (METRICS_TOKEN 인증 필요, 스키마 문서 비노출)
+@api_router.get("/metrics", include_in_schema=False, dependencies=[Depends(verify_metrics_token)])
+def get_metrics():
+    return metrics.snapshot()
+
+
 api_router.include_router(user.router, prefix="/users", tags=["users"])
 api_router.include_router(chat.router, prefix="/chat", tags=["chat"])
 api_router.include_router(heritage.router, prefix="/heritages", tags=["heritages"])
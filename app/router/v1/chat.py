@@ -1,18 +1,24 @@
 import logging
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Response, status
 
-from app.core.deps import get_db
+from app.core.deps import get_chat_service, get_idempotency_key
+from app.core.idempotency import idempotency_store, make_request_fingerprint
+from app.core.responses import model_response
 from app.error.chat_exception import (
     ChatServiceException,
+    IdempotencyKeyMismatchException,
     NoQuizAvailableException,
     QuizGenerationException,
     SessionNotFoundException,
     SummaryNotFoundException,
 )
-from app.error.heritage_exceptions import BuildingNotFoundException, InvalidAssociationException
+from app.error.heritage_exceptions import (
+    BuildingNotFoundException,
+    HeritageNotFoundException,
+    InvalidAssociationException,
+)
 from app.schemas.chat import (
     ChatMessageRequest,
     ChatMessageResponse,
@@ -21,6 +27,7 @@ from app.schemas.chat import (
     ChatSessionEndResponse,
     ChatSessionStatusResponse,
     ChatSummaryResponse,
+    GpsTrailRequest,
     VisitedBuildingList,
 )
 from app.schemas.heritage import (
@@ -32,6 +39,7 @@ from app.schemas.heritage import (
     RecommendedQuestionResponse,
 )
 from app.service.chat_service import ChatService
+from app.utils.encoding import COORDINATE_SCALE, compact_response, negotiate_response_format
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -39,13 +47,23 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Accept: application/msgpack 또는 컬럼형 JSON 요청 시 코스 건축물을 병렬 배열로 바꾸고 좌표 양자화
+CHAT_SESSION_ROUTE_COLUMNS = {"routes": {"buildings": {"coordinate": COORDINATE_SCALE}}}
+
 
 # 새로운 채팅 세션 생성
 @router.post("/sessions", response_model=ChatSessionCreateResponse)
-async def create_chat_session(chat_session: ChatSessionCreateRequest, db: AsyncSession = Depends(get_db)):
-    chat_service = ChatService(db)
+async def create_chat_session(
+    chat_session: ChatSessionCreateRequest,
+    response: Response,
+    accept: Optional[str] = Header(None),
+    chat_service: ChatService = Depends(get_chat_service),
+):
     try:
-        return await chat_service.create_chat_session(chat_session.user_id, chat_session.heritage_id)
+        created = await chat_service.create_chat_session(chat_session.user_id, chat_session.heritage_id)
+        response.headers["Vary"] = "Accept"
+        compact = compact_response(created, negotiate_response_format(accept), CHAT_SESSION_ROUTE_COLUMNS)
+        return compact or model_response(created, response)
 
     except ChatServiceException as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -63,12 +81,19 @@ async def add_chat_message(
     session_id: int,
     message: ChatMessageRequest,
     background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db),
+    chat_service: ChatService = Depends(get_chat_service),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key),
 ):
-    chat_service = ChatService(db)
     try:
-        return await chat_service.update_chat_conversation(session_id, message.content)
+        return await idempotency_store.run(
+            f"messages:{session_id}",
+            idempotency_key,
+            make_request_fingerprint(message),
+            lambda: chat_service.update_chat_conversation(session_id, message.content),
+        )
 
+    except IdempotencyKeyMismatchException as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     except SessionNotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ChatServiceException as e:
@@ -89,12 +114,19 @@ async def add_chat_message(
 async def get_heritage_building_info(
     session_id: int,
     building_data: BuildingInfoButtonRequest,
-    db: AsyncSession = Depends(get_db),
+    chat_service: ChatService = Depends(get_chat_service),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key),
 ):
-    chat_service = ChatService(db)
     try:
-        return await chat_service.update_info_conversation(session_id, building_data.building_id)
+        return await idempotency_store.run(
+            f"building-info:{session_id}",
+            idempotency_key,
+            make_request_fingerprint(building_data),
+            lambda: chat_service.update_info_conversation(session_id, building_data.building_id),
+        )
 
+    except IdempotencyKeyMismatchException as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     except (
         SessionNotFoundException,
         BuildingNotFoundException,
@@ -122,12 +154,19 @@ async def get_heritage_building_info(
 async def get_heritage_building_quiz(
     session_id: int,
     building_data: BuildingQuizButtonRequest,
-    db: AsyncSession = Depends(get_db),
+    chat_service: ChatService = Depends(get_chat_service),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key),
 ):
-    chat_service = ChatService(db)
     try:
-        return await chat_service.update_quiz_conversation(session_id, building_data.building_id)
+        return await idempotency_store.run(
+            f"building-quiz:{session_id}",
+            idempotency_key,
+            make_request_fingerprint(building_data),
+            lambda: chat_service.update_quiz_conversation(session_id, building_data.building_id),
+        )
 
+    except IdempotencyKeyMismatchException as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     except (
         SessionNotFoundException,
         BuildingNotFoundException,
@@ -156,12 +195,19 @@ async def get_heritage_building_quiz(
 async def get_building_recommented_questions(
     session_id: int,
     building_data: RecommendedQuestionRequest,
-    db: AsyncSession = Depends(get_db),
+    chat_service: ChatService = Depends(get_chat_service),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key),
 ):
-    chat_service = ChatService(db)
     try:
-        return await chat_service.get_building_questions(session_id, building_data.building_id)
+        return await idempotency_store.run(
+            f"building-questions:{session_id}",
+            idempotency_key,
+            make_request_fingerprint(building_data),
+            lambda: chat_service.get_building_questions(session_id, building_data.building_id),
+        )
 
+    except IdempotencyKeyMismatchException as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     except (
         SessionNotFoundException,
         BuildingNotFoundException,
@@ -178,8 +224,7 @@ async def get_building_recommented_questions(
 
 # 메시지 추천 질문 제공
 @router.get("/{session_id}/message/recommend-questions", response_model=List[str])
-async def get_message_recommented_questions(session_id: int, db: AsyncSession = Depends(get_db)):
-    chat_service = ChatService(db)
+async def get_message_recommented_questions(session_id: int, chat_service: ChatService = Depends(get_chat_service)):
     try:
         return await chat_service.get_message_questions(session_id)
 
@@ -199,8 +244,7 @@ async def get_message_recommented_questions(session_id: int, db: AsyncSession =
 
 # 채팅 요약 제공
 @router.get("/sessions/{session_id}/summary", response_model=ChatSummaryResponse)
-async def get_chat_summary(session_id: int, db: AsyncSession = Depends(get_db)):
-    chat_service = ChatService(db)
+async def get_chat_summary(session_id: int, chat_service: ChatService = Depends(get_chat_service)):
     try:
         return await chat_service.update_summary_conversation(session_id)
 
@@ -222,9 +266,8 @@ async def end_chat_session(
     session_id: int,
     visited_buildings: VisitedBuildingList,
     background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db),
+    chat_service: ChatService = Depends(get_chat_service),
 ):
-    chat_service = ChatService(db)
     try:
         # 요약 작업 백그라운드 실행
         background_tasks.add_task(
@@ -247,10 +290,37 @@ async def end_chat_session(
         )
 
 
+# GPS 궤적으로 방문 코스를 판별해 채팅 세션 종료 (투어당 한 번 업로드)
+@router.post("/sessions/{session_id}/end/trail", response_model=ChatSessionEndResponse)
+async def end_chat_session_with_trail(
+    session_id: int,
+    trail: GpsTrailRequest,
+    background_tasks: BackgroundTasks,
+    chat_service: ChatService = Depends(get_chat_service),
+):
+    try:
+        visited_buildings = await chat_service.derive_visited_buildings(session_id, trail)
+
+        # 요약 작업 백그라운드 실행
+        background_tasks.add_task(chat_service.generated_and_save_chat_summary, session_id, visited_buildings)
+
+        return await chat_service.end_chat_session(session_id)
+
+    except (SessionNotFoundException, HeritageNotFoundException) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ChatServiceException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"GPS 궤적 기반 채팅 세션 종료 중 예상치 못한 오류 발생: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버 오류가 발생했습니다.",
+        )
+
+
 # 채팅 세션 종료 여부 확인
 @router.get("/sessions/{session_id}/status", response_model=ChatSessionStatusResponse)
-async def check_chat_session_status(session_id: int, db: AsyncSession = Depends(get_db)):
-    chat_service = ChatService(db)
+async def check_chat_session_status(session_id: int, chat_service: ChatService = Depends(get_chat_service)):
     try:
         ended_status = await chat_service.is_chat_session_ended(session_id)
         return ChatSessionStatusResponse(session_id=session_id, ended_status=ended_status)
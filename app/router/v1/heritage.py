@@ -2,30 +2,69 @@
 import logging
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 
-from app.core.deps import get_db
+from app.core.config import settings
+from app.core.deps import (
+    get_autocomplete_service,
+    get_geofence_service,
+    get_heritage_cluster_service,
+    get_heritage_service,
+    get_route_planner_service,
+)
+from app.core.responses import model_response
 from app.error.heritage_exceptions import (
+    AutocompleteUnavailableException,
+    BuildingNotFoundException,
+    ClusterUnavailableException,
     DatabaseConnectionError,
     HeritageNotFoundException,
     HeritageServiceException,
     InvalidCoordinatesException,
 )
 from app.models.enums import EraCategory, SortOrder
-from app.schemas.heritage import HeritageDetailResponse, HeritageListResponse, PaginatedHeritageResponse
+from app.schemas.heritage import (
+    CustomRouteRequest,
+    CustomRouteResponse,
+    HeritageAutocompleteResponse,
+    HeritageBBoxListResponse,
+    HeritageClusterListResponse,
+    HeritageDetailResponse,
+    HeritageListResponse,
+    HeritageLocateRequest,
+    HeritageLocateResponse,
+    PaginatedHeritageResponse,
+)
+from app.service.autocomplete_service import AutocompleteService
+from app.service.geofence_service import GeofenceService
+from app.service.heritage_cluster_service import HeritageClusterService
 from app.service.heritage_service import HeritageService
+from app.service.route_planner_service import RoutePlannerService
+from app.utils.common import etag_matches
+from app.utils.encoding import (
+    COORDINATE_SCALE,
+    DISTANCE_SCALE,
+    compact_response,
+    negotiate_response_format,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Accept: application/msgpack 또는 컬럼형 JSON 요청 시 병렬 배열로 바꿀 목록 필드와 정수 양자화 필드
+HERITAGE_LIST_COLUMNS = {"items": {"distance": DISTANCE_SCALE}}
+HERITAGE_CLUSTER_COLUMNS = {"clusters": {"latitude": COORDINATE_SCALE, "longitude": COORDINATE_SCALE}}
+CUSTOM_ROUTE_COLUMNS = {"buildings": {"coordinate": COORDINATE_SCALE}}
+HERITAGE_BBOX_COLUMNS = {"items": {"latitude": COORDINATE_SCALE, "longitude": COORDINATE_SCALE}}
+
 
 # 문화재 리스트 조회
 @router.get("/lists", response_model=PaginatedHeritageResponse)
 async def get_heritage_list(
-    db: AsyncSession = Depends(get_db),
+    response: Response,
+    heritage_service: HeritageService = Depends(get_heritage_service),
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
     user_latitude: float = Query(..., ge=-90, le=90),
@@ -38,11 +77,14 @@ async def get_heritage_list(
         description="거리 범위 유형 (0-0.5, 0.5-1, 1-10, 10-100, 100-1000)",
     ),
     era_category: Optional[EraCategory] = Query(None),
-    sort_by: str = Query("id", description="정렬할 필드 (ID, 거리)"),
+    sort_by: str = Query("id", description="정렬할 필드 (ID, 거리, 관련도)"),
     sort_order: SortOrder = Query(SortOrder.ASC, description="정렬 순서 (오름차순 or 내림차순)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 무시)"),
+    with_total: bool = Query(True, description="전체 개수 포함 여부 (무한 스크롤 시 false 권장)"),
+    fuzzy: bool = Query(False, description="이름 오타 보정 검색 여부"),
+    accept: Optional[str] = Header(None),
 ):
     try:
-        heritage_service = HeritageService(db)
         heritages = await heritage_service.get_heritages(
             page,
             limit,
@@ -55,9 +97,14 @@ async def get_heritage_list(
             era_category,
             sort_by,
             sort_order,
+            cursor,
+            with_total,
+            fuzzy,
         )
 
-        return heritages
+        response.headers["Vary"] = "Accept"
+        compact = compact_response(heritages, negotiate_response_format(accept), HERITAGE_LIST_COLUMNS)
+        return compact or model_response(heritages, response)
     except DatabaseConnectionError as e:
         logger.error(f"데이터 베이스 연결 에러: {str(e)}")
         raise HTTPException(status_code=503, detail="데이터 베이스를 사용할 수 없습니다.")
@@ -73,14 +120,104 @@ async def get_heritage_list(
         raise HTTPException(status_code=500, detail="내부 서버 에러 발생")
 
 
+# 문화재 이름 자동완성 (초성 검색 지원, 위치 전달 시 거리 순)
+@router.get("/autocomplete", response_model=List[HeritageAutocompleteResponse])
+async def autocomplete_heritage_name(
+    q: str = Query(..., min_length=1, max_length=50, description="검색어 (예: 경복, ㄱㅂㄱ)"),
+    limit: int = Query(10, ge=1, le=20),
+    user_latitude: Optional[float] = Query(None, ge=-90, le=90),
+    user_longitude: Optional[float] = Query(None, ge=-180, le=180),
+    autocomplete_service: AutocompleteService = Depends(get_autocomplete_service),
+):
+    try:
+        return autocomplete_service.autocomplete(q, limit, user_latitude, user_longitude)
+    except AutocompleteUnavailableException as e:
+        logger.warning(str(e))
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"문화재 자동완성에서 예상치 못한 에러 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail="내부 서버 에러 발생")
+
+
+# 지도 화면의 문화재 마커 클러스터 (줌 레벨별 사전 집계, 높은 줌에서는 개별 문화재)
+@router.get("/clusters", response_model=HeritageClusterListResponse)
+async def get_heritage_clusters(
+    response: Response,
+    bbox: str = Query(..., description="지도 경계 상자 (최소경도,최소위도,최대경도,최대위도)"),
+    zoom: int = Query(..., ge=0, le=22, description="지도 줌 레벨"),
+    accept: Optional[str] = Header(None),
+    heritage_cluster_service: HeritageClusterService = Depends(get_heritage_cluster_service),
+):
+    try:
+        clusters = heritage_cluster_service.get_clusters(bbox, zoom)
+        response.headers["Vary"] = "Accept"
+        return compact_response(clusters, negotiate_response_format(accept), HERITAGE_CLUSTER_COLUMNS) or clusters
+    except ClusterUnavailableException as e:
+        logger.warning(str(e))
+        raise HTTPException(status_code=503, detail=str(e))
+    except HeritageServiceException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"문화재 지도 클러스터 조회에서 예상치 못한 에러 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail="내부 서버 에러 발생")
+
+
+# 지도 화면(경계 상자) 안 문화재 조회 (limit 건 초과 시 격자 셀별로 고르게 선택한 표본)
+@router.get("/in-bbox", response_model=HeritageBBoxListResponse)
+async def get_heritages_in_bbox(
+    response: Response,
+    min_lat: float = Query(..., ge=-90, le=90),
+    min_lon: float = Query(..., ge=-180, le=180),
+    max_lat: float = Query(..., ge=-90, le=90),
+    max_lon: float = Query(..., ge=-180, le=180),
+    limit: int = Query(100, ge=1, le=settings.HERITAGE_BBOX_MAX_RESULTS),
+    area_code: Optional[int] = Query(None, ge=11, le=50),
+    heritage_type: Optional[List[int]] = Query(None, description="문화재 유형"),
+    era_category: Optional[EraCategory] = Query(None),
+    accept: Optional[str] = Header(None),
+    heritage_service: HeritageService = Depends(get_heritage_service),
+):
+    try:
+        heritages = await heritage_service.get_heritages_in_bbox(
+            min_lat, min_lon, max_lat, max_lon, limit, area_code, heritage_type, era_category
+        )
+        response.headers["Vary"] = "Accept"
+        compact = compact_response(heritages, negotiate_response_format(accept), HERITAGE_BBOX_COLUMNS)
+        return compact or model_response(heritages, response)
+    except DatabaseConnectionError as e:
+        logger.error(f"데이터 베이스 연결 에러: {str(e)}")
+        raise HTTPException(status_code=503, detail="데이터 베이스를 사용할 수 없습니다.")
+    except HeritageServiceException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"지도 화면 문화재 조회에서 예상치 못한 에러 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail="내부 서버 에러 발생")
+
+
 # 문화재 상세 조회
 @router.get("/{heritage_id}/details", response_model=HeritageDetailResponse)
-async def get_heritage_detail(heritage_id: int, db: AsyncSession = Depends(get_db)):
+async def get_heritage_detail(
+    heritage_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    heritage_service: HeritageService = Depends(get_heritage_service),
+):
     try:
-        heritage_service = HeritageService(db)
-        heritage = await heritage_service.get_heritage_by_id(heritage_id)
+        heritage, etag = await heritage_service.get_heritage_detail(heritage_id)
 
-        return heritage
+        # 변경되지 않았으면 본문 없이 304 (CDN / 클라이언트 캐시 재검증)
+        headers = {
+            "ETag": etag,
+            "Cache-Control": (
+                f"public, max-age={settings.HERITAGE_DETAIL_MAX_AGE_SECONDS}, "
+                f"stale-while-revalidate={settings.HERITAGE_DETAIL_CACHE_STALE_SECONDS}"
+            ),
+        }
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+
+        response.headers.update(headers)
+        return model_response(heritage, response)
     except HeritageNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
     except HeritageServiceException as e:
@@ -89,3 +226,50 @@ async def get_heritage_detail(heritage_id: int, db: AsyncSession = Depends(get_d
     except Exception as e:
         logger.error(f"문화재 상세 조회에서 발생한 예상치 못한 에러: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+# 현재 위치의 문화재 내부 건축물 판별 (클라이언트 폴링용, 최초 요청 이후 DB 조회 없음)
+@router.post("/{heritage_id}/locate", response_model=HeritageLocateResponse)
+async def locate_heritage_building(
+    heritage_id: int,
+    request: HeritageLocateRequest,
+    geofence_service: GeofenceService = Depends(get_geofence_service),
+):
+    try:
+        result = await geofence_service.locate(
+            heritage_id, request.latitude, request.longitude, request.current_building_id
+        )
+        return HeritageLocateResponse(
+            building_id=result.building_id, name=result.name, distance=result.distance, inside=result.inside
+        )
+    except HeritageNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except HeritageServiceException as e:
+        logger.error(f"문화재 서비스 에러 : {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"건축물 위치 판별에서 발생한 예상치 못한 에러: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+# 선택한 건축물로 사용자 지정 코스 방문 순서 계획
+@router.post("/{heritage_id}/routes/custom", response_model=CustomRouteResponse)
+async def plan_custom_route(
+    heritage_id: int,
+    request: CustomRouteRequest,
+    response: Response,
+    accept: Optional[str] = Header(None),
+    route_planner_service: RoutePlannerService = Depends(get_route_planner_service),
+):
+    try:
+        route = await route_planner_service.plan(heritage_id, request.building_ids, request.latitude, request.longitude)
+        response.headers["Vary"] = "Accept"
+        return compact_response(route, negotiate_response_format(accept), CUSTOM_ROUTE_COLUMNS) or route
+    except (HeritageNotFoundException, BuildingNotFoundException) as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except HeritageServiceException as e:
+        logger.error(f"문화재 서비스 에러 : {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"사용자 지정 코스 계획에서 발생한 예상치 못한 에러: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
@@ -1,9 +1,8 @@
 import logging
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_db
+from app.core.deps import get_image_service
 from app.error.heritage_exceptions import (
     BuildingNotFoundException,
     HeritageNotFoundException,
@@ -31,9 +30,8 @@ router = APIRouter()
 async def update_heritage_iamge(
     heritage_id: int,
     file: UploadFile = File(...),
-    db: AsyncSession = Depends(get_db),
+    image_service: ImageService = Depends(get_image_service),
 ):
-    image_service = ImageService(db)
     try:
         result = await image_service.update_heritage_image(heritage_id, file)
         return ImageProcessingResponse(message="문화재 이미지가 성공적으로 업데이트 되었습니다.")
@@ -58,9 +56,8 @@ async def add_building_image(
     file: UploadFile = File(...),
     description: str = Form(...),
     alt_text: str = Form(...),
-    db: AsyncSession = Depends(get_db),
+    image_service: ImageService = Depends(get_image_service),
 ):
-    image_service = ImageService(db)
     try:
         result = await image_service.add_building_image(heritage_id, building_id, file, description, alt_text)
         return ImageProcessingResponse(message="건축물 이미지가 성공적으로 추가되었습니다.")
@@ -82,9 +79,8 @@ async def add_building_image(
 async def get_building_images(
     heritage_id: int,
     building_data: FindBuildingImageRequest,
-    db: AsyncSession = Depends(get_db),
+    image_service: ImageService = Depends(get_image_service),
 ):
-    image_service = ImageService(db)
     try:
         images = await image_service.get_building_image(heritage_id, building_data.building_id)
         return FindBuildingImageResponse(images=images)
@@ -99,8 +95,7 @@ async def get_building_images(
 
 # 건축물 이미지 삭제
 @router.post("/delete-building", response_model=ImageProcessingResponse)
-async def delete_building_image(image_id: int, db: AsyncSession = Depends(get_db)):
-    image_service = ImageService(db)
+async def delete_building_image(image_id: int, image_service: ImageService = Depends(get_image_service)):
     try:
         result = await image_service.delete_building_image(image_id)
         return ImageProcessingResponse(message="건축물 이미지가 성공적으로 삭제되었습니다.")
@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from app.core.config import settings
 from app.schemas.heritage import HeritageBuildingInfo, HeritageRouteInfo
 
 
@@ -61,6 +62,20 @@ class VisitedBuildingList(BaseModel):
     buildings: List[VisitedBuilding]
 
 
+# 궤적 델타 값 하나의 범위 (1e-6 도 단위, 경도 전체 범위)
+TrailDelta = Annotated[int, Field(ge=-360_000_000, le=360_000_000)]
+
+
+# GPS 궤적으로 방문 코스를 판별하는 채팅 세션 종료 요청 값 (polyline 또는 델타 배열 중 하나)
+# - polyline: Google encoded polyline (precision: 소수점 자릿수)
+# - latitudes / longitudes: 1e-6 도 단위 정수 델타 배열 (첫 값은 절대 좌표)
+class GpsTrailRequest(BaseModel):
+    polyline: Optional[str] = None
+    precision: int = Field(5, ge=5, le=6)
+    latitudes: Optional[List[TrailDelta]] = Field(None, max_length=settings.GEOFENCE_TRAIL_MAX_POINTS)
+    longitudes: Optional[List[TrailDelta]] = Field(None, max_length=settings.GEOFENCE_TRAIL_MAX_POINTS)
+
+
 # 채팅 요약 응답 값
 class ChatSummaryResponse(BaseModel):
     chat_date: datetime
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # 채팅 방에 제공될 내부 건축물 정보
@@ -54,6 +54,69 @@ class RecommendedQuestionResponse(BaseModel):
     questions: List[str]
 
 
+# 현재 건축물 판별 요청 값 (current_building_id: 직전에 판별된 건축물, GPS 흔들림 보정용)
+class HeritageLocateRequest(BaseModel):
+    latitude: float = Field(..., ge=-90, le=90)
+    longitude: float = Field(..., ge=-180, le=180)
+    current_building_id: Optional[int] = None
+
+
+# 현재 건축물 판별 응답 값 (inside 가 False 면 가장 가까운 건축물, distance 단위 m)
+class HeritageLocateResponse(BaseModel):
+    building_id: Optional[int] = None
+    name: Optional[str] = None
+    distance: Optional[float] = None
+    inside: bool = False
+
+
+# 사용자 지정 코스 계획 요청 값 (latitude / longitude 지정 시 사용자 위치에서 출발)
+class CustomRouteRequest(BaseModel):
+    building_ids: List[int] = Field(..., min_length=1)
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
+
+
+# 사용자 지정 코스 계획 응답 값 (buildings: 방문 순서, distance: 총 이동 거리 m)
+class CustomRouteResponse(BaseModel):
+    heritage_id: int
+    distance: float
+    buildings: List[HeritageBuildingInfo]
+
+
+# 지도 클러스터 응답 값 (count 가 1 이면 heritage_id / name 포함)
+class HeritageClusterResponse(BaseModel):
+    latitude: float
+    longitude: float
+    count: int
+    heritage_id: Optional[int] = None
+    name: Optional[str] = None
+
+
+# 지도 화면(경계 상자) 단위 클러스터 목록 응답 값
+class HeritageClusterListResponse(BaseModel):
+    zoom: int
+    total_count: int
+    clusters: List[HeritageClusterResponse]
+
+
+# 지도 화면 문화재 응답 값
+class HeritageMapResponse(BaseModel):
+    id: int
+    name: str
+    location: str
+    heritage_type: Optional[str]
+    image_url: Optional[str]
+    latitude: float
+    longitude: float
+
+
+# 지도 화면(경계 상자) 문화재 목록 응답 값 (sampled 가 True 면 total_count 중 일부만 격자 셀별로 고르게 선택)
+class HeritageBBoxListResponse(BaseModel):
+    total_count: int
+    sampled: bool
+    items: List[HeritageMapResponse]
+
+
 # 건축물 리스트 응답 값
 class HeritageListResponse(BaseModel):
     id: int
@@ -70,9 +133,19 @@ class HeritageListResponse(BaseModel):
 # 건축물 페이지네이션 응답 값
 class PaginatedHeritageResponse(BaseModel):
     items: List[HeritageListResponse]
-    total_count: int
+    total_count: Optional[int] = None
     page: int
     limit: int
+    next_cursor: Optional[str] = None
+    fuzzy_matched: bool = False  # 오타 보정 검색 결과 여부 (다음 페이지는 fuzzy=true 로 요청)
+
+
+# 문화재 이름 자동완성 응답 값
+class HeritageAutocompleteResponse(BaseModel):
+    id: int
+    name: str
+    location: str
+    distance: Optional[float] = None
 
 
 class HeritageDetailResponse(BaseModel):
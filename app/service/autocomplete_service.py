@@ -0,0 +1,40 @@
+import logging
+from typing import List, Optional
+
+from app.error.heritage_exceptions import AutocompleteUnavailableException
+from app.index.autocomplete_index import AutocompleteIndex, autocomplete_index
+from app.schemas.heritage import HeritageAutocompleteResponse
+
+logger = logging.getLogger(__name__)
+
+
+class AutocompleteService:
+    """
+    문화재 이름 자동완성 서비스
+    - 키 입력마다 호출되므로 DB 세션 없이 인메모리 색인으로만 응답
+    """
+
+    def __init__(self, index: Optional[AutocompleteIndex] = None):
+        self.index = index or autocomplete_index
+
+    # 문화재 이름 자동완성
+    def autocomplete(
+        self,
+        query: str,
+        limit: int,
+        user_latitude: Optional[float] = None,
+        user_longitude: Optional[float] = None,
+    ) -> List[HeritageAutocompleteResponse]:
+        if not self.index.is_ready:
+            raise AutocompleteUnavailableException()
+
+        suggestions = self.index.suggest(query, limit, user_latitude, user_longitude)
+        return [
+            HeritageAutocompleteResponse(
+                id=record.id,
+                name=record.name,
+                location=record.location_list or "",
+                distance=distance,
+            )
+            for record, distance in suggestions
+        ]
@@ -5,8 +5,9 @@ import logging
 import os
 import re
 import time
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
+import orjson
 import requests
 from fastapi import UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.error.chat_exception import (
     ChatServiceException,
+    InvalidTrailException,
     NoQuizAvailableException,
     QuizGenerationException,
     SessionNotFoundException,
@@ -28,13 +30,17 @@ from app.schemas.chat import (
     ChatSessionCreateResponse,
     ChatSessionEndResponse,
     ChatSummaryResponse,
+    GpsTrailRequest,
     VisitedBuilding,
 )
 from app.schemas.heritage import BuildingInfoButtonResponse, BuildingQuizButtonResponse, RecommendedQuestionResponse
 from app.service.clova_service import ClovaService
+from app.service.geofence_service import GeofenceService
+from app.service.heritage_route_service import HeritageRouteService
 from app.service.s3_service import S3Service
 from app.service.validation_service import ValidationService
 from app.utils.common import extract_hashtags, parse_quiz_content, process_hashtags
+from app.utils.geo import decode_deltas, decode_polyline
 
 logger = logging.getLogger(__name__)
 
@@ -43,14 +49,30 @@ BASE_URL = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 class ChatService:
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        user_repository: Optional[UserRepository] = None,
+        chat_repository: Optional[ChatRepository] = None,
+        heritage_repository: Optional[HeritageRepository] = None,
+        validation_service: Optional[ValidationService] = None,
+        clova_service: Optional[ClovaService] = None,
+        s3_service: Optional[S3Service] = None,
+        heritage_route_service: Optional[HeritageRouteService] = None,
+        geofence_service: Optional[GeofenceService] = None,
+    ):
         self.db = db
-        self.user_repository = UserRepository(db)
-        self.chat_repository = ChatRepository(db)
-        self.heritage_repository = HeritageRepository(db)
-        self.validation_service = ValidationService(db)
-        self.clova_service = ClovaService(db)
-        self.s3_service = S3Service()
+        # 요청 단위 Repository (주입되지 않은 경우 같은 세션으로 한 번씩만 생성해 공유)
+        self.user_repository = user_repository or UserRepository(db)
+        self.chat_repository = chat_repository or ChatRepository(db)
+        self.heritage_repository = heritage_repository or HeritageRepository(db)
+        self.validation_service = validation_service or ValidationService(
+            db, self.chat_repository, self.heritage_repository
+        )
+        self.clova_service = clova_service or ClovaService(db, self.heritage_repository, self.chat_repository)
+        self.s3_service = s3_service or S3Service()
+        self.heritage_route_service = heritage_route_service or HeritageRouteService(db, self.heritage_repository)
+        self.geofence_service = geofence_service or GeofenceService(db, self.heritage_repository)
         self.current_sliding_window = None
 
     # 채팅 세션 생성하기
@@ -63,7 +85,8 @@ class ChatService:
 
                 # 문화재 정보 가져오기
                 heritage = await self.heritage_repository.get_heritage_by_id(heritage_id)
-                routes = await self.heritage_repository.get_routes_with_buildings_by_heritages_id(heritage_id)
+                # 코스 정보는 문화재별 캐시에서 조회 (시작 시 미리 적재, 변경 커밋 시 무효화)
+                routes = await self.heritage_route_service.get_routes(heritage_id)
 
                 return ChatSessionCreateResponse(
                     session_id=new_session.id,
@@ -95,6 +118,28 @@ class ChatService:
             logger.error(f"채팅 세션 종료 중 오류 발생: {str(e)}", exc_info=True)
             raise ChatServiceException("채팅 세션 종료 실패")
 
+    # GPS 궤적으로 세션 문화재의 방문 건축물 목록 생성 (클라이언트가 방문 목록을 보내지 않는 경우)
+    async def derive_visited_buildings(self, session_id: int, trail: GpsTrailRequest) -> List[VisitedBuilding]:
+        chat_session = await self.chat_repository.get_chat_session(session_id)
+        if not chat_session:
+            raise SessionNotFoundException(session_id)
+
+        # 좌표 수 제한은 전체 궤적을 디코딩하기 전에 확인
+        max_points = settings.GEOFENCE_TRAIL_MAX_POINTS
+        try:
+            if trail.polyline is not None:
+                latitudes, longitudes = decode_polyline(trail.polyline, trail.precision, max_points)
+            elif trail.latitudes is not None and trail.longitudes is not None:
+                if len(trail.latitudes) > max_points:
+                    raise ValueError(f"좌표는 최대 {max_points} 개까지 업로드할 수 있습니다.")
+                latitudes, longitudes = decode_deltas(trail.latitudes, trail.longitudes)
+            else:
+                raise ValueError("polyline 또는 latitudes / longitudes 가 필요합니다.")
+        except ValueError as e:
+            raise InvalidTrailException(str(e))
+
+        return await self.geofence_service.visited_buildings(chat_session.heritage_id, latitudes, longitudes)
+
     # 채팅 메시지 전송 로직
     async def update_conversation(self, session_id: int, content: str, clova_method: Callable):
         try:
@@ -103,6 +148,7 @@ class ChatService:
                 raise SessionNotFoundException(session_id)
 
             # 기존 대화 내용 가져오기
+            # - DB 에서 읽은 한글 위주 문자열은 orjson 이 UTF-8 로 다시 인코딩해야 해서 json.loads 가 더 빠름
             full_conversation = json.loads(chat_session.full_conversation) if chat_session.full_conversation else []
             self.current_sliding_window = json.loads(chat_session.sliding_window) if chat_session.sliding_window else []
 
@@ -132,7 +178,7 @@ class ChatService:
                 new_sliding_window,
             )
 
-            # 업데이트 된 대화 내용 저장
+            # 업데이트 된 대화 내용 저장 (대화가 길어질수록 커지므로 직렬화는 orjson 사용)
             await self.save_conversation(session_id, full_conversation, new_sliding_window)
 
             return bot_response
@@ -151,7 +197,7 @@ class ChatService:
         full_conversation: list,
         sliding_window: list,
     ):
-        content_str = json.dumps(content, ensure_ascii=False) if isinstance(content, dict) else content
+        content_str = orjson.dumps(content).decode("utf-8") if isinstance(content, dict) else content
 
         try:
             message = await self.chat_repository.create_message(session_id, role, content_str)
@@ -192,13 +238,13 @@ class ChatService:
             logger.error(f"Clova 응답 조회 중 오류 발생: {str(e)}", exc_info=True)
             raise ChatServiceException("Clova 응답 조회 실패")
 
-    # 업데이트 된 대화 내용 저장
+    # 업데이트 된 대화 내용 저장 (대화가 길어질수록 커지므로 직렬화는 orjson 사용)
     async def save_conversation(self, session_id: int, full_conversation: list, sliding_window: list):
         try:
             await self.chat_repository.update_message(
                 session_id,
-                full_conversation=json.dumps(full_conversation, ensure_ascii=False),
-                sliding_window=json.dumps(sliding_window, ensure_ascii=False),
+                full_conversation=orjson.dumps(full_conversation).decode("utf-8"),
+                sliding_window=orjson.dumps(sliding_window).decode("utf-8"),
             )
         except Exception as e:
             logger.error(f"대화 내용 저장 중 오류 발생: {str(e)}", exc_info=True)
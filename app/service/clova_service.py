@@ -1,13 +1,13 @@
-import http.client
 import json
 import logging
 import uuid
 from http import HTTPStatus
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import requests
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.clients import get_clova_executors
 from app.core.config import settings
 from app.error.chat_exception import APICallException, ChatServiceException
 from app.models.enums import ChatbotType
@@ -27,30 +27,34 @@ def parse_non_stream_response(response):
 
 
 class CLOVAStudioExecutor:
-    def __init__(self, host, api_key, api_key_primary_val, request_id):
+    def __init__(self, host, api_key, api_key_primary_val, request_id=None, http_session=None):
         self._host = host
         self._api_key = api_key
         self._api_key_primary_val = api_key_primary_val
         self._request_id = request_id
+        # 공유 커넥션 풀 세션 (없으면 요청마다 새 연결 사용)
+        self._http = http_session or requests
 
-    def _send_request(self, completion_request, endpoint):
-        headers = {
+    def _headers(self, request_id=None):
+        return {
             "Content-Type": "application/json; charset=utf-8",
             "X-NCP-CLOVASTUDIO-API-KEY": self._api_key,
             "X-NCP-APIGW-API-KEY": self._api_key_primary_val,
-            "X-NCP-CLOVASTUDIO-REQUEST-ID": self._request_id,
+            "X-NCP-CLOVASTUDIO-REQUEST-ID": str(request_id or self._request_id),
         }
 
-        conn = http.client.HTTPSConnection(self._host)
-        conn.request("POST", endpoint, json.dumps(completion_request), headers)
-        response = conn.getresponse()
-        status = response.status
-        result = json.loads(response.read().decode(encoding="utf-8"))
-        conn.close()
+    def _send_request(self, completion_request, endpoint, request_id=None):
+        response = self._http.post(
+            f"https://{self._host}{endpoint}",
+            data=json.dumps(completion_request),
+            headers=self._headers(request_id),
+        )
+        status = response.status_code
+        result = json.loads(response.content.decode(encoding="utf-8"))
         return result, status
 
-    def execute(self, completion_request, endpoint):
-        res, status = self._send_request(completion_request, endpoint)
+    def execute(self, completion_request, endpoint, request_id=None):
+        res, status = self._send_request(completion_request, endpoint, request_id)
         if status == HTTPStatus.OK:
             return res, status
         else:
@@ -61,19 +65,11 @@ class CLOVAStudioExecutor:
 
 
 class ChatCompletionExecutor(CLOVAStudioExecutor):
-    def __init__(self, host, api_key, api_key_primary_val, request_id):
-        super().__init__(host, api_key, api_key_primary_val, request_id)
+    def execute(self, completion_request, stream=True, request_id=None):
+        headers = self._headers(request_id)
+        headers["Accept"] = "text/event-stream" if stream else "application/json"
 
-    def execute(self, completion_request, stream=True):
-        headers = {
-            "X-NCP-CLOVASTUDIO-API-KEY": self._api_key,
-            "X-NCP-APIGW-API-KEY": self._api_key_primary_val,
-            "X-NCP-CLOVASTUDIO-REQUEST-ID": self._request_id,
-            "Content-Type": "application/json; charset=utf-8",
-            "Accept": "text/event-stream" if stream else "application/json",
-        }
-
-        with requests.post(
+        with self._http.post(
             self._host + "/testapp/v1/chat-completions/HCX-003",
             headers=headers,
             json=completion_request,
@@ -99,13 +95,13 @@ class ChatCompletionExecutor(CLOVAStudioExecutor):
 
 class SlidingWindowExecutor(CLOVAStudioExecutor):
 
-    def execute(self, completion_request):
+    def execute(self, completion_request, request_id=None):
         endpoint = "/v1/api-tools/sliding/chat-messages/HCX-003"
         try:
             # logger.info(f"SlidingWindowExecutor input: {sliding_window}")
             # completion_request = {"messages": sliding_window}
             logger.info(f"SlidingWindowExecutor request: {completion_request}")
-            result, status = super().execute(completion_request, endpoint)
+            result, status = super().execute(completion_request, endpoint, request_id)
             logger.info(f"SlidingWindowExecutor result: {result}, status: {status}")
             if status == 200:
                 # 슬라이딩 윈도우 적용 후 메시지를 반환
@@ -124,13 +120,25 @@ class ClovaService:
     output: clova x output
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        heritage_repository: Optional[HeritageRepository] = None,
+        chat_repository: Optional[ChatRepository] = None,
+        completion_executor: Optional["ChatCompletionExecutor"] = None,
+        sliding_window_executor: Optional["SlidingWindowExecutor"] = None,
+    ):
         self.api_key = settings.CLOVA_API_KEY
         self.api_key_primary_val = settings.CLOVA_API_KEY_PRIMARY_VAL
         self.api_sliding_url = settings.CLOVA_SLIDING_API_HOST
         self.api_completion_url = settings.CLOVA_COMPLETION_API_HOST
-        self.heritage_repository = HeritageRepository(db)
-        self.chat_repository = ChatRepository(db)
+        self.heritage_repository = heritage_repository or HeritageRepository(db)
+        self.chat_repository = chat_repository or ChatRepository(db)
+
+        # 애플리케이션 전역 Executor 재사용 (커넥션 풀 공유)
+        executors = get_clova_executors()
+        self.completion_executor = completion_executor or executors["completion"]
+        self.sliding_window_executor = sliding_window_executor or executors["sliding_window"]
 
     async def get_chatting(self, session_id: int, sliding_window: list) -> str:
         try:
@@ -156,19 +164,12 @@ class ClovaService:
                 sliding_window = []
 
             # Sliding Window 요청
-            sliding_window_executor = SlidingWindowExecutor(
-                host=self.api_sliding_url,
-                api_key=self.api_key,
-                api_key_primary_val=self.api_key_primary_val,
-                request_id=str(session_id),
-            )
-
             request_data = {
                 "messages": updated_sliding_window,
                 "maxTokens": 3000,
             }
 
-            adjusted_sliding_window = sliding_window_executor.execute(request_data)
+            adjusted_sliding_window = self.sliding_window_executor.execute(request_data, request_id=session_id)
             logger.info(f"Adjusted sliding window: {adjusted_sliding_window}")
 
             # 마지막 메시지 ASSISTANT 응답인 경우 이를 resopnse로 사용
@@ -176,14 +177,6 @@ class ClovaService:
                 response_text = adjusted_sliding_window[-1]["content"]
             else:
                 # ASSISTANT 응답 없는 경우 Completion 요청 실행
-                completion_executor = ChatCompletionExecutor(
-                    host=self.api_completion_url,
-                    api_key=self.api_key,
-                    api_key_primary_val=self.api_key_primary_val,
-                    request_id=str(session_id),
-                )
-
-                # Completion 요청 실행
                 completion_request_data = {
                     "messages": adjusted_sliding_window,
                     "maxTokens": 400,
@@ -197,7 +190,9 @@ class ClovaService:
                 }
 
                 logger.info(f"요청 데이터 완료: {completion_request_data}")
-                response = completion_executor.execute(completion_request_data, stream=False)
+                response = self.completion_executor.execute(
+                    completion_request_data, stream=False, request_id=session_id
+                )
 
                 # 응답 로깅
                 logger.info(f"세션 ID {session_id}에 대한 Raw한 API 응답 {response}")
@@ -228,13 +223,6 @@ class ClovaService:
     # async def get_quiz(self, session_id: int, building_name: str) -> Dict[str, str]:
     async def get_info_quiz_rec(self, session_id: int, building_name: str, request_type: ChatbotType) -> str:
         try:
-            completion_executor = ChatCompletionExecutor(
-                host=self.api_completion_url,
-                api_key=self.api_key,
-                api_key_primary_val=self.api_key_primary_val,
-                request_id=str(session_id),
-            )
-
             if request_type == ChatbotType.QUIZ:
                 system_prompt = SYSTEM_PROMPT_QUIZ
                 user_content = f"{building_name}에 대한 퀴즈를 생성해주세요."
@@ -265,7 +253,7 @@ class ClovaService:
             }
 
             logger.info(f"{request_type.value.capitalize()} request data: {completion_request_data}")
-            response = completion_executor.execute(completion_request_data, stream=False)
+            response = self.completion_executor.execute(completion_request_data, stream=False, request_id=session_id)
             logger.info(f"Raw API response for session ID {session_id}: {response}")
 
             # 경복궁의 중심이 되는 건물은 다음 중 무엇일까요?\n1. 근정전\n2. 사정전\n3. 교태전\n4. 강녕전\n5. 향원정 형식
@@ -291,13 +279,6 @@ class ClovaService:
     # content는 돌았던 코스 텍스트가 담겨있으면 됩니다.
     async def get_summary(self, session_id: int, content: str) -> str:
         try:
-            completion_executor = ChatCompletionExecutor(
-                host=self.api_completion_url,
-                api_key=self.api_key,
-                api_key_primary_val=self.api_key_primary_val,
-                request_id=str(session_id),
-            )
-
             completion_request_data = {
                 "messages": [
                     {"role": "system", "content": SYSTEM_PROMPT_SUMMARY},
@@ -313,7 +294,7 @@ class ClovaService:
                 "seed": 0,
             }
 
-            response = completion_executor.execute(completion_request_data, stream=False)
+            response = self.completion_executor.execute(completion_request_data, stream=False, request_id=session_id)
             response_text = parse_non_stream_response(response)
             logger.info(f"Parsed response for session ID {session_id}: {response_text}")
 
@@ -336,13 +317,6 @@ class ClovaService:
 
     async def get_questions(self, session_id: int, bot_response: str) -> List[str]:
         try:
-            completion_executor = ChatCompletionExecutor(
-                host=self.api_completion_url,
-                api_key=self.api_key,
-                api_key_primary_val=self.api_key_primary_val,
-                request_id=str(session_id),
-            )
-
             system_prompt = SYSTEM_PROMPT_MESSAGE_RECOMMENDED_QUESTIONS
             user_content = f"이전 대화 내용: {bot_response}\n해당 내용에 대한 추천 질문 3개를 생성해주세요."
 
@@ -364,7 +338,7 @@ class ClovaService:
             }
 
             logger.info(f"추천 질문 request 데이터: {completion_request_data}")
-            response = completion_executor.execute(completion_request_data, stream=False)
+            response = self.completion_executor.execute(completion_request_data, stream=False, request_id=session_id)
             logger.info(f"추천 질문에 대한 Raw한 대답: {response}")
 
             response_text = parse_non_stream_response(response)
@@ -0,0 +1,71 @@
+import logging
+from typing import List, Optional
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import use_primary
+from app.core.metrics import metrics
+from app.error.heritage_exceptions import HeritageNotFoundException
+from app.index.geofence_index import GeofenceIndex, HeritageGeofence, LocateResult, geofence_index
+from app.repository.heritage_repository import HeritageRepository
+from app.schemas.chat import VisitedBuilding
+
+logger = logging.getLogger(__name__)
+
+
+class GeofenceService:
+    """
+    GPS 좌표로 문화재 안 현재 건축물 판별 ("지금 어느 건축물에 있나요?")
+    - 문화재별 지오펜스를 처음 요청될 때 한 번만 DB 에서 적재하고 이후 폴링은 인메모리 색인으로 처리
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        heritage_repository: Optional[HeritageRepository] = None,
+        index: Optional[GeofenceIndex] = None,
+    ):
+        self.db = db
+        self.heritage_repository = heritage_repository or HeritageRepository(db)
+        self.index = index if index is not None else geofence_index
+
+    # 현재 위치가 속한 (없으면 가장 가까운) 건축물 판별
+    async def locate(
+        self, heritage_id: int, latitude: float, longitude: float, current_building_id: Optional[int] = None
+    ) -> LocateResult:
+        fence = await self.get_fence(heritage_id)
+        return fence.locate(latitude, longitude, current_building_id)
+
+    # GPS 궤적으로 방문 건축물 목록 생성 (방문한 건축물을 진입 순서대로, 이어서 방문하지 않은 건축물)
+    async def visited_buildings(
+        self, heritage_id: int, latitudes: np.ndarray, longitudes: np.ndarray
+    ) -> List[VisitedBuilding]:
+        fence = await self.get_fence(heritage_id)
+        visited = fence.visit_order(latitudes, longitudes, settings.GEOFENCE_TRAIL_MIN_FIXES).tolist()
+        not_visited = sorted(set(range(len(fence.ids))) - set(visited))
+        return [VisitedBuilding(name=fence.names[position], visited=True) for position in visited] + [
+            VisitedBuilding(name=fence.names[position], visited=False) for position in not_visited
+        ]
+
+    # 문화재 지오펜스 조회 (색인에 없으면 적재)
+    async def get_fence(self, heritage_id: int) -> HeritageGeofence:
+        fence = self.index.get(heritage_id)
+        if fence is None:
+            metrics.incr("geofence.index_misses")
+            return await self._load(heritage_id)
+        metrics.incr("geofence.index_hits")
+        return fence
+
+    # 무효화 직후 재적재 시 지연된 Replica 의 변경 전 건축물로 지오펜스 / 코스 계획이 캐시되지 않도록 Primary 에서 조회
+    async def _load(self, heritage_id: int) -> HeritageGeofence:
+        async with use_primary(self.heritage_repository.db):
+            rows = await self.heritage_repository.get_building_geofences(heritage_id)
+            # 건축물이 없으면 문화재 존재 여부 확인 (없는 문화재는 색인하지 않음)
+            if not rows and await self.heritage_repository.get_heritage_by_id(heritage_id) is None:
+                raise HeritageNotFoundException(heritage_id)
+
+        fence = HeritageGeofence.from_rows(rows)
+        self.index.set(heritage_id, fence)
+        return fence
@@ -0,0 +1,46 @@
+import logging
+from typing import Optional
+
+from app.core.config import settings
+from app.error.heritage_exceptions import ClusterUnavailableException, InvalidBoundingBoxException
+from app.index.cluster_index import ClusterIndex, cluster_index
+from app.schemas.heritage import HeritageClusterListResponse, HeritageClusterResponse
+from app.utils.common import parse_bbox
+
+logger = logging.getLogger(__name__)
+
+
+class HeritageClusterService:
+    """
+    지도 화면의 문화재 마커 클러스터 조회
+    - 화면 이동마다 호출되므로 DB 세션 없이 인메모리 색인으로만 응답
+    """
+
+    def __init__(self, index: Optional[ClusterIndex] = None):
+        self.index = index or cluster_index
+
+    # 경계 상자 / 줌 레벨의 클러스터 목록
+    def get_clusters(self, bbox: str, zoom: int) -> HeritageClusterListResponse:
+        if not self.index.is_ready:
+            raise ClusterUnavailableException()
+
+        try:
+            min_lat, min_lon, max_lat, max_lon = parse_bbox(bbox)
+        except ValueError:
+            raise InvalidBoundingBoxException(bbox)
+
+        clusters = self.index.clusters(min_lat, min_lon, max_lat, max_lon, zoom, settings.CLUSTER_MAX_MARKERS)
+        return HeritageClusterListResponse(
+            zoom=zoom,
+            total_count=sum(cluster.count for cluster in clusters),
+            clusters=[
+                HeritageClusterResponse(
+                    latitude=round(cluster.latitude, 6),
+                    longitude=round(cluster.longitude, 6),
+                    count=cluster.count,
+                    heritage_id=cluster.heritage_id,
+                    name=cluster.name,
+                )
+                for cluster in clusters
+            ],
+        )
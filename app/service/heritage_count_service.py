@@ -0,0 +1,116 @@
+import logging
+import math
+from typing import Hashable, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.models.enums import EraCategory
+from app.repository.heritage_repository import HeritageRepository
+from app.utils.cache import TTLCache
+from app.utils.common import heritage_ids_key, parse_heritage_dist_range
+
+logger = logging.getLogger(__name__)
+
+# 위도 1도 거리 (km)
+KM_PER_DEGREE = 111.32
+
+# 위치 셀 크기 = 거리 범위 최대값의 비율 (반경이 작을수록 셀도 작게 나누어 근사 오차 제한)
+CELL_SIZE_RATIO = 0.1
+
+heritage_count_cache = TTLCache(settings.HERITAGE_COUNT_CACHE_MAX_ENTRIES, settings.HERITAGE_COUNT_CACHE_TTL_SECONDS)
+
+
+class HeritageCountService:
+    """
+    문화재 리스트 전체 개수 조회
+    - 리스트 조회와 동일한 조건으로 개수만 집계
+    - (필터, 거리 범위, 위치 셀) 단위로 짧은 TTL 동안 캐시
+    - 거리 범위 필터가 있으면 같은 위치 셀 안의 사용자는 셀 중심 기준 개수를 공유
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        heritage_repository: Optional[HeritageRepository] = None,
+        cache: Optional[TTLCache] = None,
+    ):
+        self.db = db
+        self.heritage_repository = heritage_repository or HeritageRepository(db)
+        self.cache = cache if cache is not None else heritage_count_cache
+
+    # 문화재 리스트 전체 개수 조회
+    async def count_heritages(
+        self,
+        user_latitude: float,
+        user_longitude: float,
+        name: Optional[str] = None,
+        area_code: Optional[int] = None,
+        heritage_type: Optional[List[int]] = None,
+        distance_range: Optional[str] = None,
+        era_category: Optional[EraCategory] = None,
+        heritage_ids: Optional[List[int]] = None,
+    ) -> int:
+        cell = self._location_cell(user_latitude, user_longitude, distance_range)
+        key = self._cache_key(name, area_code, heritage_type, distance_range, era_category, cell, heritage_ids)
+
+        total_count = self.cache.get(key)
+        if total_count is not None:
+            metrics.incr("heritage.count.cache_hits")
+            return total_count
+
+        metrics.incr("heritage.count.cache_misses")
+        # 셀 단위 캐시이므로 셀 중심 좌표로 집계
+        if cell is not None:
+            user_latitude, user_longitude = self._cell_center(cell)
+        total_count = await self.heritage_repository.count_heritages(
+            user_latitude,
+            user_longitude,
+            name,
+            area_code,
+            heritage_type,
+            distance_range,
+            era_category,
+            heritage_ids,
+        )
+        self.cache.set(key, total_count)
+        return total_count
+
+    # 거리 범위에 따른 위치 셀 (거리 필터가 없으면 위치와 무관하므로 None)
+    @staticmethod
+    def _location_cell(user_latitude: float, user_longitude: float, distance_range: Optional[str]):
+        if not distance_range:
+            return None
+        _, max_dist = parse_heritage_dist_range(distance_range)
+        if max_dist == float("inf"):
+            return None
+
+        cell_size = max_dist * CELL_SIZE_RATIO / KM_PER_DEGREE
+        return cell_size, math.floor(user_latitude / cell_size), math.floor(user_longitude / cell_size)
+
+    @staticmethod
+    def _cell_center(cell):
+        cell_size, lat_index, lon_index = cell
+        return (lat_index + 0.5) * cell_size, (lon_index + 0.5) * cell_size
+
+    @staticmethod
+    def _cache_key(
+        name: Optional[str],
+        area_code: Optional[int],
+        heritage_type: Optional[List[int]],
+        distance_range: Optional[str],
+        era_category: Optional[EraCategory],
+        cell,
+        heritage_ids: Optional[List[int]] = None,
+    ) -> Hashable:
+        # 색인 검색 결과(ID 목록)로 필터링하면 같은 이름이라도 (정확/오타 보정) 결과가 다를 수 있어 ID 목록 다이제스트 사용
+        name_key = heritage_ids_key(heritage_ids) if heritage_ids is not None else name or None
+        return (
+            name_key,
+            area_code,
+            tuple(sorted(heritage_type)) if heritage_type is not None else None,
+            distance_range or None,
+            era_category.value if era_category and era_category != EraCategory.ALL else None,
+            cell[1:] if cell else None,
+        )
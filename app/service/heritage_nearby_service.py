@@ -0,0 +1,245 @@
+import logging
+from dataclasses import dataclass
+from typing import Hashable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.models.enums import EraCategory, SortOrder
+from app.repository.heritage_repository import HeritageRepository
+from app.utils.cache import TTLCache
+from app.utils.common import heritage_ids_key, parse_heritage_dist_range
+from app.utils.geo import geohash_bounds, geohash_encode, haversine_distances
+
+logger = logging.getLogger(__name__)
+
+# 후보 조회 범위 여유 폭 (km, 거리 반올림 단위 0.01 보다 충분히 큼)
+_DISTANCE_MARGIN_KM = 0.02
+
+# 후보가 너무 많아 캐시하지 않는 (셀, 필터) 표시
+_TOO_MANY_CANDIDATES = object()
+
+heritage_nearby_cache = TTLCache(settings.HERITAGE_NEARBY_CACHE_MAX_ENTRIES, settings.HERITAGE_NEARBY_CACHE_TTL_SECONDS)
+
+
+def _cache_hit_rate() -> float:
+    hits = metrics.get_counter("heritage.nearby.cache_hits")
+    lookups = hits + metrics.get_counter("heritage.nearby.cache_misses")
+    return round(hits / lookups, 4) if lookups else 0.0
+
+
+metrics.register_gauge("heritage.nearby.cache_hit_rate", _cache_hit_rate)
+
+
+def _coordinate(value) -> float:
+    return float(value) if value is not None else np.nan
+
+
+# 리스트 응답 행 (SQL 리스트 조회 Row 와 같은 속성)
+class NearbyRow(NamedTuple):
+    id: int
+    name: str
+    location_list: Optional[str]
+    heritage_type_name: Optional[str]
+    image_url: Optional[str]
+    distance: float
+
+
+# 셀 단위 후보 목록 (셀 중심 거리순)
+@dataclass(slots=True)
+class NearbyCandidates:
+    rows: list
+    ids: np.ndarray
+    latitudes: np.ndarray
+    longitudes: np.ndarray
+
+
+class HeritageNearbyService:
+    """
+    "내 주변" 거리 범위 문화재 리스트 조회 (geohash 셀 단위 후보 캐시)
+    - 사용자 좌표를 geohash 셀로 양자화해 (셀, 필터) 단위로 후보 목록을 캐시
+    - 후보는 셀 중심 기준 [최소 - 셀 반경, 최대 + 셀 반경) 범위로 조회해 셀 안 어느 위치의 결과든 포함
+    - 요청마다 실제 좌표로 정확한 거리를 다시 계산해 필터/정렬/커서/페이지 적용
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        heritage_repository: Optional[HeritageRepository] = None,
+        cache: Optional[TTLCache] = None,
+    ):
+        self.db = db
+        self.heritage_repository = heritage_repository or HeritageRepository(db)
+        self.cache = cache if cache is not None else heritage_nearby_cache
+
+    # 셀 캐시로 처리할 수 있는 요청인지 (설정 반경 이하의 거리 범위 + 거리/ID 정렬)
+    @staticmethod
+    def supports(distance_range: Optional[str], sort_by: str) -> bool:
+        if not settings.HERITAGE_NEARBY_CACHE_ENABLED or not distance_range or sort_by not in ("distance", "id"):
+            return False
+        _, max_dist = parse_heritage_dist_range(distance_range)
+        return max_dist <= settings.HERITAGE_NEARBY_CACHE_MAX_RADIUS_KM
+
+    # 주변 문화재 리스트 조회 (후보가 너무 많아 캐시할 수 없으면 None)
+    async def search(
+        self,
+        limit: int,
+        offset: int,
+        user_latitude: float,
+        user_longitude: float,
+        name: Optional[str],
+        area_code: Optional[int],
+        heritage_type: Optional[List[int]],
+        distance_range: str,
+        era_category: Optional[EraCategory],
+        sort_by: str,
+        sort_order: SortOrder,
+        cursor: Optional[Tuple] = None,
+        heritage_ids: Optional[List[int]] = None,
+    ) -> Optional[Tuple[List[NearbyRow], int]]:
+        min_dist, max_dist = parse_heritage_dist_range(distance_range)
+        cell = geohash_encode(user_latitude, user_longitude, settings.HERITAGE_NEARBY_CACHE_PRECISION)
+        key = self._cache_key(cell, name, area_code, heritage_type, distance_range, era_category, heritage_ids)
+
+        candidates = self.cache.get(key)
+        if candidates is None:
+            metrics.incr("heritage.nearby.cache_misses")
+            candidates = await self._load_candidates(
+                cell, min_dist, max_dist, name, area_code, heritage_type, era_category, heritage_ids
+            )
+            self.cache.set(key, candidates)
+        else:
+            metrics.incr("heritage.nearby.cache_hits")
+
+        if candidates is _TOO_MANY_CANDIDATES:
+            metrics.incr("heritage.nearby.cache_bypass")
+            return None
+
+        return self._rank(
+            candidates, limit, offset, user_latitude, user_longitude, min_dist, max_dist, sort_by, sort_order, cursor
+        )
+
+    async def _load_candidates(
+        self,
+        cell: str,
+        min_dist: float,
+        max_dist: float,
+        name: Optional[str],
+        area_code: Optional[int],
+        heritage_type: Optional[List[int]],
+        era_category: Optional[EraCategory],
+        heritage_ids: Optional[List[int]],
+    ):
+        min_lat, min_lon, max_lat, max_lon = geohash_bounds(cell)
+        center_lat, center_lon = (min_lat + max_lat) / 2, (min_lon + max_lon) / 2
+        # 셀 중심에서 가장 먼 꼭짓점까지의 거리 (셀 안 모든 위치를 포함하는 여유 폭)
+        cell_radius = float(
+            haversine_distances(
+                center_lat, center_lon, np.array([min_lat, min_lat, max_lat, max_lat]), np.array([min_lon, max_lon] * 2)
+            ).max()
+        )
+
+        max_candidates = settings.HERITAGE_NEARBY_CACHE_MAX_CANDIDATES
+        rows = await self.heritage_repository.search_nearby_candidates(
+            center_lat,
+            center_lon,
+            max(min_dist - cell_radius - _DISTANCE_MARGIN_KM, 0.0),
+            max_dist + cell_radius + _DISTANCE_MARGIN_KM,
+            max_candidates + 1,
+            name,
+            area_code,
+            heritage_type,
+            era_category,
+            heritage_ids,
+        )
+        if len(rows) > max_candidates:
+            logger.info(f"주변 문화재 후보가 {max_candidates} 건을 초과해 셀 캐시를 사용하지 않습니다. (cell={cell})")
+            return _TOO_MANY_CANDIDATES
+
+        # 좌표가 없는 문화재는 SQL 과 동일하게 거리 NULL(NaN) 로 두어 거리 범위에서 제외
+        return NearbyCandidates(
+            rows=rows,
+            ids=np.array([row.id for row in rows], dtype=np.int64),
+            latitudes=np.array([_coordinate(row.latitude) for row in rows], dtype=np.float64),
+            longitudes=np.array([_coordinate(row.longitude) for row in rows], dtype=np.float64),
+        )
+
+    # 실제 좌표 기준 정확한 거리로 후보 재정렬 (동일 거리는 ID 오름차순)
+    @staticmethod
+    def _rank(
+        candidates: NearbyCandidates,
+        limit: int,
+        offset: int,
+        user_latitude: float,
+        user_longitude: float,
+        min_dist: float,
+        max_dist: float,
+        sort_by: str,
+        sort_order: SortOrder,
+        cursor: Optional[Tuple],
+    ) -> Tuple[List[NearbyRow], int]:
+        distances = np.round(
+            haversine_distances(user_latitude, user_longitude, candidates.latitudes, candidates.longitudes), 2
+        )
+        positions = np.flatnonzero((distances >= min_dist) & (distances < max_dist))
+        total_count = len(positions)
+
+        ids, position_distances = candidates.ids[positions], distances[positions]
+        descending = sort_order == SortOrder.DESC
+        if cursor:
+            if sort_by == "distance":
+                last_distance, last_id = cursor
+                if last_distance is None:
+                    # 거리 NULL 행은 후보에 없으므로 오름차순이면 모두 이후, 내림차순이면 이후 행 없음
+                    after = np.full(len(ids), not descending)
+                else:
+                    beyond = position_distances < last_distance if descending else position_distances > last_distance
+                    after = beyond | ((position_distances == last_distance) & (ids > last_id))
+            else:
+                (last_id,) = cursor
+                after = ids < last_id if descending else ids > last_id
+            positions, ids, position_distances = positions[after], ids[after], position_distances[after]
+
+        if sort_by == "distance":
+            order = np.lexsort((ids, -position_distances if descending else position_distances))
+        else:
+            order = np.argsort(-ids if descending else ids, kind="stable")
+        positions = positions[order][offset : offset + limit]
+
+        rows = []
+        for position in positions:
+            row = candidates.rows[position]
+            rows.append(
+                NearbyRow(
+                    row.id,
+                    row.name,
+                    row.location_list,
+                    row.heritage_type_name,
+                    row.image_url,
+                    float(distances[position]),
+                )
+            )
+        return rows, total_count
+
+    @staticmethod
+    def _cache_key(
+        cell: str,
+        name: Optional[str],
+        area_code: Optional[int],
+        heritage_type: Optional[List[int]],
+        distance_range: str,
+        era_category: Optional[EraCategory],
+        heritage_ids: Optional[List[int]],
+    ) -> Hashable:
+        # 색인 검색 결과(ID 목록)로 필터링하면 같은 이름이라도 결과가 다를 수 있어 ID 목록 다이제스트 사용
+        name_key = heritage_ids_key(heritage_ids) if heritage_ids is not None else name or None
+        return (
+            cell,
+            name_key,
+            area_code,
+            tuple(sorted(heritage_type)) if heritage_type is not None else None,
+            distance_range,
+            era_category.value if era_category and era_category != EraCategory.ALL else None,
+        )
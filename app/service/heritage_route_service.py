@@ -0,0 +1,132 @@
+import logging
+from typing import List, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, use_primary
+from app.core.metrics import metrics
+from app.models.heritage.heritage_building import HeritageBuilding
+from app.models.heritage.heritage_route import HeritageRoute
+from app.models.heritage.heritage_route_building import HeritageRouteBuilding
+from app.repository.heritage_repository import HeritageRepository
+from app.schemas.heritage import HeritageRouteInfo
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+heritage_route_cache = TTLCache(settings.HERITAGE_ROUTE_CACHE_MAX_ENTRIES, settings.HERITAGE_ROUTE_CACHE_TTL_SECONDS)
+
+
+class HeritageRouteService:
+    """
+    문화재별 내부 건축물 코스 조회
+    - 코스 정보는 문화재별로 거의 변하지 않으므로 완성된 HeritageRouteInfo 목록을 캐시
+    - 코스 / 코스 건축물 / 건축물 변경이 커밋되면 해당 문화재 캐시 제거
+    - 애플리케이션 시작 시 채팅 세션이 많은 문화재부터 미리 적재
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        heritage_repository: Optional[HeritageRepository] = None,
+        cache: Optional[TTLCache] = None,
+    ):
+        self.db = db
+        self.heritage_repository = heritage_repository or HeritageRepository(db)
+        self.cache = cache if cache is not None else heritage_route_cache
+
+    # 문화재 건축물 코스 조회 (캐시 우선)
+    async def get_routes(self, heritage_id: int) -> List[HeritageRouteInfo]:
+        routes = self.cache.get(heritage_id)
+        if routes is not None:
+            metrics.incr("heritage.route.cache_hits")
+            return routes
+
+        metrics.incr("heritage.route.cache_misses")
+        # 무효화 직후 재적재 시 지연된 Replica 의 변경 전 코스가 캐시되지 않도록 Primary 에서 조회
+        async with use_primary(self.heritage_repository.db):
+            routes = await self.heritage_repository.get_routes_with_buildings_by_heritages_id(heritage_id)
+        self.cache.set(heritage_id, routes)
+        return routes
+
+    # 채팅 세션이 많은 상위 문화재의 코스를 한 번에 조회해 캐시에 적재 (적재한 문화재 수 반환)
+    async def warm_up(self, count: int) -> int:
+        session_counts = await self.heritage_repository.get_chat_session_counts()
+        heritage_ids = sorted(session_counts, key=lambda heritage_id: (-session_counts[heritage_id], heritage_id))
+        heritage_ids = heritage_ids[:count]
+        if not heritage_ids:
+            return 0
+
+        async with use_primary(self.heritage_repository.db):
+            routes = await self.heritage_repository.get_routes_with_buildings_by_heritage_ids(heritage_ids)
+        for heritage_id in heritage_ids:
+            self.cache.set(heritage_id, routes.get(heritage_id, []))
+        return len(heritage_ids)
+
+
+# 애플리케이션 시작 시 코스 캐시 미리 적재 (실패해도 요청 시 조회로 대체)
+async def warm_up_heritage_routes():
+    if settings.HERITAGE_ROUTE_CACHE_WARMUP_COUNT <= 0:
+        return
+
+    try:
+        async with AsyncSessionLocal() as db:
+            warmed = await HeritageRouteService(db).warm_up(settings.HERITAGE_ROUTE_CACHE_WARMUP_COUNT)
+        logger.info(f"문화재 코스 캐시 적재 완료: {warmed} 건")
+    except Exception as e:
+        logger.error(f"문화재 코스 캐시 적재 중 오류 발생: {str(e)}", exc_info=True)
+
+
+# 변경된 코스가 속한 문화재를 세션에 기록 (알 수 없으면 전체 무효화)
+def _record_route_change(target, heritage_ids: List[Optional[int]]):
+    session = object_session(target)
+    if session is None:
+        return
+    if any(heritage_id is None for heritage_id in heritage_ids):
+        session.info["heritage_route_invalidate_all"] = True
+        return
+    session.info.setdefault("heritage_route_invalidations", set()).update(heritage_ids)
+
+
+# 코스 / 건축물의 현재 및 변경 전 문화재 ID
+def _heritage_ids(target) -> List[Optional[int]]:
+    history = inspect(target).attrs.heritage_id.history
+    return [target.heritage_id, *history.deleted]
+
+
+@event.listens_for(HeritageRoute, "after_insert")
+@event.listens_for(HeritageRoute, "after_update")
+@event.listens_for(HeritageRoute, "after_delete")
+@event.listens_for(HeritageBuilding, "after_update")
+@event.listens_for(HeritageBuilding, "after_delete")
+def _on_route_changed(mapper, connection, target):
+    _record_route_change(target, _heritage_ids(target))
+
+
+# 코스 건축물은 코스가 로드되어 있으면 해당 문화재만, 아니면 전체 무효화
+@event.listens_for(HeritageRouteBuilding, "after_insert")
+@event.listens_for(HeritageRouteBuilding, "after_update")
+@event.listens_for(HeritageRouteBuilding, "after_delete")
+def _on_route_building_changed(mapper, connection, target):
+    route = inspect(target).attrs.routes.loaded_value
+    heritage_id = route.heritage_id if isinstance(route, HeritageRoute) else None
+    _record_route_change(target, [heritage_id])
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_heritage_routes(session):
+    heritage_ids = session.info.pop("heritage_route_invalidations", set())
+    if session.info.pop("heritage_route_invalidate_all", False):
+        heritage_route_cache.clear()
+        return
+    for heritage_id in heritage_ids:
+        heritage_route_cache.pop(heritage_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_heritage_route_invalidations(session):
+    session.info.pop("heritage_route_invalidations", None)
+    session.info.pop("heritage_route_invalidate_all", None)
@@ -1,28 +1,63 @@
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from haversine import haversine
+from sqlalchemy import event
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
 
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal, use_primary
 from app.error.heritage_exceptions import (
     DatabaseConnectionError,
     HeritageNotFoundException,
+    InvalidBoundingBoxException,
     InvalidCoordinatesException,
 )
+from app.index.fuzzy_index import fuzzy_index
+from app.index.geo_index import geo_index
+from app.index.name_index import name_index
 from app.models.enums import EraCategory, SortOrder
+from app.models.heritage.heritage import Heritage
+from app.models.heritage.heritage_type import HeritageType
 from app.repository.heritage_repository import HeritageRepository
-from app.schemas.heritage import HeritageDetailResponse, HeritageListResponse, PaginatedHeritageResponse
-from app.utils.common import parse_location_for_detail, parse_location_for_list
+from app.schemas.heritage import (
+    HeritageBBoxListResponse,
+    HeritageDetailResponse,
+    HeritageListResponse,
+    HeritageMapResponse,
+    PaginatedHeritageResponse,
+)
+from app.service.heritage_count_service import HeritageCountService
+from app.service.heritage_nearby_service import HeritageNearbyService
+from app.utils.cache import StaleWhileRevalidateCache
+from app.utils.common import make_etag
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.geo import sample_cell_size
 
 logger = logging.getLogger(__name__)
 
+heritage_detail_cache = StaleWhileRevalidateCache(
+    "heritage.detail",
+    settings.HERITAGE_DETAIL_CACHE_MAX_ENTRIES,
+    settings.HERITAGE_DETAIL_CACHE_TTL_SECONDS,
+    settings.HERITAGE_DETAIL_CACHE_STALE_SECONDS,
+)
+
 
 class HeritageService:
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        heritage_repository: Optional[HeritageRepository] = None,
+        heritage_count_service: Optional[HeritageCountService] = None,
+        heritage_nearby_service: Optional[HeritageNearbyService] = None,
+    ):
         self.db = db
-        self.heritage_repository = HeritageRepository(db)
+        self.heritage_repository = heritage_repository or HeritageRepository(db)
+        self.heritage_count_service = heritage_count_service or HeritageCountService(db, self.heritage_repository)
+        self.heritage_nearby_service = heritage_nearby_service or HeritageNearbyService(db, self.heritage_repository)
 
     # 문화재 리스트 조회
     async def get_heritages(
@@ -38,10 +73,147 @@ class HeritageService:
         era_category: Optional[EraCategory] = None,
         sort_by: str = "id",
         sort_order: SortOrder = SortOrder.ASC,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+        fuzzy: bool = False,
     ) -> PaginatedHeritageResponse:
+        # 이름 색인이 준비되어 있으면 LIKE 대신 색인 검색 결과(관련도 순 ID 목록)로 필터링
+        heritage_ids = None
+        if name and fuzzy and self._fuzzy_index_ready():
+            heritage_ids = self._limit_fuzzy_ids(fuzzy_index.search(name))
+        elif name and settings.NAME_INDEX_ENABLED and name_index.is_ready:
+            heritage_ids = name_index.search(name)
+            # SQL 조회 시 ID 목록이 IN / FIELD 리터럴로 전달되므로 너무 넓은 검색어는 LIKE 필터로 대체
+            if len(heritage_ids) > settings.NAME_INDEX_MAX_SQL_IDS and not self._geo_index_ready():
+                logger.info(f"이름 색인 검색 결과 {len(heritage_ids)} 건이 너무 많아 LIKE 검색으로 대체: {name}")
+                heritage_ids = None
+
+        if sort_by not in ("distance", "relevance") or (sort_by == "relevance" and heritage_ids is None):
+            sort_by = "id"
+        # 커서가 있으면 마지막 행 이후부터 조회 (keyset 페이지네이션), 없으면 기존 OFFSET 방식
+        cursor_keys = decode_cursor(cursor, sort_by, sort_order) if cursor else None
+        offset = 0 if cursor_keys else (page - 1) * limit
+
+        search_args = (user_latitude, user_longitude, name, area_code, heritage_type, distance_range, era_category)
+        result = await self._search_heritages(
+            page, limit, offset, *search_args, sort_by, sort_order, cursor_keys, heritage_ids, with_total
+        )
+
+        result.fuzzy_matched = fuzzy and heritage_ids is not None
+
+        # 첫 페이지 이름 검색 결과가 없으면 오타 보정 검색으로 재조회 (다음 페이지는 fuzzy=true 로 요청)
+        # - 커서 요청은 마지막 페이지 이후의 빈 결과이므로 재조회하지 않음
+        first_page = cursor_keys is None and page == 1
+        if name and not fuzzy and not result.items and first_page and self._fuzzy_index_ready():
+            fuzzy_ids = self._limit_fuzzy_ids(fuzzy_index.search(name))
+            if fuzzy_ids:
+                logger.info(f"이름 검색 결과가 없어 오타 보정 검색 결과 {len(fuzzy_ids)} 건으로 대체: {name}")
+                result = await self._search_heritages(
+                    page, limit, offset, *search_args, sort_by, sort_order, None, fuzzy_ids, with_total
+                )
+                result.fuzzy_matched = True
+
+        return result
+
+    @staticmethod
+    def _fuzzy_index_ready() -> bool:
+        return settings.FUZZY_INDEX_ENABLED and fuzzy_index.is_ready
+
+    @staticmethod
+    def _geo_index_ready() -> bool:
+        return settings.GEO_INDEX_ENABLED and geo_index.is_ready
+
+    # 오타 보정 검색은 LIKE 로 대체할 수 없으므로 SQL 조회 시 관련도 상위 ID 만 사용
+    @classmethod
+    def _limit_fuzzy_ids(cls, heritage_ids: List[int]) -> List[int]:
+        if cls._geo_index_ready():
+            return heritage_ids
+        return heritage_ids[: settings.NAME_INDEX_MAX_SQL_IDS]
+
+    # 인메모리 지리 인덱스 또는 DB 로 문화재 리스트 한 페이지 조회
+    async def _search_heritages(
+        self,
+        page: int,
+        limit: int,
+        offset: int,
+        user_latitude: float,
+        user_longitude: float,
+        name: Optional[str],
+        area_code: Optional[int],
+        heritage_type: Optional[List[int]],
+        distance_range: Optional[str],
+        era_category: Optional[EraCategory],
+        sort_by: str,
+        sort_order: SortOrder,
+        cursor_keys: Optional[Tuple],
+        heritage_ids: Optional[List[int]],
+        with_total: bool,
+    ) -> PaginatedHeritageResponse:
+        # 이름 색인 검색 결과가 비어 있으면 조회 없이 빈 결과
+        if heritage_ids is not None and not heritage_ids:
+            return PaginatedHeritageResponse(items=[], total_count=0 if with_total else None, page=page, limit=limit)
+
+        # 이름 검색이 없거나 이름 색인으로 대체 가능하면 인메모리 지리 인덱스로 조회
+        if self._geo_index_ready() and (not name or heritage_ids is not None):
+            records, total_count = geo_index.search(
+                limit,
+                offset,
+                user_latitude,
+                user_longitude,
+                area_code,
+                heritage_type,
+                distance_range,
+                era_category,
+                sort_by,
+                sort_order,
+                cursor_keys,
+                heritage_ids,
+            )
+            return PaginatedHeritageResponse(
+                items=[
+                    HeritageListResponse(
+                        id=record.id,
+                        name=record.name,
+                        location=record.location_list or "",
+                        heritage_type=record.heritage_type_name or "Unknown",
+                        image_url=record.image_url or settings.DEFAULT_IMAGE_URL,
+                        distance=round(distance, 1) if distance is not None else None,
+                    )
+                    for record, distance in records
+                ],
+                total_count=total_count if with_total else None,
+                page=page,
+                limit=limit,
+                next_cursor=self._next_cursor(
+                    [(record.id, distance) for record, distance in records], limit, sort_by, sort_order, heritage_ids
+                ),
+            )
+
         try:
-            offset = (page - 1) * limit
-            heritages, total_count = await self.heritage_repository.search_heritages(
+            # 거리 범위 "내 주변" 조회는 geohash 셀 후보 캐시에서 정확한 거리로 재정렬 (개수도 함께 계산)
+            if self.heritage_nearby_service.supports(distance_range, sort_by):
+                nearby = await self.heritage_nearby_service.search(
+                    limit,
+                    offset,
+                    user_latitude,
+                    user_longitude,
+                    name,
+                    area_code,
+                    heritage_type,
+                    distance_range,
+                    era_category,
+                    sort_by,
+                    sort_order,
+                    cursor_keys,
+                    heritage_ids,
+                )
+                if nearby is not None:
+                    heritages, total_count = nearby
+                    return self._to_page(
+                        heritages, total_count if with_total else None, page, limit, sort_by, sort_order, heritage_ids
+                    )
+
+            heritages = await self.heritage_repository.search_heritages(
                 limit,
                 offset,
                 user_latitude,
@@ -53,22 +225,48 @@ class HeritageService:
                 era_category,
                 sort_by,
                 sort_order,
-                count_total=True,
+                cursor_keys,
+                heritage_ids,
             )
+            total_count = None
+            if with_total:
+                total_count = await self.heritage_count_service.count_heritages(
+                    user_latitude,
+                    user_longitude,
+                    name,
+                    area_code,
+                    heritage_type,
+                    distance_range,
+                    era_category,
+                    heritage_ids,
+                )
         except SQLAlchemyError as e:
             logger.error(f"Database error in get_heritages: {str(e)}")
             raise DatabaseConnectionError()
 
+        return self._to_page(heritages, total_count, page, limit, sort_by, sort_order, heritage_ids)
+
+    # SQL 조회 행(id, name, location_list, heritage_type_name, image_url, distance)으로 리스트 응답 생성
+    def _to_page(
+        self,
+        heritages: list,
+        total_count: Optional[int],
+        page: int,
+        limit: int,
+        sort_by: str,
+        sort_order: SortOrder,
+        heritage_ids: Optional[List[int]],
+    ) -> PaginatedHeritageResponse:
         heritage_list = [
             HeritageListResponse(
-                id=heritage.id,
-                name=heritage.name,
-                location=parse_location_for_list(heritage.location),
-                heritage_type=(heritage.heritage_types.name if heritage.heritage_types else "Unknown"),
-                image_url=heritage.image_url or settings.DEFAULT_IMAGE_URL,
-                distance=round(distance, 1) if distance is not None else None,
+                id=row.id,
+                name=row.name,
+                location=row.location_list or "",
+                heritage_type=row.heritage_type_name or "Unknown",
+                image_url=row.image_url or settings.DEFAULT_IMAGE_URL,
+                distance=round(row.distance, 1) if row.distance is not None else None,
             )
-            for heritage, distance in heritages
+            for row in heritages
         ]
 
         return PaginatedHeritageResponse(
@@ -76,19 +274,124 @@ class HeritageService:
             total_count=total_count,
             page=page,
             limit=limit,
+            next_cursor=self._next_cursor(
+                [(row.id, row.distance) for row in heritages], limit, sort_by, sort_order, heritage_ids
+            ),
+        )
+
+    # 다음 페이지 커서 생성 (조회 결과가 limit 보다 적으면 마지막 페이지, rows 는 (ID, 거리) 목록)
+    @staticmethod
+    def _next_cursor(
+        rows: List[Tuple[int, float]],
+        limit: int,
+        sort_by: str,
+        sort_order: SortOrder,
+        heritage_ids: Optional[List[int]] = None,
+    ) -> Optional[str]:
+        if len(rows) < limit:
+            return None
+        last_id, last_distance = rows[-1]
+        if sort_by == "distance":
+            keys = (float(last_distance) if last_distance is not None else None, last_id)
+        elif sort_by == "relevance":
+            keys = (heritage_ids.index(last_id) + 1,)
+        else:
+            keys = (last_id,)
+        return encode_cursor(sort_by, sort_order, keys)
+
+    # 지도 화면(경계 상자) 안 문화재 조회 (limit 건 초과 시 격자 셀별 고른 표본)
+    async def get_heritages_in_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: int,
+        area_code: Optional[int] = None,
+        heritage_type: Optional[List[int]] = None,
+        era_category: Optional[EraCategory] = None,
+    ) -> HeritageBBoxListResponse:
+        if min_lat > max_lat or min_lon > max_lon:
+            raise InvalidBoundingBoxException(f"{min_lon},{min_lat},{max_lon},{max_lat}")
+
+        grid_size = settings.HERITAGE_BBOX_SAMPLE_GRID
+        if self._geo_index_ready():
+            records, total_count = geo_index.search_bbox(
+                min_lat, min_lon, max_lat, max_lon, limit, area_code, heritage_type, era_category, grid_size
+            )
+            return self._to_bbox_list(records, total_count)
+
+        try:
+            rows, total_count = await self.heritage_repository.sample_heritages_in_bbox(
+                min_lat,
+                min_lon,
+                max_lat,
+                max_lon,
+                sample_cell_size(max(max_lat - min_lat, max_lon - min_lon), grid_size),
+                limit,
+                area_code,
+                heritage_type,
+                era_category,
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Database error in get_heritages_in_bbox: {str(e)}")
+            raise DatabaseConnectionError()
+
+        return self._to_bbox_list(rows, total_count)
+
+    # 인덱스 레코드 / SQL 조회 행(id, name, location_list, heritage_type_name, image_url, latitude, longitude)으로 지도 응답 생성
+    @staticmethod
+    def _to_bbox_list(rows: list, total_count: int) -> HeritageBBoxListResponse:
+        return HeritageBBoxListResponse(
+            total_count=total_count,
+            sampled=total_count > len(rows),
+            items=[
+                HeritageMapResponse(
+                    id=row.id,
+                    name=row.name,
+                    location=row.location_list or "",
+                    heritage_type=row.heritage_type_name or "Unknown",
+                    image_url=row.image_url or settings.DEFAULT_IMAGE_URL,
+                    latitude=float(row.latitude),
+                    longitude=float(row.longitude),
+                )
+                for row in rows
+            ],
         )
 
     # 문화재 상세 조회
     async def get_heritage_by_id(self, heritage_id: int) -> HeritageDetailResponse:
+        detail, _ = await self.get_heritage_detail(heritage_id)
+        return detail
+
+    # 문화재 상세 조회 (응답, ETag) - 읽기 캐시 경유, stale 항목은 별도 세션으로 백그라운드 갱신
+    async def get_heritage_detail(self, heritage_id: int) -> Tuple[HeritageDetailResponse, str]:
+        return await heritage_detail_cache.get(
+            heritage_id,
+            lambda: self._load_heritage_detail(self.heritage_repository, heritage_id),
+            lambda: self._revalidate_heritage_detail(heritage_id),
+        )
+
+    @classmethod
+    async def _revalidate_heritage_detail(cls, heritage_id: int) -> Tuple[HeritageDetailResponse, str]:
+        async with AsyncSessionLocal() as db:
+            return await cls._load_heritage_detail(HeritageRepository(db), heritage_id)
+
+    @staticmethod
+    async def _load_heritage_detail(
+        heritage_repository: HeritageRepository, heritage_id: int
+    ) -> Tuple[HeritageDetailResponse, str]:
+        # 무효화 직후 재적재 / 재검증 시 지연된 Replica 의 변경 전 행이 새 ETag 로 캐시되지 않도록 Primary 에서 조회
         try:
-            heritage = await self.heritage_repository.get_heritage_by_id(heritage_id)
+            async with use_primary(heritage_repository.db):
+                heritage = await heritage_repository.get_heritage_by_id(heritage_id)
             if not heritage:
                 raise HeritageNotFoundException(heritage_id)
         except SQLAlchemyError as e:
             logger.error(f"Database error in get_heritage_detail: {str(e)}")
             raise DatabaseConnectionError()
 
-        return HeritageDetailResponse(
+        detail = HeritageDetailResponse(
             id=heritage.id,
             image_url=heritage.image_url,
             name=heritage.name,
@@ -99,5 +402,40 @@ class HeritageService:
             sub_category1=heritage.sub_category1,
             sub_category2=heritage.sub_category2,
             era=heritage.era,
-            location=parse_location_for_detail(heritage.location),
+            location=heritage.location_detail or "",
         )
+        return detail, make_etag(detail.model_dump_json())
+
+
+# ORM 으로 수정/삭제된 문화재를 세션에 기록해두었다가 커밋 이후 상세 캐시에서 제거
+@event.listens_for(Heritage, "after_update")
+@event.listens_for(Heritage, "after_delete")
+def _on_heritage_changed(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("heritage_detail_invalidations", set()).add(target.id)
+
+
+# 문화재 유형 이름은 여러 문화재 상세에 포함되므로 변경 시 전체 제거
+@event.listens_for(HeritageType, "after_update")
+@event.listens_for(HeritageType, "after_delete")
+def _on_heritage_type_changed(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info["heritage_detail_invalidate_all"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_heritage_details(session):
+    heritage_ids = session.info.pop("heritage_detail_invalidations", set())
+    if session.info.pop("heritage_detail_invalidate_all", False):
+        heritage_detail_cache.clear()
+        return
+    for heritage_id in heritage_ids:
+        heritage_detail_cache.invalidate(heritage_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_heritage_detail_invalidations(session):
+    session.info.pop("heritage_detail_invalidations", None)
+    session.info.pop("heritage_detail_invalidate_all", None)
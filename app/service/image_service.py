@@ -1,8 +1,7 @@
 import logging
 import uuid
-from typing import List
+from typing import List, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 from fastapi import UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,6 +20,7 @@ from app.models.heritage.heritage_building_image import HeritageBuildingImage
 from app.repository.heritage_repository import HeritageRepository
 from app.repository.image_repository import ImageRepository
 from app.schemas.image import HeritageBuildingImageResponse
+from app.service.heritage_service import heritage_detail_cache
 from app.service.s3_service import S3Service
 
 # 로깅 설정
@@ -29,11 +29,17 @@ logger = logging.getLogger(__name__)
 
 
 class ImageService:
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        heritage_repository: Optional[HeritageRepository] = None,
+        image_repository: Optional[ImageRepository] = None,
+        s3_service: Optional[S3Service] = None,
+    ):
         self.db = db
-        self.heritage_repository = HeritageRepository(db)
-        self.image_repository = ImageRepository(db)
-        self.s3_service = S3Service()
+        self.heritage_repository = heritage_repository or HeritageRepository(db)
+        self.image_repository = image_repository or ImageRepository(db)
+        self.s3_service = s3_service or S3Service()
 
     # 이미지 업로드
     async def upload_image(self, file: UploadFile) -> str:
@@ -62,6 +68,8 @@ class ImageService:
         image_url = await self.upload_image(file)
         try:
             result = await self.image_repository.update_heritage_image(heritage_id, image_url)
+            # 변경된 이미지가 바로 보이도록 상세 조회 캐시 제거
+            heritage_detail_cache.invalidate(heritage_id)
             return result
         except HeritageNotFoundException:
             raise
@@ -0,0 +1,80 @@
+import logging
+from typing import List, Optional
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.error.heritage_exceptions import BuildingNotFoundException, TooManyRouteBuildingsException
+from app.repository.heritage_repository import HeritageRepository
+from app.schemas.heritage import CustomRouteResponse, HeritageBuildingInfo
+from app.service.geofence_service import GeofenceService
+from app.utils.route_planner import plan_visit_order, route_length
+
+logger = logging.getLogger(__name__)
+
+
+class RoutePlannerService:
+    """
+    사용자 지정 코스(RouteType.CUSTOM) 방문 순서 계획
+    - 문화재별 건축물 위치 / 거리 행렬은 지오펜스 색인을 함께 사용 (처음 요청 이후 DB 조회 없음)
+    - 최근접 이웃 + 2-opt 로 짧은 방문 순서를 계산하고, 출발 위치가 없으면 건축물 조합 단위로 결과를 캐시
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        heritage_repository: Optional[HeritageRepository] = None,
+        geofence_service: Optional[GeofenceService] = None,
+    ):
+        self.db = db
+        self.heritage_repository = heritage_repository or HeritageRepository(db)
+        self.geofence_service = geofence_service or GeofenceService(db, self.heritage_repository)
+
+    # 선택한 건축물의 방문 순서 계획 (사용자 위치 지정 시 해당 위치에서 출발)
+    async def plan(
+        self,
+        heritage_id: int,
+        building_ids: List[int],
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+    ) -> CustomRouteResponse:
+        building_ids = list(dict.fromkeys(building_ids))
+        if len(building_ids) > settings.ROUTE_PLAN_MAX_BUILDINGS:
+            raise TooManyRouteBuildingsException(settings.ROUTE_PLAN_MAX_BUILDINGS)
+
+        fence = await self.geofence_service.get_fence(heritage_id)
+        for building_id in building_ids:
+            if building_id not in fence.positions:
+                raise BuildingNotFoundException(building_id)
+
+        positions = np.array(sorted(fence.positions[building_id] for building_id in building_ids), dtype=np.int64)
+        matrix = fence.distance_matrix()[np.ix_(positions, positions)]
+
+        start_distances = None
+        if latitude is not None and longitude is not None:
+            start_distances = fence.distances(latitude, longitude)[positions]
+            order = plan_visit_order(matrix, start_distances)
+        else:
+            key = tuple(positions.tolist())
+            order = fence.route_plans.get(key)
+            if order is None:
+                metrics.incr("route_plan.cache_misses")
+                order = plan_visit_order(matrix)
+                fence.route_plans.set(key, order)
+            else:
+                metrics.incr("route_plan.cache_hits")
+
+        return CustomRouteResponse(
+            heritage_id=heritage_id,
+            distance=round(route_length(matrix, order, start_distances), 1),
+            buildings=[
+                HeritageBuildingInfo(
+                    building_id=int(fence.ids[position]),
+                    name=fence.names[position],
+                    coordinate=(float(fence.longitudes[position]), float(fence.latitudes[position])),
+                )
+                for position in positions[order]
+            ],
+        )
@@ -1,11 +1,11 @@
 import logging
 import uuid
 
-import boto3
 from botocore.exceptions import ClientError
 from fastapi import UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.clients import get_s3_client
 from app.core.config import settings
 from app.error.image_exception import S3UploadException
 
@@ -15,13 +15,9 @@ logger = logging.getLogger(__name__)
 
 
 class S3Service:
-    def __init__(self):
-        self.s3_client = boto3.client(
-            "s3",
-            endpoint_url=settings.NCP_ENDPOINT,
-            aws_access_key_id=settings.NCP_ACCESS_KEY,
-            aws_secret_access_key=settings.NCP_SECRET_KEY,
-        )
+    def __init__(self, s3_client=None):
+        # 애플리케이션 전역 S3 클라이언트 재사용
+        self.s3_client = s3_client or get_s3_client()
         self.bucket_name = settings.BUCKET_NAME
         self.cdn_domain = settings.CDN_DOMAIN
 
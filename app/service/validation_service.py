@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,9 +9,14 @@ from app.repository.heritage_repository import HeritageRepository
 
 
 class ValidationService:
-    def __init__(self, db: AsyncSession):
-        self.chat_repository = ChatRepository(db)
-        self.heritage_repository = HeritageRepository(db)
+    def __init__(
+        self,
+        db: AsyncSession,
+        chat_repository: Optional[ChatRepository] = None,
+        heritage_repository: Optional[HeritageRepository] = None,
+    ):
+        self.chat_repository = chat_repository or ChatRepository(db)
+        self.heritage_repository = heritage_repository or HeritageRepository(db)
 
     async def validate_session_and_building(self, session_id: int, building_id: int):
         chat_session = await self.chat_repository.get_chat_session(session_id)
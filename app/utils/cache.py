@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+# 크기 제한(LRU)과 만료 시간(TTL)을 가진 인메모리 캐시
+class TTLCache:
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            # 만료된 항목 제거
+            del self._entries[key]
+            return default
+
+        # 최근 사용 항목으로 이동
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        # 최대 크기 초과 시 가장 오래 사용되지 않은 항목부터 제거
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        entry = self._entries.pop(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        return entry[1]
+
+    def clear(self):
+        self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class StaleWhileRevalidateCache:
+    """
+    크기 제한(LRU) + 만료 시간(TTL) + stale-while-revalidate 읽기 캐시
+    - TTL 이내: 캐시 값 반환
+    - TTL 경과 후 stale 허용 시간 이내: 캐시 값을 즉시 반환하고 백그라운드에서 한 번만 갱신
+    - 그 이후 / 미존재: 로더 호출 (같은 키의 동시 요청은 한 번만 로드)
+    - {name}.cache_hits / cache_stale_hits / cache_misses 지표 기록
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl_seconds: float, stale_seconds: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._loading: Dict[Hashable, asyncio.Future] = {}
+        self._refreshing: Set[Hashable] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        # 무효화 시 증가 (무효화 이전에 시작된 로드 결과는 저장하지 않음)
+        self._generation = 0
+
+    # 캐시 조회 (없으면 load 로 적재, stale 값은 revalidate 로 백그라운드 갱신)
+    async def get(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+        revalidate: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> Any:
+        entry = self._entries.get(key, _MISSING)
+        if entry is not _MISSING:
+            stored_at, value = entry
+            age = time.monotonic() - stored_at
+            if age < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                metrics.incr(f"{self.name}.cache_hits")
+                return value
+            if age < self.ttl_seconds + self.stale_seconds:
+                self._entries.move_to_end(key)
+                metrics.incr(f"{self.name}.cache_stale_hits")
+                self._schedule_refresh(key, revalidate or load)
+                return value
+            del self._entries[key]
+
+        metrics.incr(f"{self.name}.cache_misses")
+        return await self._load(key, load)
+
+    async def _load(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        loading = self._loading.get(key)
+        if loading is not None:
+            return await asyncio.shield(loading)
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        generation = self._generation
+        try:
+            value = await load()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # 대기자가 없는 경우 "exception was never retrieved" 경고 방지
+                future.exception()
+            raise
+        else:
+            if generation == self._generation:
+                self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._loading.pop(key, None)
+
+    # 키별 백그라운드 갱신은 한 번만 실행 (태스크 참조는 완료 시까지 유지)
+    def _schedule_refresh(self, key: Hashable, load: Callable[[], Awaitable[Any]]):
+        if key in self._loading or key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                await self._load(key, load)
+            except Exception as e:
+                # 갱신 실패 시 stale 값을 유지하고 다음 요청에서 다시 시도
+                logger.warning(f"캐시 백그라운드 갱신 실패 (key={key}): {str(e)}")
+            finally:
+                self._refreshing.discard(key)
+
+        self._refreshing.add(key)
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    def set(self, key: Hashable, value: Any):
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+
+        # 최대 크기 초과 시 가장 오래 사용되지 않은 항목부터 제거
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    # 캐시 무효화 (진행 중인 로드 결과는 저장하지 않고 다음 요청에서 다시 적재)
+    def invalidate(self, key: Hashable):
+        self._generation += 1
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._generation += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,6 +1,7 @@
+import hashlib
 import logging
 import re
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from app.error.chat_exception import QuizParsingException
 
@@ -163,6 +164,14 @@ def parse_heritage_dist_range(distance_range: str) -> Tuple[float, float]:
     return ranges.get(distance_range, (0, float("inf")))
 
 
+# 지도 경계 상자 파싱 ("최소경도,최소위도,최대경도,최대위도" -> (min_lat, min_lon, max_lat, max_lon))
+def parse_bbox(bbox: str) -> Tuple[float, float, float, float]:
+    min_lon, min_lat, max_lon, max_lat = (float(value) for value in bbox.split(","))
+    if not (-90 <= min_lat <= max_lat <= 90 and -180 <= min_lon <= max_lon <= 180):
+        raise ValueError(f"경계 상자 범위가 올바르지 않습니다: {bbox}")
+    return min_lat, min_lon, max_lat, max_lon
+
+
 # 해시태그 처리 함수
 def process_hashtags(text):
     hashtags = []
@@ -192,3 +201,24 @@ def extract_hashtags(text):
     unique_hashtags = sorted(set(cleaned_hashtags))
 
     return unique_hashtags
+
+
+# 응답 본문 ETag 생성 (본문이 같으면 같은 값)
+def make_etag(body: str) -> str:
+    return f'"{hashlib.sha256(body.encode("utf-8")).hexdigest()[:32]}"'
+
+
+# If-None-Match 헤더가 ETag 와 일치하는지 확인 (약한 비교, 여러 값 / * 허용)
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+# 문화재 ID 목록 캐시 키 (순서 무관, 긴 목록도 고정 길이 blake2b 다이제스트로 충돌 없이 구분)
+def heritage_ids_key(heritage_ids: List[int]) -> bytes:
+    digest = hashlib.blake2b(digest_size=32)
+    for heritage_id in sorted(heritage_ids):
+        digest.update(heritage_id.to_bytes(8, "big", signed=True))
+    return digest.digest()
@@ -0,0 +1,33 @@
+import base64
+import json
+from typing import Sequence, Tuple
+
+from app.error.heritage_exceptions import InvalidCursorException
+from app.models.enums import SortOrder
+
+
+# 정렬 기준별 커서 키 개수 (distance: (거리 또는 None, ID), id: (ID,))
+def _key_length(sort_by: str) -> int:
+    return 2 if sort_by == "distance" else 1
+
+
+# 마지막 행의 정렬 키를 불투명한 커서 문자열로 인코딩
+def encode_cursor(sort_by: str, sort_order: SortOrder, keys: Sequence) -> str:
+    payload = json.dumps({"s": sort_by, "o": sort_order.name, "k": list(keys)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+# 커서 문자열 디코딩 (정렬 기준/순서가 요청과 다르면 예외)
+def decode_cursor(cursor: str, sort_by: str, sort_order: SortOrder) -> Tuple:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        keys = payload["k"]
+        if payload["s"] != sort_by or payload["o"] != sort_order.name or len(keys) != _key_length(sort_by):
+            raise InvalidCursorException()
+        if sort_by == "distance":
+            # 좌표가 없는 문화재(거리 NULL)에서 끝난 페이지는 거리 키가 None
+            return (float(keys[0]) if keys[0] is not None else None), int(keys[1])
+        return (int(keys[0]),)
+    except (ValueError, KeyError, TypeError):
+        raise InvalidCursorException()
@@ -0,0 +1,98 @@
+import json
+from enum import Enum
+from typing import Dict, List, Optional, Type, Union, get_args, get_origin
+
+import msgpack
+from fastapi import Response
+from pydantic import BaseModel
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+COLUMNAR_JSON_MEDIA_TYPE = "application/vnd.neonadeuli.columnar+json"
+
+# 정수 양자화 배율 (좌표: 1e-6 도 ≈ 0.1m, int32 범위 안 / 거리: 0.01 km, 응답 반올림 단위와 동일)
+COORDINATE_SCALE = 1_000_000
+DISTANCE_SCALE = 100
+
+# 필드별 정수 양자화 배율, 하위 목록 필드는 하위 규칙
+ColumnSpec = Dict[str, Union[int, "ColumnSpec"]]
+
+
+class ResponseFormat(Enum):
+    JSON = "application/json"
+    MSGPACK = MSGPACK_MEDIA_TYPE
+    COLUMNAR_JSON = COLUMNAR_JSON_MEDIA_TYPE
+
+
+# Accept 헤더로 응답 형식 결정 (명시적으로 요청한 압축 형식만 사용, 그 외는 JSON)
+def negotiate_response_format(accept: Optional[str]) -> ResponseFormat:
+    if accept:
+        media_types = {media_range.split(";")[0].strip().lower() for media_range in accept.split(",")}
+        if MSGPACK_MEDIA_TYPE in media_types or "application/x-msgpack" in media_types:
+            return ResponseFormat.MSGPACK
+        if COLUMNAR_JSON_MEDIA_TYPE in media_types:
+            return ResponseFormat.COLUMNAR_JSON
+    return ResponseFormat.JSON
+
+
+def _quantize(value, scale: int):
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        return [_quantize(element, scale) for element in value]
+    return int(round(value * scale))
+
+
+# 목록 필드의 항목 모델 (List[Model] / Optional[List[Model]])
+def _list_item_model(model: Type[BaseModel], key: str) -> Type[BaseModel]:
+    annotation = model.model_fields[key].annotation
+    while get_origin(annotation) is not list:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    return get_args(annotation)[0]
+
+
+# 객체 목록을 필드별 병렬 배열로 변환 (반복되는 키 제거, spec 에 지정한 필드는 정수 양자화)
+# - 컬럼은 항목 모델의 필드로 만들어 빈 목록도 {필드: []} 형태 유지
+def to_columns(items: List[dict], spec: ColumnSpec, item_model: Type[BaseModel]) -> Dict[str, list]:
+    columns = {key: [item[key] for item in items] for key in item_model.model_fields}
+    for key, rule in spec.items():
+        if isinstance(rule, dict):
+            nested_model = _list_item_model(item_model, key)
+            columns[key] = [to_columns(values, rule, nested_model) for values in columns[key]]
+        else:
+            columns[key] = [_quantize(value, rule) for value in columns[key]]
+    return columns
+
+
+def _flatten_scales(spec: ColumnSpec) -> Dict[str, int]:
+    scales = {}
+    for key, rule in spec.items():
+        if isinstance(rule, dict):
+            scales.update(_flatten_scales(rule))
+        else:
+            scales[key] = rule
+    return scales
+
+
+# 응답 모델을 압축 형식으로 변환 (list_specs: 병렬 배열로 바꿀 목록 필드 -> 항목 규칙)
+# - 클라이언트는 scales 의 배율로 나눠 원래 값 복원
+def to_compact_payload(model: BaseModel, list_specs: Dict[str, ColumnSpec]) -> dict:
+    payload = model.model_dump(mode="json")
+    for key, spec in list_specs.items():
+        payload[key] = to_columns(payload[key], spec, _list_item_model(type(model), key))
+    payload["scales"] = {key: scale for spec in list_specs.values() for key, scale in _flatten_scales(spec).items()}
+    return payload
+
+
+# 협상된 형식이 JSON 이 아니면 압축 응답 생성 (JSON 이면 None 을 반환해 기존 response_model 직렬화 사용)
+def compact_response(
+    model: BaseModel, response_format: ResponseFormat, list_specs: Dict[str, ColumnSpec]
+) -> Optional[Response]:
+    if response_format == ResponseFormat.JSON:
+        return None
+
+    payload = to_compact_payload(model, list_specs)
+    if response_format == ResponseFormat.MSGPACK:
+        content = msgpack.packb(payload, use_bin_type=True)
+    else:
+        content = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return Response(content=content, media_type=response_format.value, headers={"Vary": "Accept"})
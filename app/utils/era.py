@@ -0,0 +1,60 @@
+import re
+from typing import List, Optional
+
+from app.models.enums import EraCategory
+
+# 복수 시대 표기 구분자 (예: "고려시대~조선시대", "조선시대, 대한제국시대")
+_ERA_SEPARATOR = re.compile(r"\s*(?:[,/~·∼]|\s및\s|\s또는\s)\s*")
+
+# 시대 표기 키워드 -> 시대 분류 (앞에서부터 먼저 일치하는 키워드 사용, None 은 분류하지 않음)
+_ERA_KEYWORDS = [
+    ("통일신라", EraCategory.UNIFIED_SILLA),
+    ("고구려", EraCategory.GOGURYEO),
+    ("백제", EraCategory.BAEKJE),
+    ("신라", EraCategory.SILLA),
+    ("삼국", EraCategory.THREE_KINGDOMS),
+    ("삼한", EraCategory.SAMHAN),
+    ("발해", EraCategory.BALHAE),
+    ("고려", EraCategory.GORYEO),
+    ("고조선", None),
+    ("대한제국", EraCategory.KOREAN_EMPIRE),
+    ("일제", EraCategory.JAPANESE_COLONIAL),
+    ("조선", EraCategory.JOSEON),
+    ("청동기", EraCategory.BRONZE_AGE),
+    ("철기", EraCategory.IRON_AGE),
+    ("석기", EraCategory.STONE_AGE),
+    ("선사", EraCategory.PREHISTORIC),
+]
+
+
+def _match_keyword(part: str) -> Optional[EraCategory]:
+    for keyword, category in _ERA_KEYWORDS:
+        if keyword in part:
+            return category
+    return None
+
+
+# 시대 문자열을 시대 분류 목록으로 정규화 (대표 분류가 첫 번째, 분류 불가 시 빈 목록)
+def normalize_era(era: Optional[str]) -> List[EraCategory]:
+    if not era or not era.strip():
+        return []
+
+    era = era.strip()
+    categories: List[EraCategory] = []
+    # 기존 필터(era LIKE '%분류값')와 동일하게 분류값으로 끝나는 경우를 대표 분류로 사용
+    for category in EraCategory:
+        if category != EraCategory.ALL and era.endswith(category.value):
+            categories.append(category)
+            break
+
+    for part in _ERA_SEPARATOR.split(era):
+        category = _match_keyword(part)
+        if category is not None and category not in categories:
+            categories.append(category)
+    return categories
+
+
+# 대표 시대 분류 (분류 불가 시 None)
+def primary_era_category(era: Optional[str]) -> Optional[EraCategory]:
+    categories = normalize_era(era)
+    return categories[0] if categories else None
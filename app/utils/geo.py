@@ -0,0 +1,178 @@
+import math
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func
+
+# MySQL ST_Distance_Sphere 기본 지구 반지름 (km)
+EARTH_RADIUS_KM = 6370.986
+
+
+# 중심 좌표와 반경(km)으로 경계 상자 계산 (min_lat, min_lon, max_lat, max_lon)
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> Tuple[float, float, float, float]:
+    angular_radius = radius_km / EARTH_RADIUS_KM
+    delta_lat = math.degrees(angular_radius)
+    min_lat = latitude - delta_lat
+    max_lat = latitude + delta_lat
+
+    # 극점을 포함하거나 날짜 변경선을 넘는 경우 경도 전체 범위 사용
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), -180.0, min(max_lat, 90.0), 180.0
+
+    delta_lon = math.degrees(math.asin(min(1.0, math.sin(angular_radius) / math.cos(math.radians(latitude)))))
+    min_lon = longitude - delta_lon
+    max_lon = longitude + delta_lon
+    if min_lon < -180 or max_lon > 180:
+        return min_lat, -180.0, max_lat, 180.0
+
+    return min_lat, min_lon, max_lat, max_lon
+
+
+# SRID 4326 사용자 위치 POINT 표현식
+def point_expr(latitude: float, longitude: float):
+    return func.ST_SRID(func.POINT(longitude, latitude), 4326)
+
+
+# SRID 4326 경계 상자 POLYGON 표현식 (MBRContains 공간 인덱스 조회용)
+def bounding_box_expr(min_lat: float, min_lon: float, max_lat: float, max_lon: float):
+    polygon = (
+        f"POLYGON(({min_lon} {min_lat}, {max_lon} {min_lat}, {max_lon} {max_lat}, "
+        f"{min_lon} {max_lat}, {min_lon} {min_lat}))"
+    )
+    return func.ST_GeomFromText(polygon, 4326, "axis-order=long-lat")
+
+
+# 기준 좌표에서 여러 좌표까지의 거리(km) 벡터 계산 (ST_Distance_Sphere 와 동일한 하버사인 공식)
+def haversine_distances(latitude: float, longitude: float, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    lat1 = math.radians(latitude)
+    lat2 = np.radians(latitudes)
+    delta_lat = lat2 - lat1
+    delta_lon = np.radians(longitudes) - math.radians(longitude)
+    a = np.sin(delta_lat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(delta_lon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * 1000 * np.arcsin(np.sqrt(np.minimum(a, 1.0))) / 1000
+
+
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+# 좌표를 지정한 자릿수의 geohash 셀로 양자화 (자릿수 6 ≈ 1.2km x 0.6km, 7 ≈ 150m x 150m)
+def geohash_encode(latitude: float, longitude: float, precision: int) -> str:
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    geohash, bits, bit_count, even = [], 0, 0, True
+    while len(geohash) < precision:
+        value, value_range = (longitude, lon_range) if even else (latitude, lat_range)
+        mid = (value_range[0] + value_range[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            value_range[0] = mid
+        else:
+            value_range[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            geohash.append(_GEOHASH_BASE32[bits])
+            bits, bit_count = 0, 0
+    return "".join(geohash)
+
+
+# geohash 셀의 경계 상자 (min_lat, min_lon, max_lat, max_lon)
+def geohash_bounds(geohash: str) -> Tuple[float, float, float, float]:
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        bits = _GEOHASH_BASE32.index(char)
+        for shift in range(4, -1, -1):
+            value_range = lon_range if even else lat_range
+            mid = (value_range[0] + value_range[1]) / 2
+            if (bits >> shift) & 1:
+                value_range[0] = mid
+            else:
+                value_range[1] = mid
+            even = not even
+    return lat_range[0], lon_range[0], lat_range[1], lon_range[1]
+
+
+# polyline 값 하나의 최대 비트 수 (precision 6 의 경도 델타 ±3.6e8 도 32 비트 안에 들어감)
+_POLYLINE_MAX_BITS = 35
+
+
+# Google encoded polyline 의 부호 있는 정수 값을 순서대로 디코딩 (문자열을 한 번만 순회)
+# - max_values 를 넘으면 나머지를 디코딩하지 않고 중단
+def _iter_polyline_values(encoded: str, max_values: Optional[int] = None) -> Iterator[int]:
+    value, shift, count = 0, 0, 0
+    for char in encoded:
+        chunk = ord(char) - 63
+        if not 0 <= chunk < 64:
+            raise ValueError(f"polyline 에 허용되지 않는 문자가 포함되어 있습니다: {char!r}")
+        if shift >= _POLYLINE_MAX_BITS:
+            raise ValueError("polyline 값이 허용 범위를 벗어났습니다.")
+        value |= (chunk & 0x1F) << shift
+        shift += 5
+        if chunk < 0x20:
+            count += 1
+            if max_values is not None and count > max_values:
+                raise ValueError(f"좌표는 최대 {max_values // 2} 개까지 업로드할 수 있습니다.")
+            yield ~(value >> 1) if value & 1 else value >> 1
+            value, shift = 0, 0
+    if shift:
+        raise ValueError("polyline 이 중간에 끝났습니다.")
+
+
+# Google encoded polyline 을 위도 / 경도 배열로 디코딩 (precision: 소수점 자릿수, 일반적으로 5 또는 6)
+# - max_points 를 넘는 궤적은 전체를 디코딩하기 전에 거부
+def decode_polyline(
+    encoded: str, precision: int = 5, max_points: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    max_values = max_points * 2 if max_points is not None else None
+    values = np.fromiter(_iter_polyline_values(encoded, max_values), dtype=np.int64)
+    if len(values) % 2:
+        raise ValueError("polyline 좌표 쌍이 맞지 않습니다.")
+    return decode_deltas(values[0::2], values[1::2], 10**-precision)
+
+
+# 정수 델타 배열(첫 값은 절대 좌표)을 위도 / 경도 배열로 복원 (scale: 정수 1 단위의 도 값)
+def decode_deltas(lat_deltas, lon_deltas, scale: float = 1e-6) -> Tuple[np.ndarray, np.ndarray]:
+    try:
+        lat_deltas = np.asarray(lat_deltas, dtype=np.int64)
+        lon_deltas = np.asarray(lon_deltas, dtype=np.int64)
+    except OverflowError:
+        raise ValueError("델타 값이 허용 범위를 벗어났습니다.")
+    if lat_deltas.shape != lon_deltas.shape or lat_deltas.ndim != 1:
+        raise ValueError("위도 / 경도 델타 배열의 길이가 다릅니다.")
+
+    latitudes = np.cumsum(lat_deltas) * scale
+    longitudes = np.cumsum(lon_deltas) * scale
+    if (np.abs(latitudes) > 90).any() or (np.abs(longitudes) > 180).any():
+        raise ValueError("좌표 범위를 벗어난 값이 포함되어 있습니다.")
+    return latitudes, longitudes
+
+
+# 표본 격자 셀 크기 (도, span / grid_size 를 2 의 거듭제곱으로 올림)
+def sample_cell_size(span: float, grid_size: int) -> float:
+    return 2.0 ** math.ceil(math.log2(max(span, 1e-6) / grid_size))
+
+
+# 좌표를 격자 셀별로 고르게 최대 k 개 선택 (선택한 위치 배열, ID 오름차순)
+# - 셀마다 ID 순으로 순번을 매기고 (순번, ID) 순서로 채워 밀집 지역이 결과를 독차지하지 않도록 함
+# - 셀 크기는 span(도) / grid_size 를 2 의 거듭제곱으로 올림해 화면을 조금 옮겨도 같은 셀과 같은 표본 유지
+def stratified_sample(
+    ids: np.ndarray, latitudes: np.ndarray, longitudes: np.ndarray, span: float, grid_size: int, k: int
+) -> np.ndarray:
+    if len(ids) <= k:
+        return np.argsort(ids, kind="stable")
+
+    cell_size = sample_cell_size(span, grid_size)
+    lat_cells = np.floor(latitudes / cell_size).astype(np.int64)
+    lon_cells = np.floor(longitudes / cell_size).astype(np.int64)
+    order = np.lexsort((ids, lon_cells, lat_cells))
+
+    # 정렬된 순서에서 셀이 바뀌는 위치를 기준으로 셀 안 순번 계산
+    sorted_lat, sorted_lon = lat_cells[order], lon_cells[order]
+    starts = np.ones(len(order), dtype=bool)
+    starts[1:] = (sorted_lat[1:] != sorted_lat[:-1]) | (sorted_lon[1:] != sorted_lon[:-1])
+    indices = np.arange(len(order))
+    ranks = indices - np.maximum.accumulate(np.where(starts, indices, 0))
+
+    selected = order[np.lexsort((ids[order], ranks))[:k]]
+    return selected[np.argsort(ids[selected], kind="stable")]
@@ -0,0 +1,61 @@
+from typing import Optional
+
+# 한글 음절 범위와 초성/중성/종성 개수
+HANGUL_SYLLABLE_START, HANGUL_SYLLABLE_END = 0xAC00, 0xD7A3
+JUNGSUNG_COUNT, JONGSUNG_COUNT = 21, 28
+
+# 초성 (호환용 자모)
+CHOSUNG = list("ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ")
+CHOSUNG_SET = frozenset(CHOSUNG)
+# 중성 / 종성 (종성 첫 항목은 받침 없음)
+JUNGSUNG = list("ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ")
+JONGSUNG = [""] + list("ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+
+# 한글 완성형 음절 여부
+def is_hangul_syllable(char: str) -> bool:
+    return HANGUL_SYLLABLE_START <= ord(char) <= HANGUL_SYLLABLE_END
+
+
+# 초성 자모 여부 (ㄱ ~ ㅎ)
+def is_chosung(char: str) -> bool:
+    return char in CHOSUNG_SET
+
+
+# 음절의 초성 반환 (한글 음절이 아니면 None)
+def get_chosung(char: str) -> Optional[str]:
+    if not is_hangul_syllable(char):
+        return None
+    return CHOSUNG[(ord(char) - HANGUL_SYLLABLE_START) // (JUNGSUNG_COUNT * JONGSUNG_COUNT)]
+
+
+# 종성이 없는 음절 여부 (입력 중인 마지막 글자 판별용)
+def has_no_jongsung(char: str) -> bool:
+    return is_hangul_syllable(char) and (ord(char) - HANGUL_SYLLABLE_START) % JONGSUNG_COUNT == 0
+
+
+# 종성을 제외한 초성+중성 코드 (입력 중인 음절 비교용)
+def without_jongsung(char: str) -> str:
+    if not is_hangul_syllable(char):
+        return char
+    code = ord(char) - HANGUL_SYLLABLE_START
+    return chr(HANGUL_SYLLABLE_START + code - code % JONGSUNG_COUNT)
+
+
+# 문자열의 한글 음절을 초성으로 변환 (그 외 문자는 그대로 유지)
+def to_chosung(text: str) -> str:
+    return "".join(get_chosung(char) or char for char in text)
+
+
+# 문자열의 한글 음절을 초성/중성/종성 자모로 분해 (경복궁 -> ㄱㅕㅇㅂㅗㄱㄱㅜㅇ)
+def decompose_jamo(text: str) -> str:
+    jamo = []
+    for char in text:
+        if not is_hangul_syllable(char):
+            jamo.append(char)
+            continue
+        code = ord(char) - HANGUL_SYLLABLE_START
+        jamo.append(CHOSUNG[code // (JUNGSUNG_COUNT * JONGSUNG_COUNT)])
+        jamo.append(JUNGSUNG[code % (JUNGSUNG_COUNT * JONGSUNG_COUNT) // JONGSUNG_COUNT])
+        jamo.append(JONGSUNG[code % JONGSUNG_COUNT])
+    return "".join(jamo)
@@ -0,0 +1,65 @@
+from typing import List, Optional
+
+import numpy as np
+
+# 2-opt 개선 최대 반복 횟수 (건축물 50 곳 기준 보통 10 회 이내 수렴)
+_MAX_TWO_OPT_PASSES = 50
+
+
+# 거리 행렬로 짧은 방문 순서 계산 (최근접 이웃으로 초기 경로 생성 후 2-opt 개선, 출발 / 도착 지점 자유)
+# - start_distances: 사용자 위치에서 각 지점까지의 거리 (지정 시 사용자 위치에서 출발)
+# - 반환값은 거리 행렬의 행 번호 순서
+def plan_visit_order(matrix: np.ndarray, start_distances: Optional[np.ndarray] = None) -> List[int]:
+    count = len(matrix)
+    if count <= 1:
+        return list(range(count))
+
+    # 출발 지점(count)과 도착 지점(count + 1)을 가상 지점으로 추가 (출발 지점 미지정 시 거리 0)
+    extended = np.zeros((count + 2, count + 2), dtype=np.float64)
+    extended[:count, :count] = matrix
+    if start_distances is not None:
+        extended[count, :count] = extended[:count, count] = start_distances
+
+    path = [count, *_nearest_neighbour(matrix, start_distances), count + 1]
+    return _two_opt(extended, np.array(path))[1:-1].tolist()
+
+
+def _nearest_neighbour(matrix: np.ndarray, start_distances: Optional[np.ndarray]) -> List[int]:
+    # 출발 지점이 없으면 다른 지점들과 가장 멀리 떨어진 외곽 지점에서 시작
+    current = int(np.argmin(start_distances)) if start_distances is not None else int(np.argmax(matrix.sum(axis=1)))
+    visited = np.zeros(len(matrix), dtype=bool)
+    visited[current] = True
+    order = [current]
+    for _ in range(len(matrix) - 1):
+        distances = np.where(visited, np.inf, matrix[current])
+        current = int(np.argmin(distances))
+        visited[current] = True
+        order.append(current)
+    return order
+
+
+# 양 끝(가상 출발 / 도착 지점)을 고정하고 구간 뒤집기로 경로 길이가 줄지 않을 때까지 개선
+def _two_opt(matrix: np.ndarray, path: np.ndarray) -> np.ndarray:
+    last = len(path) - 2
+    for _ in range(_MAX_TWO_OPT_PASSES):
+        improved = False
+        for i in range(1, last):
+            # path[i..j] 구간을 뒤집을 때의 길이 변화를 j 에 대해 한 번에 계산
+            j = np.arange(i + 1, last + 1)
+            a, b, c, d = path[i - 1], path[i], path[j], path[j + 1]
+            delta = matrix[a, c] + matrix[b, d] - matrix[a, b] - matrix[c, d]
+            best = int(np.argmin(delta))
+            if delta[best] < -1e-9:
+                path[i : j[best] + 1] = path[i : j[best] + 1][::-1].copy()
+                improved = True
+        if not improved:
+            break
+    return path
+
+
+# 방문 순서의 총 이동 거리 (start_distances 지정 시 사용자 위치에서 첫 지점까지 포함)
+def route_length(matrix: np.ndarray, order: List[int], start_distances: Optional[np.ndarray] = None) -> float:
+    length = float(matrix[order[:-1], order[1:]].sum()) if len(order) > 1 else 0.0
+    if start_distances is not None and order:
+        length += float(start_distances[order[0]])
+    return length
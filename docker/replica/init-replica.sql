@@ -0,0 +1,13 @@
+-- Replica 최초 기동 시 Primary(db) 복제 설정
+CHANGE REPLICATION SOURCE TO
+    SOURCE_HOST = 'db',
+    SOURCE_PORT = 3306,
+    SOURCE_USER = 'root',
+    SOURCE_PASSWORD = '1234',
+    SOURCE_AUTO_POSITION = 1,
+    GET_SOURCE_PUBLIC_KEY = 1;
+
+START REPLICA;
+
+-- 애플리케이션의 실수로 인한 쓰기 방지
+SET PERSIST super_read_only = ON;
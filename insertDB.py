@@ -1,6 +1,9 @@
 import pymysql
 import pandas as pd
 
+from app.utils.common import parse_location_for_detail, parse_location_for_list
+from app.utils.era import normalize_era
+
 connection = pymysql.connect(
     host='localhost',
     user='root',
@@ -22,42 +25,59 @@ try:
                     name_hanja, 
                     description, 
                     location, 
+                    location_list, 
+                    location_detail, 
                     latitude, 
                     longitude, 
+                    location_point, 
                     category, 
                     sub_category1, 
                     sub_category2, 
                     sub_category3, 
                     era, 
+                    era_category, 
                     area_code, 
                     image_url, 
                     created_at,
                     updated_at
                 ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                    %s, %s, %s, %s, %s, %s, %s, %s, %s, ST_SRID(POINT(%s, %s), 4326),
+                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
                 )
                 """
 
+    era_insert_query = """
+                INSERT INTO heritage_eras (heritage_id, era_category) VALUES (%s, %s)
+                """
+
     # 각 행을 테이블에 삽입
     for index, row in data.iterrows():
+        # 시대 정규화 (대표 분류는 era_category, 복수 시대 포함 전체 분류는 heritage_eras)
+        era_categories = normalize_era(str(row['era']))
         cursor.execute(insert_query, (
         int(row['heritage_type_id']),
         str(row['name']),
         str(row['name_hanja']),
         str(row['description']),
         str(row['location']),
+        parse_location_for_list(str(row['location'])),
+        parse_location_for_detail(str(row['location'])),
         float(row['latitude']),
         float(row['longitude']),
+        float(row['longitude']),
+        float(row['latitude']),
         str(row['category']),
         str(row['sub_category1']),
         str(row['sub_category2']),
         str(row['sub_category3']),
         str(row['era']),
+        era_categories[0].name if era_categories else None,
         float(row['area_code']),
         str(row['image_url']),
         str(row['created_at']),
         str(row['updated_at'])
     ))
+        cursor.executemany(era_insert_query, [(cursor.lastrowid, category.name) for category in era_categories])
 
     # 변경사항 저장
     connection.commit()
@@ -11,14 +11,20 @@ from app.models.init import (
     ChatMessage,
     HeritageBuilding,
     HeritageBuildingImage,
+    HeritageEra,
     HeritageRoute,
     HeritageRouteBuilding,
     HeritageType,
 )
-from app.core.database import Base, engine
+from app.core.clients import close_clients, init_clients
+from app.core.compression import CompressionMiddleware
+from app.core.database import Base, engine, replica_router
 from app.core.config import settings
+from app.index.loader import load_heritage_indexes
+from app.service.heritage_route_service import warm_up_heritage_routes
 from app.router.api import api_router
 from contextlib import asynccontextmanager
+import asyncio
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -35,8 +41,25 @@ async def app_lifespan(app: FastAPI):
         # await conn.run_sync(Base.metadata.drop_all)
         # 모든 테이블 다시 생성
         await conn.run_sync(Base.metadata.create_all)
+    # S3 클라이언트, CLOVA 커넥션 풀 등 전역 클라이언트 생성
+    init_clients()
+    # 문화재 인메모리 인덱스 적재 (활성화된 인덱스가 있을 때만)
+    await load_heritage_indexes()
+    # 채팅 세션이 많은 문화재의 건축물 코스 캐시 미리 적재
+    await warm_up_heritage_routes()
+    # Replica 헬스 체크 (Replica 설정 시에만 실행)
+    replica_health_task = None
+    if replica_router.engines:
+        await replica_router.check_health()
+        replica_health_task = asyncio.create_task(
+            replica_router.run_health_checks(settings.REPLICA_HEALTH_CHECK_INTERVAL)
+        )
     yield
     # 애플리케이션 종료 시 실행될 로직 (필요한 경우)
+    if replica_health_task:
+        replica_health_task.cancel()
+    await replica_router.dispose()
+    close_clients()
 
 
 app = FastAPI(
@@ -50,6 +73,9 @@ app = FastAPI(
 )
 
 app.add_middleware(SessionMiddleware, secret_key=settings.BACKEND_SESSION_SECRET_KEY)
+# 응답 압축 (모바일 / 저속 회선 대비, 최소 크기 이상 응답만)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
 # Base.metadata.create_all(bind=engine)
 
 # Set All CORS enabled origins
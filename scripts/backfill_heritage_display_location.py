@@ -0,0 +1,55 @@
+"""
+heritages.location_list / location_detail 표시용 주소 컬럼 추가 및 기존 데이터 백필
+
+1. location_list / location_detail VARCHAR(255) 컬럼 추가 (NULL 허용)
+2. location 값을 parse_location_for_list / parse_location_for_detail 로 한 번 파싱해 백필
+
+실행: python -m scripts.backfill_heritage_display_location
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import text
+
+from app.core.database import engine
+from app.utils.common import parse_location_for_detail, parse_location_for_list
+from scripts.migrate_heritage_location_point import column_exists
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+
+async def main():
+    async with engine.begin() as conn:
+        for column, after in (("location_list", "location"), ("location_detail", "location_list")):
+            if not await column_exists(conn, "heritages", column):
+                logger.info(f"{column} 컬럼을 추가합니다.")
+                await conn.execute(text(f"ALTER TABLE heritages ADD COLUMN {column} VARCHAR(255) NULL AFTER {after}"))
+
+        result = await conn.execute(text("SELECT id, location FROM heritages ORDER BY id"))
+        rows = result.all()
+        for start in range(0, len(rows), BATCH_SIZE):
+            await conn.execute(
+                text(
+                    "UPDATE heritages SET location_list = :location_list, location_detail = :location_detail "
+                    "WHERE id = :id"
+                ),
+                [
+                    {
+                        "id": heritage_id,
+                        "location_list": parse_location_for_list(location),
+                        "location_detail": parse_location_for_detail(location),
+                    }
+                    for heritage_id, location in rows[start : start + BATCH_SIZE]
+                ],
+            )
+            logger.info(f"표시용 주소 백필 진행: {min(start + BATCH_SIZE, len(rows))} / {len(rows)} 건")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+"""
+heritages.era_category 시대 분류 컬럼 / heritage_eras 조인 테이블 추가 및 기존 데이터 백필
+
+1. era_category ENUM 컬럼(NULL 허용)과 인덱스, heritage_eras 테이블 생성
+2. era 문자열을 normalize_era 로 정규화해 대표 분류와 전체 분류 목록(복수 시대 포함) 백필
+3. 분류되지 않은 era 문자열을 빈도순으로 보고 (--report 지정 시 CSV 저장)
+
+실행: python -m scripts.backfill_heritage_era_category [--report unmapped_eras.csv]
+"""
+
+import argparse
+import asyncio
+import csv
+import logging
+from collections import Counter
+
+from sqlalchemy import text
+
+from app.core.database import engine
+from app.models.heritage.heritage import Heritage
+from app.models.heritage.heritage_era import HeritageEra
+from app.utils.era import normalize_era
+from scripts.migrate_heritage_location_point import column_exists, index_exists
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+REPORT_LIMIT = 30
+
+
+async def ensure_schema(conn):
+    if not await column_exists(conn, "heritages", "era_category"):
+        logger.info("era_category 컬럼을 추가합니다.")
+        column_type = Heritage.__table__.c.era_category.type.compile(dialect=conn.dialect)
+        await conn.execute(text(f"ALTER TABLE heritages ADD COLUMN era_category {column_type} NULL AFTER era"))
+
+    if not await index_exists(conn, "heritages", "ix_heritages_era_category"):
+        logger.info("era_category 인덱스를 생성합니다.")
+        await conn.execute(text("CREATE INDEX ix_heritages_era_category ON heritages (era_category)"))
+
+    await conn.run_sync(HeritageEra.__table__.create, checkfirst=True)
+
+
+async def backfill(conn) -> Counter:
+    unmapped = Counter()
+    result = await conn.execute(text("SELECT id, era FROM heritages ORDER BY id"))
+    rows = result.all()
+
+    await conn.execute(HeritageEra.__table__.delete())
+    for start in range(0, len(rows), BATCH_SIZE):
+        updates, era_rows = [], []
+        for heritage_id, era in rows[start : start + BATCH_SIZE]:
+            categories = normalize_era(era)
+            if not categories and era and era.strip():
+                unmapped[era.strip()] += 1
+            updates.append({"id": heritage_id, "era_category": categories[0].name if categories else None})
+            era_rows.extend({"heritage_id": heritage_id, "era_category": category} for category in categories)
+
+        await conn.execute(text("UPDATE heritages SET era_category = :era_category WHERE id = :id"), updates)
+        if era_rows:
+            await conn.execute(HeritageEra.__table__.insert(), era_rows)
+        logger.info(f"era_category 백필 진행: {min(start + BATCH_SIZE, len(rows))} / {len(rows)} 건")
+
+    multi_era = await conn.execute(
+        text("SELECT COUNT(*) FROM (SELECT heritage_id FROM heritage_eras GROUP BY heritage_id HAVING COUNT(*) > 1) t")
+    )
+    logger.info(f"복수 시대로 분류된 문화재: {multi_era.scalar()} 건")
+    return unmapped
+
+
+def report_unmapped(unmapped: Counter, report_path: str = None):
+    if not unmapped:
+        logger.info("분류되지 않은 era 문자열이 없습니다.")
+        return
+
+    logger.warning(f"분류되지 않은 era 문자열: {len(unmapped)} 종, {sum(unmapped.values())} 건")
+    for era, count in unmapped.most_common(REPORT_LIMIT):
+        logger.warning(f"  {era!r}: {count} 건")
+
+    if report_path:
+        with open(report_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["era", "count"])
+            writer.writerows(unmapped.most_common())
+        logger.info(f"미분류 era 보고서 저장: {report_path}")
+
+
+async def main(report_path: str = None):
+    async with engine.begin() as conn:
+        await ensure_schema(conn)
+        unmapped = await backfill(conn)
+
+    await engine.dispose()
+    report_unmapped(unmapped, report_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--report", help="미분류 era 문자열 CSV 저장 경로")
+    args = parser.parse_args()
+    asyncio.run(main(args.report))
@@ -0,0 +1,90 @@
+"""
+문화재 리스트 페이지(limit=100) 응답 구성 CPU 비용 벤치마크 (DB 불필요)
+
+- before: 행마다 parse_location_for_list 로 location 을 정규식 파싱
+- after: 저장 시 계산된 location_list 컬럼 값을 그대로 사용
+실행: python -m scripts.benchmark_display_location
+"""
+
+import random
+import timeit
+from types import SimpleNamespace
+
+from app.schemas.heritage import HeritageListResponse
+from app.utils.common import parse_location_for_list
+
+LIMIT = 100
+ITERATIONS = 2000
+
+LOCATIONS = [
+    "서울특별시 종로구 사직로 161 (세종로)",
+    "경상북도 경주시 진현동 15-1 / 불국사",
+    "충청남도 부여군 부여읍 관북리 산 1-1",
+    "전라남도 순천시 송광면 송광사안길 100, 송광사",
+    "강원특별자치도 강릉시 율곡로3139번길 24 (죽헌동)",
+    "경기도 수원시 팔달구 정조로 825\t(남창동)",
+    "경상남도 합천군 가야면 해인사길 122",
+    "인천광역시 강화군 화도면 사기리 산 1",
+]
+
+
+def make_rows():
+    rng = random.Random(42)
+    rows = []
+    for heritage_id in range(1, LIMIT + 1):
+        location = rng.choice(LOCATIONS)
+        rows.append(
+            SimpleNamespace(
+                id=heritage_id,
+                name=f"문화재{heritage_id}",
+                location=location,
+                location_list=parse_location_for_list(location),
+                image_url=None,
+                distance=rng.uniform(0, 300),
+            )
+        )
+    return rows
+
+
+def build_before(rows):
+    return [
+        HeritageListResponse(
+            id=row.id,
+            name=row.name,
+            location=parse_location_for_list(row.location),
+            heritage_type="사적",
+            image_url=row.image_url or "",
+            distance=round(row.distance, 1),
+        )
+        for row in rows
+    ]
+
+
+def build_after(rows):
+    return [
+        HeritageListResponse(
+            id=row.id,
+            name=row.name,
+            location=row.location_list or "",
+            heritage_type="사적",
+            image_url=row.image_url or "",
+            distance=round(row.distance, 1),
+        )
+        for row in rows
+    ]
+
+
+def main():
+    rows = make_rows()
+    assert [item.location for item in build_before(rows)] == [item.location for item in build_after(rows)]
+
+    for name, build in (("before", build_before), ("after", build_after)):
+        elapsed = timeit.timeit(lambda build=build: build(rows), number=ITERATIONS)
+        print(f"{name:>6}: {elapsed / ITERATIONS * 1_000_000:10.1f} us / page (limit={LIMIT}, {ITERATIONS} 회)")
+
+    parse_elapsed = timeit.timeit(lambda: [parse_location_for_list(row.location) for row in rows], number=ITERATIONS)
+    print(f" parse: {parse_elapsed / ITERATIONS * 1_000_000:10.1f} us / page (location 파싱만)")
+
+
+if __name__ == "__main__":
+    main()
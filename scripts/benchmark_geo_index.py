@@ -0,0 +1,73 @@
+"""
+인메모리 지리 인덱스 문화재 리스트 조회 벤치마크 (2만 건 합성 데이터, DB 불필요)
+
+- 조회 1건당 CPU 시간(ms)을 필터 조합별로 측정
+실행: python -m scripts.benchmark_geo_index
+"""
+
+import random
+import time
+
+from app.index.catalog import HeritageRecord
+from app.index.geo_index import GeoIndex
+from app.models.enums import EraCategory, SortOrder
+
+ROW_COUNT = 20_000
+QUERY_COUNT = 1_000
+
+# 대한민국 대략적인 범위
+MIN_LAT, MAX_LAT = 33.1, 38.6
+MIN_LON, MAX_LON = 124.6, 131.9
+
+ERAS = ["조선시대", "고려시대", "삼국:신라", "통일신라", "삼국:백제", None]
+
+CASES = [
+    {},
+    {"sort_by": "distance"},
+    {"sort_by": "distance", "sort_order": SortOrder.DESC},
+    {"sort_by": "distance", "distance_range": "0-0.5"},
+    {"sort_by": "distance", "distance_range": "1-10"},
+    {"sort_by": "distance", "distance_range": "10-100", "heritage_type": [1, 2, 3]},
+    {"distance_range": "100-1000", "era_category": EraCategory.JOSEON},
+    {"area_code": 11, "sort_by": "distance"},
+]
+
+
+def make_records():
+    rng = random.Random(42)
+    return [
+        HeritageRecord(
+            id=heritage_id,
+            name=f"문화재{heritage_id}",
+            name_hanja=None,
+            location_list=None,
+            latitude=rng.uniform(MIN_LAT, MAX_LAT),
+            longitude=rng.uniform(MIN_LON, MAX_LON),
+            heritage_type_id=rng.randint(1, 16),
+            heritage_type_name=None,
+            area_code=float(rng.choice([11, 21, 22, 23, 31, 32, 33, 34, 35, 36, 37, 38, 39])),
+            era=rng.choice(ERAS),
+            image_url=None,
+        )
+        for heritage_id in range(1, ROW_COUNT + 1)
+    ]
+
+
+def main():
+    index = GeoIndex(cell_size=0.1)
+    index.rebuild(make_records())
+
+    rng = random.Random(7)
+    points = [(rng.uniform(35.0, 37.7), rng.uniform(126.5, 129.2)) for _ in range(QUERY_COUNT)]
+
+    print(f"rows={ROW_COUNT}, queries={QUERY_COUNT}")
+    for case in CASES:
+        started = time.process_time()
+        for latitude, longitude in points:
+            index.search(10, 0, latitude, longitude, **case)
+        elapsed_ms = (time.process_time() - started) * 1000 / QUERY_COUNT
+        print(f"{case or '(필터 없음)'}: {elapsed_ms:.3f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
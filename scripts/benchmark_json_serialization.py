@@ -0,0 +1,183 @@
+"""
+응답 / 대화 내용 JSON 직렬화 벤치마크 (DB 불필요)
+
+1. 리스트(100 건) / 상세 / 채팅 세션 생성 엔드포인트 요청당 시간
+   - 서비스는 미리 만든 응답 모델을 반환하도록 의존성 교체 (라우터 + 직렬화 경로만 측정)
+   - FAST_JSON_RESPONSE_ENABLED 끔(response_model 재검증 + 직렬화) / 켬(model_response) 비교
+2. 같은 응답 모델의 직렬화 단계만 비교
+   - jsonable_encoder + json.dumps (구버전 FastAPI 기본 경로) / TypeAdapter 재검증 + dump_json / model_dump_json
+3. 채팅 대화 내용(full_conversation) json vs orjson 역직렬화 / 직렬화
+실행: python -m scripts.benchmark_json_serialization
+"""
+
+import json
+import logging
+import time
+from datetime import datetime
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+from app.core.deps import get_chat_service, get_heritage_service
+from app.core.responses import FastJSONResponse
+from app.schemas.chat import ChatSessionCreateResponse
+from app.schemas.heritage import (
+    HeritageBuildingInfo,
+    HeritageDetailResponse,
+    HeritageListResponse,
+    HeritageRouteInfo,
+    PaginatedHeritageResponse,
+)
+from main import app
+
+REQUEST_REPEAT = 2_000
+SERIALIZE_REPEAT = 2_000
+CONVERSATION_MESSAGES = 200
+
+
+def make_models():
+    heritage_list = PaginatedHeritageResponse(
+        items=[
+            HeritageListResponse(
+                id=heritage_id,
+                name=f"서울 문화재 {heritage_id}호",
+                location="서울 종로구",
+                heritage_type="국가지정문화재",
+                image_url=f"https://cdn.example.com/heritages/{heritage_id}.jpg",
+                distance=1.23,
+            )
+            for heritage_id in range(1, 101)
+        ],
+        total_count=15_000,
+        page=1,
+        limit=100,
+    )
+    detail = HeritageDetailResponse(
+        id=1,
+        name="경복궁",
+        name_hanja="景福宮",
+        description="조선 왕조 제일의 법궁. " * 150,
+        heritage_type="사적",
+        era="조선시대",
+        location="서울 종로구 사직로 161",
+    )
+    session = ChatSessionCreateResponse(
+        session_id=1,
+        start_time=datetime.now(),
+        created_at=datetime.now(),
+        heritage_id=1,
+        heritage_name="경복궁",
+        routes=[
+            HeritageRouteInfo(
+                route_id=route_id,
+                name=f"추천 코스 {route_id}",
+                buildings=[
+                    HeritageBuildingInfo(
+                        building_id=building_id, name=f"건축물 {building_id}", coordinate=(126.97, 37.57)
+                    )
+                    for building_id in range(1, 21)
+                ],
+            )
+            for route_id in range(1, 4)
+        ],
+    )
+    return heritage_list, detail, session
+
+
+class StubHeritageService:
+    def __init__(self, heritage_list, detail):
+        self.heritage_list = heritage_list
+        self.detail = detail
+
+    async def get_heritages(self, *args):
+        return self.heritage_list
+
+    async def get_heritage_detail(self, heritage_id: int):
+        return self.detail, '"benchmark"'
+
+
+class StubChatService:
+    def __init__(self, session):
+        self.session = session
+
+    async def create_chat_session(self, user_id: int, heritage_id: int):
+        return self.session
+
+
+def measure(function, repeat: int) -> float:
+    function()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat * 1_000_000
+
+
+def benchmark_endpoints(heritage_list, detail, session):
+    app.dependency_overrides[get_heritage_service] = lambda: StubHeritageService(heritage_list, detail)
+    app.dependency_overrides[get_chat_service] = lambda: StubChatService(session)
+    client = TestClient(app)
+    prefix = settings.API_V1_STR
+    requests = [
+        (
+            "리스트 100 건",
+            lambda: client.get(f"{prefix}/heritages/lists?user_latitude=37.5&user_longitude=127&limit=100"),
+        ),
+        ("상세", lambda: client.get(f"{prefix}/heritages/1/details")),
+        ("채팅 세션 생성", lambda: client.post(f"{prefix}/chat/sessions", json={"user_id": 1, "heritage_id": 1})),
+    ]
+
+    print("엔드포인트 요청당 시간 (TestClient 왕복 포함)")
+    for title, request in requests:
+        results = []
+        for enabled in (False, True):
+            settings.FAST_JSON_RESPONSE_ENABLED = enabled
+            assert request().status_code == 200
+            results.append(measure(request, REQUEST_REPEAT))
+        print(f"  {title:12s} response_model {results[0]:8.1f} µs -> model_response {results[1]:8.1f} µs")
+    app.dependency_overrides.clear()
+
+
+def benchmark_serialization(models):
+    print("응답 모델 직렬화 시간")
+    for title, model in zip(("리스트 100 건", "상세", "채팅 세션 생성"), models, strict=True):
+        adapter = TypeAdapter(type(model))
+        legacy = measure(lambda m=model: json.dumps(jsonable_encoder(m)).encode("utf-8"), SERIALIZE_REPEAT // 10)
+        validated = measure(lambda m=model, a=adapter: a.dump_json(a.validate_python(m)), SERIALIZE_REPEAT)
+        direct = measure(lambda m=model: FastJSONResponse(m).body, SERIALIZE_REPEAT)
+        print(
+            f"  {title:12s} jsonable_encoder+json {legacy:8.1f} µs / "
+            f"재검증+dump_json {validated:6.1f} µs / FastJSONResponse {direct:6.1f} µs"
+        )
+
+
+def benchmark_conversation():
+    conversation = [
+        {"role": "user" if index % 2 else "assistant", "content": "경복궁 근정전에 대해 자세히 알려주세요. " * 10}
+        for index in range(CONVERSATION_MESSAGES)
+    ]
+    stored = json.dumps(conversation, ensure_ascii=False)
+    repeat = SERIALIZE_REPEAT // 10
+    print(f"대화 내용 {CONVERSATION_MESSAGES} 건")
+    print(
+        f"  읽기 json.loads {measure(lambda: json.loads(stored), repeat):8.1f} µs / orjson.loads {measure(lambda: orjson.loads(stored), repeat):8.1f} µs"
+    )
+    print(
+        f"  쓰기 json.dumps {measure(lambda: json.dumps(conversation, ensure_ascii=False), repeat):8.1f} µs / "
+        f"orjson.dumps {measure(lambda: orjson.dumps(conversation).decode('utf-8'), repeat):8.1f} µs"
+    )
+
+
+def main():
+    # 요청마다 남는 httpx 로그 제외
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    models = make_models()
+    benchmark_endpoints(*models)
+    benchmark_serialization(models)
+    benchmark_conversation()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+문화재 리스트 조회 ORM 엔티티 vs 컬럼 프로젝션 메모리/지연 시간 벤치마크 (SQLite 메모리 DB, MySQL 불필요)
+
+- before: select(Heritage) + joinedload(heritage_types) 로 description 을 포함한 전체 엔티티를 적재
+- after: HeritageRepository._search_query 의 컬럼 프로젝션 (id, name, location_list, 유형명, image_url, 거리)
+- 페이지(limit=100)마다 새 세션으로 조회 후 HeritageListResponse 까지 생성
+실행: python -m scripts.benchmark_list_projection
+"""
+
+import math
+import random
+import re
+import time
+import tracemalloc
+import warnings
+
+from sqlalchemy import asc, create_engine, event, insert
+from sqlalchemy.exc import SAWarning
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.enums import HeritageTypeName, SortOrder
+from app.models.init import Heritage, HeritageType
+from app.models.question import RecommendedQuestion  # noqa: F401 (관계 매퍼 구성용)
+from app.models.quiz import Quiz  # noqa: F401 (관계 매퍼 구성용)
+from app.models.types import Point
+from app.repository.heritage_repository import HeritageRepository
+from app.schemas.heritage import HeritageListResponse
+
+ROW_COUNT = 20_000
+DESCRIPTION_LENGTH = 3_000
+LIMIT = 100
+PAGE_COUNT = 200
+USER_LATITUDE, USER_LONGITUDE = 37.5796, 126.9770
+
+_POINT_WKT = re.compile(r"POINT\((\S+) (\S+)\)")
+
+
+# SQLite 에서는 POINT 컬럼을 WKT 문자열로 저장
+@compiles(Point, "sqlite")
+def _compile_point(type_, compiler, **kw):
+    return "TEXT"
+
+
+def _distance_sphere(a: str, b: str) -> float:
+    lon1, lat1 = map(float, _POINT_WKT.match(a).groups())
+    lon2, lat2 = map(float, _POINT_WKT.match(b).groups())
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 6370986 * math.asin(math.sqrt(h))
+
+
+def create_database():
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def register_functions(dbapi_connection, connection_record):
+        dbapi_connection.create_function("ST_GeomFromText", 3, lambda wkt, srid, options: wkt)
+        dbapi_connection.create_function("ST_AsText", 2, lambda wkt, options: wkt)
+        dbapi_connection.create_function("POINT", 2, lambda longitude, latitude: f"POINT({longitude} {latitude})")
+        dbapi_connection.create_function("ST_SRID", 2, lambda point, srid: point)
+        dbapi_connection.create_function("st_distance_sphere", 2, _distance_sphere)
+
+    HeritageType.metadata.create_all(engine, tables=[HeritageType.__table__, Heritage.__table__])
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(HeritageType.__table__),
+            [
+                {"type_id": type_id, "name": type_name.value, "type_name": type_name}
+                for type_id, type_name in enumerate(HeritageTypeName, start=1)
+            ],
+        )
+        rows = []
+        for heritage_id in range(1, ROW_COUNT + 1):
+            latitude, longitude = rng.uniform(33.0, 38.5), rng.uniform(125.0, 130.0)
+            rows.append(
+                {
+                    "id": heritage_id,
+                    "heritage_type_id": rng.randint(1, len(HeritageTypeName)),
+                    "name": f"문화재{heritage_id}",
+                    "description": "가" * DESCRIPTION_LENGTH,
+                    "location": "서울특별시 종로구 사직로 161 (세종로)",
+                    "location_list": "서울특별시 종로구 사직로",
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "location_point": (longitude, latitude),
+                    "era": "조선시대",
+                }
+            )
+        conn.execute(insert(Heritage.__table__), rows)
+    return engine
+
+
+# 기존 방식: 전체 엔티티 + 유형 joinedload
+def fetch_before(session: Session, offset: int):
+    distance_expr = HeritageRepository._distance_expr(USER_LATITUDE, USER_LONGITUDE)
+    query = (
+        select(Heritage)
+        .options(joinedload(Heritage.heritage_types))
+        .add_columns(distance_expr)
+        .order_by(asc(Heritage.id))
+        .limit(LIMIT)
+        .offset(offset)
+    )
+    return [
+        HeritageListResponse(
+            id=heritage.id,
+            name=heritage.name,
+            location=heritage.location_list or "",
+            heritage_type=(heritage.heritage_types.name if heritage.heritage_types else "Unknown"),
+            image_url=heritage.image_url or "",
+            distance=round(distance, 1) if distance is not None else None,
+        )
+        for heritage, distance in session.execute(query).unique().all()
+    ]
+
+
+# 변경 방식: 리스트 응답 컬럼만 프로젝션
+def fetch_after(session: Session, offset: int):
+    query = HeritageRepository._search_query(
+        LIMIT, offset, USER_LATITUDE, USER_LONGITUDE, None, None, None, None, None, "id", SortOrder.ASC, None, None
+    )
+    return [
+        HeritageListResponse(
+            id=row.id,
+            name=row.name,
+            location=row.location_list or "",
+            heritage_type=row.heritage_type_name or "Unknown",
+            image_url=row.image_url or "",
+            distance=round(row.distance, 1) if row.distance is not None else None,
+        )
+        for row in session.execute(query).all()
+    ]
+
+
+def measure(engine, fetch, offsets):
+    started = time.perf_counter()
+    for offset in offsets:
+        with Session(engine) as session:
+            fetch(session, offset)
+    elapsed = (time.perf_counter() - started) / len(offsets)
+
+    tracemalloc.start()
+    with Session(engine) as session:
+        fetch(session, offsets[0])
+        _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    # SQLite DECIMAL 변환 경고 무시 (위도/경도는 비교에 사용하지 않음)
+    warnings.filterwarnings("ignore", category=SAWarning)
+    engine = create_database()
+    rng = random.Random(7)
+    offsets = [rng.randrange(0, ROW_COUNT - LIMIT) for _ in range(PAGE_COUNT)]
+    with Session(engine) as session:
+        assert fetch_before(session, offsets[0]) == fetch_after(session, offsets[0])
+
+    for name, fetch in (("before", fetch_before), ("after", fetch_after)):
+        elapsed, peak = measure(engine, fetch, offsets)
+        print(f"{name:>6}: {elapsed * 1000:8.2f} ms / page, peak {peak / 1024:8.1f} KiB (limit={LIMIT})")
+
+
+if __name__ == "__main__":
+    main()
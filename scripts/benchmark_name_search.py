@@ -0,0 +1,84 @@
+"""
+문화재 이름 검색 벤치마크 (10만 건 합성 이름, DB 불필요)
+
+- before: LIKE '%검색어%' 와 동일하게 모든 이름을 순회하며 부분 문자열 비교 (full scan)
+- after: bigram 역색인 교집합 후보 + 부분 문자열 재검증 + 일치 품질 정렬
+실행: python -m scripts.benchmark_name_search
+"""
+
+import random
+import time
+
+from app.index.catalog import HeritageRecord
+from app.index.name_index import NameIndex
+
+ROW_COUNT = 100_000
+QUERY_COUNT = 200
+
+PREFIXES = ["서울", "경주", "안동", "공주", "부여", "전주", "강릉", "수원", "나주", "합천"]
+STEMS = ["경복", "불국", "석굴", "해인", "송광", "화엄", "법주", "부석", "창덕", "덕수", "운주", "통도"]
+SUFFIXES = ["궁", "사", "암", "탑", "전", "각", "루", "정", "비", "묘", "성", "당"]
+DETAILS = ["", " 삼층석탑", " 대웅전", " 석조여래좌상", " 당간지주", " 목조건물", " 부도", " 석등"]
+
+
+def make_records():
+    rng = random.Random(42)
+    return [
+        HeritageRecord(
+            id=heritage_id,
+            name=f"{rng.choice(PREFIXES)} {rng.choice(STEMS)}{rng.choice(SUFFIXES)}{rng.choice(DETAILS)}",
+            name_hanja=None,
+            location_list=None,
+            latitude=None,
+            longitude=None,
+            heritage_type_id=None,
+            heritage_type_name=None,
+            area_code=None,
+            era=None,
+            image_url=None,
+        )
+        for heritage_id in range(1, ROW_COUNT + 1)
+    ]
+
+
+# LIKE '%검색어%' 전체 스캔 (ID 순)
+def like_search(records, query: str):
+    query = query.casefold()
+    return [record.id for record in records if query in record.name.casefold()]
+
+
+def measure(label: str, search, queries):
+    started = time.perf_counter()
+    match_count = 0
+    for query in queries:
+        match_count += len(search(query))
+    elapsed_ms = (time.perf_counter() - started) * 1000 / len(queries)
+    print(f"{label}: {elapsed_ms:.3f} ms/query (평균 {match_count / len(queries):.0f} 건 일치)")
+
+
+def main():
+    records = make_records()
+    index = NameIndex()
+    started = time.perf_counter()
+    index.rebuild(records)
+    print(f"rows={ROW_COUNT}, 색인 구성 {time.perf_counter() - started:.2f} s")
+
+    rng = random.Random(7)
+    queries = [
+        rng.choice([f"{stem}{suffix}", f"{stem}{suffix}{detail}", stem + suffix[:1]])
+        for stem, suffix, detail in (
+            (rng.choice(STEMS), rng.choice(SUFFIXES), rng.choice(DETAILS)) for _ in range(QUERY_COUNT)
+        )
+    ]
+
+    # 결과 집합이 동일한지 확인 (색인 검색은 공백을 무시하므로 공백 없는 검색어 기준)
+    for query in queries[:20]:
+        if " " not in query:
+            assert sorted(index.search(query)) == like_search(records, query), f"결과 불일치: {query}"
+
+    measure("LIKE 전체 스캔", lambda query: like_search(records, query), queries)
+    measure("bigram 색인", index.search, queries)
+
+
+if __name__ == "__main__":
+    main()
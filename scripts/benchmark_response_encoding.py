@@ -0,0 +1,115 @@
+"""
+문화재 리스트 / 클러스터 / 코스 응답 JSON vs 컬럼형 JSON vs MessagePack 크기 및 직렬화 시간 벤치마크
+
+- json: FastAPI 기본 경로 (jsonable_encoder + JSONResponse)
+- columnar-json / msgpack: app.utils.encoding.compact_response (병렬 배열 + 정수 양자화 좌표/거리)
+- 리스트 100 건 페이지, 지도 클러스터 500 개, 사용자 지정 코스 건축물 50 곳 기준
+실행: python -m scripts.benchmark_response_encoding
+"""
+
+import random
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.router.v1.heritage import CUSTOM_ROUTE_COLUMNS, HERITAGE_CLUSTER_COLUMNS, HERITAGE_LIST_COLUMNS
+from app.schemas.heritage import (
+    CustomRouteResponse,
+    HeritageBuildingInfo,
+    HeritageClusterListResponse,
+    HeritageClusterResponse,
+    HeritageListResponse,
+    PaginatedHeritageResponse,
+)
+from app.utils.encoding import ResponseFormat, compact_response
+
+REPEAT = 2_000
+
+
+def make_payloads():
+    rng = random.Random(42)
+    heritage_list = PaginatedHeritageResponse(
+        items=[
+            HeritageListResponse(
+                id=heritage_id,
+                name=f"서울 문화재 {heritage_id}호",
+                location="서울 종로구",
+                heritage_type="국가지정문화재",
+                image_url=f"https://cdn.example.com/heritages/{heritage_id}.jpg",
+                distance=round(rng.uniform(0, 10), 2),
+            )
+            for heritage_id in range(1, 101)
+        ],
+        total_count=15_000,
+        page=1,
+        limit=100,
+        next_cursor="eyJrIjpbMS4yMywxMDBdfQ",
+    )
+    clusters = HeritageClusterListResponse(
+        zoom=8,
+        total_count=15_000,
+        clusters=[
+            HeritageClusterResponse(
+                latitude=round(rng.uniform(33.0, 38.5), 6),
+                longitude=round(rng.uniform(125.0, 130.0), 6),
+                count=rng.randint(2, 200),
+            )
+            for _ in range(500)
+        ],
+    )
+    route = CustomRouteResponse(
+        heritage_id=1,
+        distance=1234.5,
+        buildings=[
+            HeritageBuildingInfo(
+                building_id=building_id,
+                name=f"건축물 {building_id}",
+                coordinate=(round(rng.uniform(126.97, 126.98), 8), round(rng.uniform(37.57, 37.58), 8)),
+            )
+            for building_id in range(1, 51)
+        ],
+    )
+    return [
+        ("리스트 100 건", heritage_list, HERITAGE_LIST_COLUMNS),
+        ("클러스터 500 개", clusters, HERITAGE_CLUSTER_COLUMNS),
+        ("코스 건축물 50 곳", route, CUSTOM_ROUTE_COLUMNS),
+    ]
+
+
+def encode_json(model, list_specs) -> bytes:
+    return JSONResponse(jsonable_encoder(model)).body
+
+
+def encode_compact(response_format: ResponseFormat):
+    def encode(model, list_specs) -> bytes:
+        return compact_response(model, response_format, list_specs).body
+
+    return encode
+
+
+def measure(encode, model, list_specs):
+    body = encode(model, list_specs)
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        encode(model, list_specs)
+    return len(body), (time.perf_counter() - started) / REPEAT * 1_000_000
+
+
+def main():
+    encoders = [
+        ("json", encode_json),
+        ("columnar-json", encode_compact(ResponseFormat.COLUMNAR_JSON)),
+        ("msgpack", encode_compact(ResponseFormat.MSGPACK)),
+    ]
+    for title, model, list_specs in make_payloads():
+        print(title)
+        base_size = None
+        for name, encode in encoders:
+            size, elapsed = measure(encode, model, list_specs)
+            base_size = base_size or size
+            print(f"  {name:14s} {size:8,d} bytes ({size / base_size:5.1%})  {elapsed:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
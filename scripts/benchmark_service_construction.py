@@ -0,0 +1,59 @@
+"""
+요청 단위 서비스 생성 비용 마이크로 벤치마크
+
+- before: 요청마다 boto3 S3 클라이언트와 Repository 를 중복 생성하던 기존 방식
+- after: 전역 S3 클라이언트 / CLOVA Executor 를 재사용하고 Repository 를 한 번씩만 생성하는 방식
+
+실행: python -m scripts.benchmark_service_construction
+"""
+
+import timeit
+from unittest.mock import AsyncMock
+
+from app.core.clients import _create_s3_client, init_clients
+from app.core.deps import get_chat_service
+from app.repository.chat_repository import ChatRepository
+from app.repository.heritage_repository import HeritageRepository
+from app.repository.user_repository import UserRepository
+from app.service.chat_service import ChatService
+from app.service.clova_service import ClovaService
+from app.service.s3_service import S3Service
+from app.service.validation_service import ValidationService
+
+ITERATIONS = 200
+
+
+# 기존 방식: 서비스마다 Repository 를 새로 만들고 요청마다 boto3 클라이언트 생성
+def construct_before(db):
+    return ChatService(
+        db,
+        user_repository=UserRepository(db),
+        chat_repository=ChatRepository(db),
+        heritage_repository=HeritageRepository(db),
+        validation_service=ValidationService(db, ChatRepository(db), HeritageRepository(db)),
+        clova_service=ClovaService(db, HeritageRepository(db), ChatRepository(db)),
+        s3_service=S3Service(s3_client=_create_s3_client()),
+    )
+
+
+# 변경 방식: FastAPI 의존성 주입 경로와 동일하게 생성
+def construct_after(db):
+    return get_chat_service(
+        db,
+        user_repository=UserRepository(db),
+        chat_repository=ChatRepository(db),
+        heritage_repository=HeritageRepository(db),
+    )
+
+
+def main():
+    init_clients()
+    db = AsyncMock()
+
+    for name, construct in (("before", construct_before), ("after", construct_after)):
+        elapsed = timeit.timeit(lambda construct=construct: construct(db), number=ITERATIONS)
+        print(f"{name:>6}: {elapsed / ITERATIONS * 1_000_000:10.1f} us / request ({ITERATIONS} 회)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+거리 기반 문화재 검색 벤치마크 (10만 건 합성 데이터)
+
+- before: DECIMAL 컬럼 CAST + st_distance_sphere 전체 행 계산 (full scan)
+- after: SPATIAL INDEX + MBRContains 경계 상자 선필터 후 정확한 거리 계산
+
+설정된 MySQL 에 임시 테이블(heritages_spatial_bench)을 만들고 측정 후 삭제합니다.
+실행: python -m scripts.benchmark_spatial_search
+"""
+
+import asyncio
+import random
+import time
+
+from sqlalchemy import text
+
+from app.core.database import engine
+from app.utils.common import parse_heritage_dist_range
+from app.utils.geo import bounding_box
+
+ROW_COUNT = 100_000
+BATCH_SIZE = 5_000
+QUERY_COUNT = 50
+DISTANCE_RANGES = ["0-0.5", "0.5-1", "1-10", "10-100"]
+
+# 대한민국 대략적인 범위
+MIN_LAT, MAX_LAT = 33.1, 38.6
+MIN_LON, MAX_LON = 124.6, 131.9
+
+BEFORE_QUERY = """
+SELECT id, ROUND(st_distance_sphere(POINT(CAST(longitude AS DOUBLE), CAST(latitude AS DOUBLE)),
+                                    POINT(:lon, :lat)) / 1000, 2) AS distance
+FROM heritages_spatial_bench
+HAVING distance >= :min_dist AND distance < :max_dist
+ORDER BY distance LIMIT 10
+"""
+
+AFTER_QUERY = """
+SELECT id, ROUND(st_distance_sphere(location_point, ST_SRID(POINT(:lon, :lat), 4326)) / 1000, 2) AS distance
+FROM heritages_spatial_bench
+WHERE MBRContains(ST_GeomFromText(:bbox, 4326, 'axis-order=long-lat'), location_point)
+HAVING distance >= :min_dist AND distance < :max_dist
+ORDER BY distance LIMIT 10
+"""
+
+
+async def create_bench_table(conn):
+    await conn.execute(text("DROP TABLE IF EXISTS heritages_spatial_bench"))
+    await conn.execute(
+        text(
+            "CREATE TABLE heritages_spatial_bench ("
+            " id INT PRIMARY KEY AUTO_INCREMENT,"
+            " latitude DECIMAL(10, 8), longitude DECIMAL(11, 8),"
+            " location_point POINT SRID 4326 NOT NULL,"
+            " SPATIAL INDEX ix_bench_location_point (location_point))"
+        )
+    )
+
+    rng = random.Random(42)
+    for _ in range(ROW_COUNT // BATCH_SIZE):
+        rows = [{"lat": rng.uniform(MIN_LAT, MAX_LAT), "lon": rng.uniform(MIN_LON, MAX_LON)} for _ in range(BATCH_SIZE)]
+        await conn.execute(
+            text(
+                "INSERT INTO heritages_spatial_bench (latitude, longitude, location_point) "
+                "VALUES (:lat, :lon, ST_SRID(POINT(:lon, :lat), 4326))"
+            ),
+            rows,
+        )
+
+
+async def measure(conn, query: str, params_list) -> float:
+    started = time.perf_counter()
+    for params in params_list:
+        await conn.execute(text(query), params)
+    return (time.perf_counter() - started) / len(params_list) * 1000
+
+
+async def main():
+    async with engine.begin() as conn:
+        print(f"{ROW_COUNT} 건 합성 데이터 생성 중...")
+        await create_bench_table(conn)
+
+    rng = random.Random(7)
+    try:
+        async with engine.connect() as conn:
+            for distance_range in DISTANCE_RANGES:
+                min_dist, max_dist = parse_heritage_dist_range(distance_range)
+                params_list = []
+                for _ in range(QUERY_COUNT):
+                    lat, lon = rng.uniform(MIN_LAT, MAX_LAT), rng.uniform(MIN_LON, MAX_LON)
+                    min_lat, min_lon, max_lat, max_lon = bounding_box(lat, lon, max_dist)
+                    bbox = (
+                        f"POLYGON(({min_lon} {min_lat}, {max_lon} {min_lat}, {max_lon} {max_lat}, "
+                        f"{min_lon} {max_lat}, {min_lon} {min_lat}))"
+                    )
+                    params_list.append(
+                        {"lat": lat, "lon": lon, "min_dist": min_dist, "max_dist": max_dist, "bbox": bbox}
+                    )
+
+                before_ms = await measure(conn, BEFORE_QUERY, params_list)
+                after_ms = await measure(conn, AFTER_QUERY, params_list)
+                print(
+                    f"{distance_range:>8} km | before {before_ms:8.2f} ms | after {after_ms:8.2f} ms "
+                    f"| x{before_ms / after_ms:.1f}"
+                )
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP TABLE IF EXISTS heritages_spatial_bench"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+"""
+heritages.location_point 공간 컬럼 추가 및 기존 데이터 백필
+
+1. location_point POINT SRID 4326 컬럼 추가 (NULL 허용)
+2. latitude / longitude 값으로 백필 (좌표 없는 행은 POINT(0 0))
+3. NOT NULL 변경 후 SPATIAL INDEX 생성
+
+실행: python -m scripts.migrate_heritage_location_point
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import text
+
+from app.core.database import engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def column_exists(conn, table: str, column: str) -> bool:
+    result = await conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND COLUMN_NAME = :column"
+        ),
+        {"table": table, "column": column},
+    )
+    return result.scalar() > 0
+
+
+async def index_exists(conn, table: str, index: str) -> bool:
+    result = await conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND INDEX_NAME = :index"
+        ),
+        {"table": table, "index": index},
+    )
+    return result.scalar() > 0
+
+
+async def main():
+    async with engine.begin() as conn:
+        if not await column_exists(conn, "heritages", "location_point"):
+            logger.info("location_point 컬럼을 추가합니다.")
+            await conn.execute(text("ALTER TABLE heritages ADD COLUMN location_point POINT SRID 4326 NULL"))
+
+        result = await conn.execute(
+            text(
+                "UPDATE heritages "
+                "SET location_point = ST_SRID(POINT(COALESCE(longitude, 0), COALESCE(latitude, 0)), 4326) "
+                "WHERE location_point IS NULL"
+            )
+        )
+        logger.info(f"location_point 백필 완료: {result.rowcount} 건")
+
+        missing = await conn.execute(text("SELECT COUNT(*) FROM heritages WHERE latitude IS NULL OR longitude IS NULL"))
+        missing_count = missing.scalar()
+        if missing_count:
+            logger.warning(f"좌표가 없어 POINT(0 0)으로 저장된 문화재: {missing_count} 건")
+
+        await conn.execute(text("ALTER TABLE heritages MODIFY location_point POINT SRID 4326 NOT NULL"))
+
+        if not await index_exists(conn, "heritages", "ix_heritages_location_point"):
+            logger.info("SPATIAL INDEX 를 생성합니다.")
+            await conn.execute(text("CREATE SPATIAL INDEX ix_heritages_location_point ON heritages (location_point)"))
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+import gzip
+
+import brotli
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+from app.core.metrics import metrics
+from app.utils.cache import TTLCache
+
+BODY = ("경복궁은 조선 왕조 제일의 법궁이다. " * 200).encode("utf-8")
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024, cache=TTLCache(100, 60))
+
+    @app.get("/detail")
+    def detail():
+        return Response(BODY, media_type="application/json", headers={"ETag": '"abc"'})
+
+    @app.get("/list")
+    def heritage_list():
+        return Response(BODY, media_type="application/json")
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("짧은 응답")
+
+    @app.get("/image")
+    def image():
+        return Response(BODY, media_type="image/png")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([BODY, BODY]), media_type="text/plain")
+
+    metrics.reset()
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, None),
+        ("identity", None),
+        ("gzip, deflate", "gzip"),
+        ("gzip, deflate, br", "br"),
+        ("br;q=0, gzip", "gzip"),
+        ("gzip;q=0.5, br;q=0.8", "br"),
+        ("*", "br"),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding) == expected
+
+
+@pytest.mark.parametrize("encoding, decompress", [("gzip", gzip.decompress), ("br", brotli.decompress)])
+def test_large_json_response_is_compressed(client, encoding, decompress):
+    # Act
+    with client.stream("GET", "/list", headers={"Accept-Encoding": encoding}) as response:
+        raw = b"".join(response.iter_raw())
+
+    # Assert
+    assert response.headers["content-encoding"] == encoding
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert decompress(raw) == BODY
+    assert len(raw) < len(BODY) / 5
+    assert metrics.get_counter("compression.bytes_out") == len(raw)
+
+
+def test_etag_response_is_compressed_once_and_gets_weak_etag(client):
+    # Act
+    first = client.get("/detail", headers={"Accept-Encoding": "br"})
+    second = client.get("/detail", headers={"Accept-Encoding": "br"})
+
+    # Assert
+    assert first.headers["etag"] == second.headers["etag"] == 'W/"abc"'
+    assert metrics.get_counter("compression.cache_misses") == 1
+    assert metrics.get_counter("compression.cache_hits") == 1
+
+
+@pytest.mark.parametrize("path", ["/small", "/image", "/stream"])
+def test_small_binary_and_streaming_responses_are_not_compressed(client, path):
+    response = client.get(path, headers={"Accept-Encoding": "gzip, br"})
+
+    assert "content-encoding" not in response.headers
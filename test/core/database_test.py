@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text, update
+
+from app.core import database
+from app.core.database import ReplicaRouter, RoutingSession
+from app.models.heritage.heritage import Heritage
+
+
+@pytest.fixture
+def engines(monkeypatch):
+    primary = create_engine("sqlite://")
+    replicas = [create_engine("sqlite://"), create_engine("sqlite://")]
+    router = ReplicaRouter([SimpleNamespace(sync_engine=replica) for replica in replicas])
+    monkeypatch.setattr(database, "replica_router", router)
+    return primary, replicas
+
+
+def test_read_only_queries_are_routed_to_replicas_round_robin(engines):
+    # Arrange
+    primary, replicas = engines
+    session = RoutingSession(bind=primary)
+    session.info["read_only"] = True
+
+    # Act
+    binds = [session.get_bind(clause=text("SELECT 1")) for _ in range(4)]
+
+    # Assert
+    assert binds == [replicas[0], replicas[1], replicas[0], replicas[1]]
+
+
+def test_queries_without_read_only_flag_use_primary(engines):
+    # Arrange
+    primary, _ = engines
+    session = RoutingSession(bind=primary)
+
+    # Act Assert
+    assert session.get_bind(clause=text("SELECT 1")) is primary
+
+
+def test_session_is_pinned_to_primary_after_write(engines):
+    # Arrange
+    primary, _ = engines
+    session = RoutingSession(bind=primary)
+    session.info["read_only"] = True
+
+    # Act
+    write_bind = session.get_bind(clause=update(Heritage).values(name="경복궁"))
+    read_bind = session.get_bind(clause=text("SELECT 1"))
+
+    # Assert
+    assert write_bind is primary
+    assert read_bind is primary
+
+
+@pytest.mark.asyncio
+async def test_use_primary_routes_read_only_queries_to_primary(engines):
+    # Arrange
+    primary, replicas = engines
+    session = RoutingSession(bind=primary)
+    session.info["read_only"] = True
+
+    # Act
+    async with database.use_primary(session):
+        inside_bind = session.get_bind(clause=text("SELECT 1"))
+    after_bind = session.get_bind(clause=text("SELECT 1"))
+
+    # Assert
+    assert inside_bind is primary
+    assert after_bind is replicas[0]
+
+
+def test_unhealthy_replicas_fall_back_to_primary(engines):
+    # Arrange
+    primary, _ = engines
+    database.replica_router._healthy = [False, False]
+    session = RoutingSession(bind=primary)
+    session.info["read_only"] = True
+
+    # Act Assert
+    assert session.get_bind(clause=text("SELECT 1")) is primary
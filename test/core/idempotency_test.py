@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from app.core.idempotency import IdempotencyStore
+from app.error.chat_exception import IdempotencyKeyMismatchException
+
+
+@pytest.fixture
+def store():
+    return IdempotencyStore(ttl_seconds=60, max_entries=100)
+
+
+@pytest.mark.asyncio
+async def test_retry_returns_stored_response(store):
+    # Arrange
+    calls = []
+
+    async def operation():
+        calls.append(1)
+        return {"content": "응답"}
+
+    # Act
+    first = await store.run("messages:1", "key-1", "fp", operation)
+    second = await store.run("messages:1", "key-1", "fp", operation)
+
+    # Assert
+    assert first == second
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_waits_for_in_flight_request(store):
+    # Arrange
+    calls = []
+    release = asyncio.Event()
+
+    async def operation():
+        calls.append(1)
+        await release.wait()
+        return "응답"
+
+    # Act
+    first = asyncio.create_task(store.run("messages:1", "key-1", "fp", operation))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(store.run("messages:1", "key-1", "fp", operation))
+    await asyncio.sleep(0)
+    release.set()
+
+    # Assert
+    assert await first == "응답"
+    assert await second == "응답"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_request_is_not_stored(store):
+    # Arrange
+    calls = []
+
+    async def failing_operation():
+        calls.append(1)
+        raise ValueError("Clova 호출 실패")
+
+    # Act Assert
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await store.run("messages:1", "key-1", "fp", failing_operation)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_same_key_with_different_payload_is_rejected(store):
+    # Arrange
+    async def operation():
+        return "응답"
+
+    await store.run("messages:1", "key-1", "fp-1", operation)
+
+    # Act Assert
+    with pytest.raises(IdempotencyKeyMismatchException):
+        await store.run("messages:1", "key-1", "fp-2", operation)
+
+
+@pytest.mark.asyncio
+async def test_request_without_key_is_not_deduplicated(store):
+    # Arrange
+    calls = []
+
+    async def operation():
+        calls.append(1)
+        return "응답"
+
+    # Act
+    await store.run("messages:1", None, "fp", operation)
+    await store.run("messages:1", None, "fp", operation)
+
+    # Assert
+    assert len(calls) == 2
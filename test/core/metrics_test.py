@@ -0,0 +1,29 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.router.api import api_router
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(api_router)
+    return TestClient(app)
+
+
+def test_metrics_is_hidden_without_configured_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+
+    assert client.get("/metrics", headers={"Authorization": "Bearer anything"}).status_code == 404
+
+
+@pytest.mark.parametrize(
+    "headers, status_code",
+    [({}, 401), ({"Authorization": "Bearer wrong"}, 403), ({"Authorization": "Bearer secret"}, 200)],
+)
+def test_metrics_requires_matching_token(client, monkeypatch, headers, status_code):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "secret")
+
+    assert client.get("/metrics", headers=headers).status_code == status_code
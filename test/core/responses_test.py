@@ -0,0 +1,47 @@
+from decimal import Decimal
+
+import numpy as np
+import orjson
+from fastapi import Response
+
+from app.core.config import settings
+from app.core.responses import FastJSONResponse, model_response
+from app.schemas.heritage import HeritageBuildingInfo
+
+
+def test_fast_json_response_renders_models_and_plain_values():
+    # Arrange
+    building = HeritageBuildingInfo(building_id=1, name="근정전", coordinate=(126.977, 37.5786))
+
+    # Act
+    model_body = FastJSONResponse(building).body
+    value_body = FastJSONResponse({"distance": Decimal("1.5"), "ids": np.array([1, 2])}).body
+
+    # Assert
+    assert orjson.loads(model_body) == {"building_id": 1, "name": "근정전", "coordinate": [126.977, 37.5786]}
+    assert orjson.loads(value_body) == {"distance": 1.5, "ids": [1, 2]}
+
+
+def test_model_response_keeps_injected_headers_and_status(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSE_ENABLED", True)
+    building = HeritageBuildingInfo(building_id=1, name="근정전")
+    injected = Response()
+    del injected.headers["content-length"]
+    injected.headers["ETag"] = '"abc"'
+    injected.status_code = 201
+
+    # Act
+    response = model_response(building, injected)
+
+    # Assert
+    assert response.status_code == 201
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["content-length"] == str(len(response.body))
+
+
+def test_model_response_returns_model_when_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSE_ENABLED", False)
+    building = HeritageBuildingInfo(building_id=1, name="근정전")
+
+    assert model_response(building) is building
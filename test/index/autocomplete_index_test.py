@@ -0,0 +1,60 @@
+import pytest
+
+from app.index.autocomplete_index import AutocompleteIndex
+from app.index.catalog import HeritageRecord
+
+
+def make_record(heritage_id: int, name: str, latitude: float = 37.0, longitude: float = 127.0) -> HeritageRecord:
+    return HeritageRecord(heritage_id, name, None, None, latitude, longitude, None, None, None, None, None)
+
+
+@pytest.fixture
+def index():
+    index = AutocompleteIndex()
+    index.rebuild(
+        [
+            make_record(1, "경복궁", 37.5796, 126.9770),
+            make_record(2, "경주 불국사", 35.7901, 129.3320),
+            make_record(3, "서울 경복궁 근정전", 37.5786, 126.9770),
+            make_record(4, "경기감영도", 37.5665, 126.9780),
+            make_record(5, "고복저수지", 36.6, 127.2),
+        ]
+    )
+    index.set_popularity({3: 10, 1: 5})
+    return index
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("ㄱㅂㄱ", [3, 1]),
+        ("경복", [3, 1]),
+        ("경보", [3, 1]),
+        ("경ㅂ", [3, 1]),
+        ("불국", [2]),
+        ("ㄱ", [3, 1, 4, 5, 2]),
+    ],
+)
+def test_suggest_matches_syllables_chosung_and_partial_input(index, query, expected):
+    # Act
+    suggestions = index.suggest(query, limit=10)
+
+    # Assert
+    assert [record.id for record, _ in suggestions] == expected
+
+
+def test_suggest_ranks_by_distance_when_location_given(index):
+    # Act
+    suggestions = index.suggest("ㄱㅂㄱ", limit=10, user_latitude=37.5796, user_longitude=126.9770)
+
+    # Assert
+    assert [(record.id, distance) for record, distance in suggestions] == [(1, 0.0), (3, 0.1)]
+
+
+def test_upsert_and_remove_update_keys(index):
+    # Act
+    index.upsert(make_record(6, "경복궁 향원정"))
+    index.remove(3)
+
+    # Assert
+    assert [record.id for record, _ in index.suggest("ㄱㅂㄱ")] == [1, 6]
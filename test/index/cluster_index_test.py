@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from app.index.catalog import HeritageRecord
+from app.index.cluster_index import ClusterIndex
+
+KOREA_BBOX = (33.0, 124.5, 38.7, 131.0)
+
+
+def make_record(heritage_id: int, latitude: float, longitude: float) -> HeritageRecord:
+    return HeritageRecord(
+        id=heritage_id,
+        name=f"문화재{heritage_id}",
+        name_hanja=None,
+        location_list=None,
+        latitude=latitude,
+        longitude=longitude,
+        heritage_type_id=None,
+        heritage_type_name=None,
+        area_code=None,
+        era=None,
+        image_url=None,
+    )
+
+
+@pytest.fixture
+def records():
+    rng = random.Random(42)
+    return [
+        make_record(heritage_id, round(rng.uniform(34.0, 38.0), 6), round(rng.uniform(126.0, 129.5), 6))
+        for heritage_id in range(1, 501)
+    ]
+
+
+@pytest.fixture
+def index(records):
+    index = ClusterIndex(max_zoom=16, cell_pixels=64)
+    index.rebuild(records)
+    return index
+
+
+@pytest.mark.parametrize("zoom", [3, 7, 10, 15])
+def test_clusters_cover_every_heritage_in_view(index, records, zoom):
+    # Act
+    clusters = index.clusters(*KOREA_BBOX, zoom=zoom, max_markers=1000)
+
+    # Assert
+    assert sum(cluster.count for cluster in clusters) == len(records)
+    assert all(cluster.heritage_id is not None for cluster in clusters if cluster.count == 1)
+
+
+def test_low_zoom_returns_few_clusters_with_centroids(index, records):
+    # Act
+    clusters = index.clusters(*KOREA_BBOX, zoom=3, max_markers=1000)
+
+    # Assert
+    assert len(clusters) <= 4
+    biggest = max(clusters, key=lambda cluster: cluster.count)
+    assert 34.0 <= biggest.latitude <= 38.0 and 126.0 <= biggest.longitude <= 129.5
+
+
+def test_high_zoom_returns_individual_heritages_inside_bbox(index, records):
+    # Arrange
+    bbox = (35.0, 127.0, 36.0, 128.0)
+    expected = {
+        record.id for record in records if 35.0 <= record.latitude <= 36.0 and 127.0 <= record.longitude <= 128.0
+    }
+
+    # Act
+    markers = index.clusters(*bbox, zoom=16, max_markers=1000)
+
+    # Assert
+    assert {marker.heritage_id for marker in markers} == expected
+
+
+def test_high_zoom_falls_back_to_clusters_when_too_many_markers(index, records):
+    markers = index.clusters(*KOREA_BBOX, zoom=16, max_markers=10)
+
+    assert sum(marker.count for marker in markers) == len(records)
+
+
+def test_upsert_and_remove_update_only_changed_heritage(index, records):
+    # Act
+    index.upsert(make_record(1, 37.5796, 126.9770))
+    index.remove(2)
+    index.upsert(make_record(9999, 37.5797, 126.9771))
+
+    # Assert
+    markers = index.clusters(37.57, 126.97, 37.59, 126.98, zoom=16, max_markers=1000)
+    assert {marker.heritage_id for marker in markers} >= {1, 9999}
+    total = sum(cluster.count for cluster in index.clusters(*KOREA_BBOX, zoom=5, max_markers=1000))
+    assert total == len(records)
@@ -0,0 +1,47 @@
+from app.index.catalog import HeritageRecord
+from app.index.fuzzy_index import FuzzyIndex, bounded_levenshtein
+from app.utils.hangul import decompose_jamo
+
+
+def make_record(heritage_id: int, name: str) -> HeritageRecord:
+    return HeritageRecord(heritage_id, name, None, None, None, None, None, None, None, None, None)
+
+
+def test_bounded_levenshtein_on_jamo():
+    # Act Assert
+    assert bounded_levenshtein(decompose_jamo("경북궁"), decompose_jamo("경복궁"), 2) == 1
+    assert bounded_levenshtein(decompose_jamo("불굮사"), decompose_jamo("불국사"), 2) == 1
+    assert bounded_levenshtein(decompose_jamo("창덕궁"), decompose_jamo("경복궁"), 2) == 3
+
+
+def test_search_finds_names_within_jamo_edit_distance():
+    # Arrange
+    index = FuzzyIndex(max_distance=1)
+    index.rebuild(
+        [
+            make_record(1, "경복궁"),
+            make_record(2, "서울 경복궁 근정전"),
+            make_record(3, "경주 불국사"),
+            make_record(4, "창덕궁"),
+        ]
+    )
+
+    # Act Assert
+    assert index.search("경북궁") == [1, 2]
+    assert index.search("불굮사") == [3]
+    assert index.search("경복궁 근정젼") == [2]
+    assert index.search("덕궁") == []
+
+
+def test_remove_drops_unshared_terms():
+    # Arrange
+    index = FuzzyIndex(max_distance=1)
+    index.rebuild([make_record(1, "경복궁"), make_record(2, "경복궁 향원정")])
+
+    # Act
+    index.remove(1)
+    index.remove(2)
+
+    # Assert
+    assert index.search("경북궁") == []
+    assert index._variants == {}
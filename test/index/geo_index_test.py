@@ -0,0 +1,230 @@
+import random
+
+import pytest
+from haversine import haversine
+
+from app.index.catalog import HeritageRecord
+from app.index.geo_index import GeoIndex
+from app.models.enums import EraCategory, SortOrder
+from app.utils.common import parse_heritage_dist_range
+from app.utils.era import normalize_era
+from app.utils.geo import EARTH_RADIUS_KM
+
+ERAS = ["조선시대", "고려시대", "삼국:신라", "통일신라", "고려시대~조선시대", "조선 후기", None]
+USER_LATITUDE, USER_LONGITUDE = 37.5796, 126.9770
+
+
+def make_record(heritage_id: int, rng: random.Random) -> HeritageRecord:
+    return HeritageRecord(
+        id=heritage_id,
+        name=f"문화재{heritage_id}",
+        name_hanja=None,
+        location_list="서울 종로구",
+        latitude=round(rng.uniform(33.0, 38.5), 6),
+        longitude=round(rng.uniform(125.0, 130.0), 6),
+        heritage_type_id=rng.randint(1, 5),
+        heritage_type_name="국보",
+        area_code=float(rng.choice([11, 21, 31])),
+        era=rng.choice(ERAS),
+        image_url=None,
+    )
+
+
+# SQL 경로와 동일한 의미의 단순 구현 (전체 정렬)
+def reference_search(
+    records,
+    limit,
+    offset,
+    area_code=None,
+    heritage_type=None,
+    distance_range=None,
+    era_category=None,
+    sort_by="id",
+    sort_order=SortOrder.ASC,
+):
+    rows = [
+        record
+        for record in records
+        if (area_code is None or record.area_code == area_code)
+        and (heritage_type is None or record.heritage_type_id in heritage_type)
+        and (not era_category or era_category in normalize_era(record.era))
+    ]
+    # 좌표가 없으면 거리 NULL (거리 범위 제외, 오름차순 맨 앞 / 내림차순 맨 뒤)
+    rows = [
+        (
+            record,
+            (
+                round(
+                    haversine((USER_LATITUDE, USER_LONGITUDE), (record.latitude, record.longitude), normalize=False)
+                    / 6371.0088
+                    * EARTH_RADIUS_KM,
+                    2,
+                )
+                if record.latitude is not None and record.longitude is not None
+                else None
+            ),
+        )
+        for record in rows
+    ]
+    if distance_range:
+        min_dist, max_dist = parse_heritage_dist_range(distance_range)
+        rows = [row for row in rows if row[1] is not None and min_dist <= row[1] < max_dist]
+    total_count = len(rows)
+    sign = 1 if sort_order == SortOrder.ASC else -1
+    if sort_by == "distance":
+        rows.sort(key=lambda row: ((row[1] is not None) * sign, sign * (row[1] or 0), row[0].id))
+    else:
+        rows.sort(key=lambda row: sign * row[0].id)
+    return [(record.id, distance) for record, distance in rows[offset : offset + limit]], total_count
+
+
+@pytest.fixture
+def records():
+    rng = random.Random(42)
+    return [make_record(heritage_id, rng) for heritage_id in range(1, 2001)]
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"sort_by": "distance"},
+        {"sort_by": "distance", "sort_order": SortOrder.DESC, "distance_range": "100-1000"},
+        {"sort_by": "id", "sort_order": SortOrder.DESC, "area_code": 11},
+        {"sort_by": "distance", "distance_range": "10-100", "heritage_type": [1, 2]},
+        {"distance_range": "1-10", "era_category": EraCategory.SILLA},
+        {"sort_by": "distance", "era_category": EraCategory.JOSEON, "distance_range": "unknown"},
+    ],
+)
+def test_search_matches_reference_implementation(records, filters):
+    # Arrange
+    index = GeoIndex(cell_size=0.1)
+    index.rebuild(records)
+
+    # Act
+    rows, total_count = index.search(10, 20, USER_LATITUDE, USER_LONGITUDE, **filters)
+
+    # Assert
+    expected_rows, expected_total = reference_search(records, 10, 20, **filters)
+    assert total_count == expected_total
+    assert [(record.id, distance) for record, distance in rows] == pytest.approx(expected_rows)
+
+
+def test_upsert_and_remove_update_index_incrementally(records):
+    # Arrange
+    index = GeoIndex(cell_size=0.1)
+    index.rebuild(records[:10])
+    nearby = HeritageRecord(
+        9999, "경복궁", None, "서울", USER_LATITUDE, USER_LONGITUDE, 1, "사적", 11.0, "조선시대", None
+    )
+
+    # Act
+    index.upsert(nearby)
+    nearest_after_insert = index.search(1, 0, USER_LATITUDE, USER_LONGITUDE, distance_range="0-0.5")
+    index.remove(9999)
+    nearest_after_remove = index.search(1, 0, USER_LATITUDE, USER_LONGITUDE, distance_range="0-0.5")
+
+    # Assert
+    assert [(record.id, distance) for record, distance in nearest_after_insert[0]] == [(9999, 0.0)]
+    assert nearest_after_insert[1] == 1
+    assert nearest_after_remove == ([], 0)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"sort_by": "distance"},
+        {"sort_by": "distance", "sort_order": SortOrder.DESC, "distance_range": "100-1000"},
+        {"sort_by": "id", "sort_order": SortOrder.DESC, "era_category": EraCategory.GORYEO},
+    ],
+)
+def test_cursor_pages_match_offset_pages(records, filters):
+    # Arrange
+    index = GeoIndex(cell_size=0.1)
+    index.rebuild(records)
+    sort_by = filters.get("sort_by")
+
+    # Act
+    cursor_pages, cursor = [], None
+    for _ in range(5):
+        rows, _ = index.search(7, 0, USER_LATITUDE, USER_LONGITUDE, cursor=cursor, **filters)
+        cursor_pages.append([record.id for record, _ in rows])
+        last_record, last_distance = rows[-1]
+        cursor = (last_distance, last_record.id) if sort_by == "distance" else (last_record.id,)
+
+    # Assert
+    offset_pages = [
+        [record.id for record, _ in index.search(7, page * 7, USER_LATITUDE, USER_LONGITUDE, **filters)[0]]
+        for page in range(5)
+    ]
+    assert cursor_pages == offset_pages
+
+
+@pytest.mark.parametrize("limit", [20, 100000])
+def test_search_bbox_counts_all_matches_and_caps_sample(records, limit):
+    # Arrange
+    index = GeoIndex(cell_size=0.1)
+    index.rebuild(records)
+    min_lat, min_lon, max_lat, max_lon = 35.0, 126.0, 37.0, 128.5
+
+    # Act
+    rows, total_count = index.search_bbox(min_lat, min_lon, max_lat, max_lon, limit, heritage_type=[1, 2])
+
+    # Assert
+    expected = [
+        record.id
+        for record in records
+        if min_lat <= record.latitude <= max_lat
+        and min_lon <= record.longitude <= max_lon
+        and record.heritage_type_id in (1, 2)
+    ]
+    assert total_count == len(expected)
+    assert len(rows) == min(limit, total_count)
+    assert {record.id for record in rows} <= set(expected)
+    assert [record.id for record in rows] == sorted(record.id for record in rows)
+
+
+@pytest.fixture
+def records_without_some_coordinates(records):
+    # 일부 문화재는 위도 또는 경도가 없음 (SQL 에서는 거리 NULL)
+    for record in records[::7]:
+        record.latitude = None
+    for record in records[3::11]:
+        record.longitude = None
+    return records
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"sort_by": "distance"},
+        {"sort_by": "distance", "sort_order": SortOrder.DESC},
+        {"sort_by": "distance", "distance_range": "100-1000"},
+        {"sort_by": "id"},
+    ],
+)
+def test_missing_coordinates_have_null_distance_and_sort_like_sql(records_without_some_coordinates, filters):
+    # Arrange
+    records = records_without_some_coordinates
+    index = GeoIndex(cell_size=0.1)
+    index.rebuild(records)
+    expected_pages = [reference_search(records, 50, page * 50, **filters)[0] for page in range(10)]
+
+    # Act
+    offset_pages = [
+        [
+            (record.id, distance)
+            for record, distance in index.search(50, page * 50, USER_LATITUDE, USER_LONGITUDE, **filters)[0]
+        ]
+        for page in range(10)
+    ]
+    cursor_pages, cursor = [], None
+    for _ in range(10):
+        rows, _ = index.search(50, 0, USER_LATITUDE, USER_LONGITUDE, cursor=cursor, **filters)
+        cursor_pages.append([(record.id, distance) for record, distance in rows])
+        last_record, last_distance = rows[-1]
+        cursor = (last_distance, last_record.id) if filters["sort_by"] == "distance" else (last_record.id,)
+
+    # Assert
+    assert offset_pages == expected_pages
+    assert cursor_pages == expected_pages
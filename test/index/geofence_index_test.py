@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.index.geofence_index import HeritageGeofence
+
+# 근정전 / 사정전 (약 110m 간격), 반경 미지정 건축물은 유형 기본 반경 사용
+ROWS = [
+    SimpleNamespace(id=1, name="근정전", latitude=37.5786, longitude=126.9770, custom_radius=40.0, default_radius=30.0),
+    SimpleNamespace(id=2, name="사정전", latitude=37.5796, longitude=126.9770, custom_radius=None, default_radius=30.0),
+    SimpleNamespace(id=3, name="좌표 없음", latitude=None, longitude=None, custom_radius=None, default_radius=None),
+]
+
+
+@pytest.fixture
+def fence():
+    return HeritageGeofence.from_rows(ROWS)
+
+
+def test_from_rows_uses_custom_radius_then_type_default_and_skips_missing_coordinates(fence):
+    assert fence.ids.tolist() == [1, 2]
+    assert fence.radii.tolist() == [40.0, 30.0]
+
+
+def test_locate_returns_containing_building(fence):
+    # Act
+    result = fence.locate(37.5787, 126.9770)
+
+    # Assert
+    assert (result.building_id, result.name, result.inside) == (1, "근정전", True)
+    assert result.distance == pytest.approx(11.1, abs=0.2)
+
+
+def test_locate_returns_nearest_building_when_outside_every_fence(fence):
+    # Act
+    result = fence.locate(37.5770, 126.9770)
+
+    # Assert
+    assert (result.building_id, result.inside) == (1, False)
+
+
+def test_locate_keeps_current_building_within_exit_radius(fence):
+    # 근정전 반경(40m)을 조금 벗어났지만 이탈 반경(52m) 안이면 근정전 유지
+    latitude = 37.5786 + 45 / 111_195
+
+    # Act
+    without_current = fence.locate(latitude, 126.9770)
+    with_current = fence.locate(latitude, 126.9770, current_building_id=1)
+
+    # Assert
+    assert without_current.inside is False
+    assert (with_current.building_id, with_current.inside) == (1, True)
+
+
+def test_locate_without_buildings_returns_empty_result():
+    result = HeritageGeofence.from_rows([]).locate(37.5, 127.0)
+
+    assert (result.building_id, result.inside) == (None, False)
+
+
+def test_visit_order_follows_first_entry(fence):
+    # 사정전 -> 근정전 순서로 이동
+    latitudes = np.array([37.5800, 37.5796, 37.5796, 37.5700, 37.5791, 37.5786, 37.5786])
+    longitudes = np.full(len(latitudes), 126.9770)
+
+    # Act
+    order = fence.visit_order(latitudes, longitudes, min_fixes=2)
+
+    # Assert
+    assert fence.ids[order].tolist() == [2, 1]
+
+
+def test_visit_order_ignores_buildings_with_fewer_fixes_than_minimum(fence):
+    # 근정전 반경에 한 번만 튄 좌표는 방문으로 보지 않음
+    latitudes = np.array([37.5796, 37.5796, 37.5786])
+    longitudes = np.full(len(latitudes), 126.9770)
+
+    # Act
+    order = fence.visit_order(latitudes, longitudes, min_fixes=2)
+
+    # Assert
+    assert fence.ids[order].tolist() == [2]
@@ -0,0 +1,43 @@
+from app.index.catalog import HeritageRecord
+from app.index.name_index import NameIndex
+
+
+def make_record(heritage_id: int, name: str, name_hanja: str = None) -> HeritageRecord:
+    return HeritageRecord(heritage_id, name, name_hanja, None, None, None, None, None, None, None, None)
+
+
+def test_search_ranks_by_match_quality():
+    # Arrange
+    index = NameIndex()
+    index.rebuild(
+        [
+            make_record(1, "서울 경복궁 근정전", "景福宮 勤政殿"),
+            make_record(2, "경복궁", "景福宮"),
+            make_record(3, "경복궁 자경전 꽃담"),
+            make_record(4, "창덕궁"),
+        ]
+    )
+
+    # Act
+    results = index.search("경복 궁")
+    hanja_results = index.search("景福")
+    single_char_results = index.search("궁")
+
+    # Assert
+    assert results == [2, 3, 1]
+    assert hanja_results == [2, 1]
+    assert sorted(single_char_results) == [1, 2, 3, 4]
+
+
+def test_upsert_and_remove_update_postings():
+    # Arrange
+    index = NameIndex()
+    index.rebuild([make_record(1, "불국사"), make_record(2, "석굴암")])
+
+    # Act
+    index.upsert(make_record(1, "불국사 다보탑"))
+    index.remove(2)
+
+    # Assert
+    assert index.search("다보탑") == [1]
+    assert index.search("석굴") == []
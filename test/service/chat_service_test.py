@@ -32,6 +32,8 @@ def chat_service():
     service.user_repository = AsyncMock()
     service.chat_repository = AsyncMock()
     service.heritage_repository = AsyncMock()
+    service.heritage_route_service = AsyncMock()
+    service.geofence_service = AsyncMock()
     service.validation_service = AsyncMock()
     service.clova_service = AsyncMock()
     service.s3_service = AsyncMock()
@@ -66,7 +68,7 @@ async def test_create_chat_session_success(chat_service):
 
     chat_service.chat_repository.create_chat_session = AsyncMock(return_value=mock_session)
     chat_service.heritage_repository.get_heritage_by_id = AsyncMock(return_value=mock_heritage)
-    chat_service.heritage_repository.get_routes_with_buildings_by_heritages_id = AsyncMock(return_value=mock_routes)
+    chat_service.heritage_route_service.get_routes = AsyncMock(return_value=mock_routes)
 
     # Act
     try:
@@ -93,7 +95,7 @@ async def test_create_chat_session_success(chat_service):
         # Verify that methods were called
         chat_service.chat_repository.create_chat_session.assert_awaited_once_with(user_id, heritage_id)
         chat_service.heritage_repository.get_heritage_by_id.assert_awaited_once_with(heritage_id)
-        chat_service.heritage_repository.get_routes_with_buildings_by_heritages_id.assert_awaited_once_with(heritage_id)
+        chat_service.heritage_route_service.get_routes.assert_awaited_once_with(heritage_id)
     except ChatServiceException as e:
         pytest.fail(f"ChatService 예외 발생: {str(e)}")
     except Exception as e:
@@ -0,0 +1,48 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.service.heritage_count_service import HeritageCountService
+from app.utils.cache import TTLCache
+
+
+@pytest.fixture
+def count_service():
+    heritage_repository = AsyncMock()
+    heritage_repository.count_heritages.return_value = 42
+    return HeritageCountService(AsyncMock(), heritage_repository, cache=TTLCache(100, 60))
+
+
+@pytest.mark.asyncio
+async def test_count_is_cached_per_filters_and_location_cell(count_service):
+    # Act
+    first = await count_service.count_heritages(37.57961, 126.97701, distance_range="1-10", heritage_type=[2, 1])
+    same_cell = await count_service.count_heritages(37.57962, 126.97702, distance_range="1-10", heritage_type=[1, 2])
+    other_cell = await count_service.count_heritages(35.1, 129.0, distance_range="1-10", heritage_type=[1, 2])
+
+    # Assert
+    assert first == same_cell == other_cell == 42
+    assert count_service.heritage_repository.count_heritages.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_count_without_distance_range_ignores_location(count_service):
+    # Act
+    await count_service.count_heritages(37.5, 127.0, area_code=11)
+    await count_service.count_heritages(35.1, 129.0, area_code=11)
+
+    # Assert
+    count_service.heritage_repository.count_heritages.assert_awaited_once_with(
+        37.5, 127.0, None, 11, None, None, None, None
+    )
+
+
+@pytest.mark.asyncio
+async def test_count_is_cached_per_name_index_result_set(count_service):
+    # Act
+    await count_service.count_heritages(37.5, 127.0, name="궁", heritage_ids=[3, 1, 2])
+    await count_service.count_heritages(37.5, 127.0, name="궁", heritage_ids=[1, 2, 3])
+    await count_service.count_heritages(37.5, 127.0, name="궁", heritage_ids=[1, 2, 4])
+
+    # Assert: 같은 ID 집합은 순서와 관계없이 캐시 공유, 다른 집합은 별도 조회
+    assert count_service.heritage_repository.count_heritages.await_count == 2
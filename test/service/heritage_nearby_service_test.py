@@ -0,0 +1,139 @@
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.models.enums import SortOrder
+from app.service.heritage_nearby_service import HeritageNearbyService
+from app.utils.cache import TTLCache
+from app.utils.common import parse_heritage_dist_range
+from app.utils.geo import geohash_bounds, geohash_encode, haversine_distances
+
+PLAZA_LATITUDE, PLAZA_LONGITUDE = 37.5796, 126.9770
+
+
+def make_rows():
+    rng = random.Random(7)
+    return [
+        SimpleNamespace(
+            id=heritage_id,
+            name=f"문화재{heritage_id}",
+            location_list="서울 종로구",
+            heritage_type_name="사적",
+            image_url=None,
+            latitude=PLAZA_LATITUDE + rng.uniform(-0.05, 0.05),
+            longitude=PLAZA_LONGITUDE + rng.uniform(-0.05, 0.05),
+        )
+        for heritage_id in range(1, 401)
+    ]
+
+
+# 저장소의 후보 조회와 동일하게 기준 좌표 거리 범위로 필터링 / 거리순 정렬
+def make_repository(rows):
+    async def search_nearby_candidates(latitude, longitude, min_distance, max_distance, max_rows, *filters):
+        distances = haversine_distances(
+            latitude,
+            longitude,
+            np.array([row.latitude for row in rows]),
+            np.array([row.longitude for row in rows]),
+        )
+        matched = sorted(
+            (round(float(distance), 2), row.id, row)
+            for distance, row in zip(distances, rows, strict=True)
+            if min_distance <= distance < max_distance
+        )
+        return [row for _, _, row in matched][:max_rows]
+
+    repository = AsyncMock()
+    repository.search_nearby_candidates.side_effect = search_nearby_candidates
+    return repository
+
+
+def reference_search(rows, latitude, longitude, distance_range, sort_order):
+    min_dist, max_dist = parse_heritage_dist_range(distance_range)
+    distances = np.round(
+        haversine_distances(
+            latitude, longitude, np.array([row.latitude for row in rows]), np.array([row.longitude for row in rows])
+        ),
+        2,
+    )
+    matched = [
+        (float(distance), row.id)
+        for distance, row in zip(distances, rows, strict=True)
+        if min_dist <= distance < max_dist
+    ]
+    sign = -1 if sort_order == SortOrder.DESC else 1
+    return sorted(matched, key=lambda item: (sign * item[0], item[1]))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("distance_range", ["0-0.5", "0.5-1", "1-10"])
+@pytest.mark.parametrize("sort_order", [SortOrder.ASC, SortOrder.DESC])
+async def test_users_in_same_cell_share_candidates_and_get_exact_ranking(distance_range, sort_order):
+    # Arrange
+    rows = make_rows()
+    service = HeritageNearbyService(AsyncMock(), make_repository(rows), cache=TTLCache(100, 60))
+    min_lat, min_lon, max_lat, max_lon = geohash_bounds(
+        geohash_encode(PLAZA_LATITUDE, PLAZA_LONGITUDE, settings.HERITAGE_NEARBY_CACHE_PRECISION)
+    )
+    users = [(min_lat, min_lon), (max_lat - 1e-9, max_lon - 1e-9), (PLAZA_LATITUDE, PLAZA_LONGITUDE)]
+
+    for latitude, longitude in users:
+        # Act
+        items, total_count = await service.search(
+            20, 0, latitude, longitude, None, None, None, distance_range, None, "distance", sort_order
+        )
+
+        # Assert
+        expected = reference_search(rows, latitude, longitude, distance_range, sort_order)
+        assert total_count == len(expected)
+        assert [(item.distance, item.id) for item in items] == expected[:20]
+
+    assert service.heritage_repository.search_nearby_candidates.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_follow_exact_ranking():
+    # Arrange
+    rows = make_rows()
+    service = HeritageNearbyService(AsyncMock(), make_repository(rows), cache=TTLCache(100, 60))
+    expected = reference_search(rows, PLAZA_LATITUDE, PLAZA_LONGITUDE, "1-10", SortOrder.ASC)
+
+    # Act
+    pages, cursor = [], None
+    while True:
+        items, _ = await service.search(
+            50, 0, PLAZA_LATITUDE, PLAZA_LONGITUDE, None, None, None, "1-10", None, "distance", SortOrder.ASC, cursor
+        )
+        pages.extend((item.distance, item.id) for item in items)
+        if len(items) < 50:
+            break
+        cursor = (items[-1].distance, items[-1].id)
+
+    # Assert
+    assert pages == expected
+
+
+@pytest.mark.asyncio
+async def test_too_many_candidates_bypass_cache(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(settings, "HERITAGE_NEARBY_CACHE_MAX_CANDIDATES", 10)
+    service = HeritageNearbyService(AsyncMock(), make_repository(make_rows()), cache=TTLCache(100, 60))
+
+    # Act
+    first = await service.search(20, 0, PLAZA_LATITUDE, PLAZA_LONGITUDE, None, None, None, "1-10", None, "id", None)
+    second = await service.search(20, 0, PLAZA_LATITUDE, PLAZA_LONGITUDE, None, None, None, "1-10", None, "id", None)
+
+    # Assert
+    assert first is None and second is None
+    assert service.heritage_repository.search_nearby_candidates.await_count == 1
+
+
+def test_supports_only_bounded_distance_ranges():
+    assert HeritageNearbyService.supports("1-10", "distance")
+    assert not HeritageNearbyService.supports("10-100", "distance")
+    assert not HeritageNearbyService.supports(None, "distance")
+    assert not HeritageNearbyService.supports("1-10", "relevance")
@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.schemas.heritage import HeritageBuildingInfo, HeritageRouteInfo
+from app.service import heritage_route_service as heritage_route_service_module
+from app.service.heritage_route_service import HeritageRouteService
+from app.utils.cache import TTLCache
+
+
+def make_routes(heritage_id: int):
+    return [
+        HeritageRouteInfo(
+            route_id=heritage_id * 10,
+            name="추천 코스",
+            buildings=[HeritageBuildingInfo(building_id=1, name="근정전", coordinate=(126.97, 37.57))],
+        )
+    ]
+
+
+@pytest.fixture
+def route_service():
+    heritage_repository = AsyncMock()
+    heritage_repository.get_routes_with_buildings_by_heritages_id.side_effect = make_routes
+    return HeritageRouteService(AsyncMock(), heritage_repository, cache=TTLCache(100, 60))
+
+
+@pytest.mark.asyncio
+async def test_routes_are_loaded_once_per_heritage(route_service):
+    # Act
+    first = await route_service.get_routes(1)
+    second = await route_service.get_routes(1)
+
+    # Assert
+    assert first == second == make_routes(1)
+    route_service.heritage_repository.get_routes_with_buildings_by_heritages_id.assert_awaited_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_loads_most_chatted_heritages_in_one_query(route_service):
+    # Arrange
+    route_service.heritage_repository.get_chat_session_counts.return_value = {1: 5, 2: 30, 3: 12}
+    route_service.heritage_repository.get_routes_with_buildings_by_heritage_ids.return_value = {2: make_routes(2)}
+
+    # Act
+    warmed = await route_service.warm_up(2)
+    warmed_routes = await route_service.get_routes(2)
+    empty_routes = await route_service.get_routes(3)
+
+    # Assert
+    assert warmed == 2
+    route_service.heritage_repository.get_routes_with_buildings_by_heritage_ids.assert_awaited_once_with([2, 3])
+    assert warmed_routes == make_routes(2)
+    assert empty_routes == []
+    route_service.heritage_repository.get_routes_with_buildings_by_heritages_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reload_after_invalidation_reads_from_primary(monkeypatch):
+    # Arrange
+    cache = TTLCache(100, 60)
+    monkeypatch.setattr(heritage_route_service_module, "heritage_route_cache", cache)
+    heritage_repository = AsyncMock()
+    heritage_repository.db = SimpleNamespace(info={})
+    primary_only = []
+
+    async def load_routes(heritage_id):
+        primary_only.append(heritage_repository.db.info.get("primary_only"))
+        return make_routes(heritage_id)
+
+    heritage_repository.get_routes_with_buildings_by_heritages_id.side_effect = load_routes
+    route_service = HeritageRouteService(AsyncMock(), heritage_repository, cache=cache)
+    await route_service.get_routes(1)
+
+    # Act: 코스 변경 커밋 후 무효화된 항목 재적재
+    heritage_route_service_module._invalidate_heritage_routes(
+        SimpleNamespace(info={"heritage_route_invalidations": {1}})
+    )
+    await route_service.get_routes(1)
+
+    # Assert
+    assert primary_only == [True, True]
+    assert heritage_repository.db.info["primary_only"] is False
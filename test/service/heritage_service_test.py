@@ -0,0 +1,83 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.config import settings
+from app.index.catalog import HeritageRecord
+from app.index.fuzzy_index import FuzzyIndex
+from app.index.name_index import NameIndex
+from app.models.enums import SortOrder
+from app.service import heritage_service as heritage_service_module
+from app.service.heritage_service import HeritageService
+from app.utils.cursor import encode_cursor
+
+
+@pytest.fixture
+def heritage_service(monkeypatch):
+    index = FuzzyIndex(max_distance=1)
+    index.rebuild([HeritageRecord(7, "경복궁", None, "서울 종로구", 37.5, 127.0, 1, "사적", 11.0, None, None)])
+    monkeypatch.setattr(heritage_service_module, "fuzzy_index", index)
+    monkeypatch.setattr(settings, "FUZZY_INDEX_ENABLED", True)
+    monkeypatch.setattr(settings, "GEO_INDEX_ENABLED", False)
+    monkeypatch.setattr(settings, "NAME_INDEX_ENABLED", False)
+
+    service = HeritageService(AsyncMock(), heritage_repository=AsyncMock(), heritage_count_service=AsyncMock())
+    return service
+
+
+@pytest.mark.asyncio
+async def test_get_heritages_falls_back_to_fuzzy_search_when_name_has_no_match(heritage_service):
+    # Arrange
+    heritage = MagicMock(id=7, location_list="서울 종로구", heritage_type_name="사적", image_url=None, distance=1.23)
+    heritage.name = "경복궁"
+    heritage_service.heritage_repository.search_heritages.side_effect = [[], [heritage]]
+    heritage_service.heritage_count_service.count_heritages.side_effect = [0, 1]
+
+    # Act
+    result = await heritage_service.get_heritages(1, 10, 37.5, 127.0, name="경북궁")
+
+    # Assert
+    assert [item.name for item in result.items] == ["경복궁"]
+    assert result.total_count == 1
+    assert result.fuzzy_matched is True
+    fallback_call = heritage_service.heritage_repository.search_heritages.await_args_list[1]
+    assert fallback_call.args[-1] == [7]
+
+
+@pytest.mark.asyncio
+async def test_get_heritages_does_not_fall_back_to_fuzzy_search_after_last_cursor_page(heritage_service):
+    # Arrange
+    heritage_service.heritage_repository.search_heritages.return_value = []
+    heritage_service.heritage_count_service.count_heritages.return_value = 3
+    cursor = encode_cursor("id", SortOrder.ASC, (7,))
+
+    # Act
+    result = await heritage_service.get_heritages(1, 10, 37.5, 127.0, name="경복궁", cursor=cursor)
+
+    # Assert
+    assert result.items == []
+    assert result.fuzzy_matched is False
+    assert heritage_service.heritage_repository.search_heritages.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_heritages_uses_like_filter_when_name_index_result_is_too_broad(heritage_service, monkeypatch):
+    # Arrange
+    index = NameIndex()
+    index.rebuild(
+        [HeritageRecord(i, f"궁{i}", None, "서울", 37.5, 127.0, 1, "사적", 11.0, None, None) for i in range(1, 6)]
+    )
+    monkeypatch.setattr(heritage_service_module, "name_index", index)
+    monkeypatch.setattr(settings, "NAME_INDEX_ENABLED", True)
+    monkeypatch.setattr(settings, "NAME_INDEX_MAX_SQL_IDS", 3)
+    heritage_service.heritage_repository.search_heritages.return_value = []
+    heritage_service.heritage_count_service.count_heritages.return_value = 0
+
+    # Act
+    await heritage_service.get_heritages(1, 10, 37.5, 127.0, name="궁", sort_by="relevance")
+
+    # Assert: ID 목록 대신 이름(LIKE)으로 조회하고 관련도 정렬은 ID 정렬로 대체
+    search_args = heritage_service.heritage_repository.search_heritages.await_args.args
+    assert search_args[4] == "궁"
+    assert search_args[9] == "id"
+    assert search_args[-1] is None
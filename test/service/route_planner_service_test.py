@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.error.heritage_exceptions import BuildingNotFoundException
+from app.index.geofence_index import HeritageGeofence
+from app.service.route_planner_service import RoutePlannerService
+from app.utils.route_planner import plan_visit_order
+
+# 남북으로 약 110m 간격의 건축물 세 곳
+ROWS = [
+    SimpleNamespace(
+        id=building_id, name=name, latitude=latitude, longitude=126.977, custom_radius=30.0, default_radius=None
+    )
+    for building_id, name, latitude in [(1, "광화문", 37.5760), (2, "근정전", 37.5786), (3, "흥례문", 37.5770)]
+]
+
+
+@pytest.fixture
+def planner_service():
+    geofence_service = AsyncMock()
+    geofence_service.get_fence.return_value = HeritageGeofence.from_rows(ROWS)
+    return RoutePlannerService(AsyncMock(), AsyncMock(), geofence_service)
+
+
+@pytest.mark.asyncio
+async def test_plan_orders_buildings_and_reuses_plan_for_same_building_set(planner_service):
+    # Act
+    with patch("app.service.route_planner_service.plan_visit_order", wraps=plan_visit_order) as plan:
+        first = await planner_service.plan(1, [2, 1, 3])
+        second = await planner_service.plan(1, [3, 2, 1])
+
+    # Assert
+    assert [building.building_id for building in first.buildings] in ([1, 3, 2], [2, 3, 1])
+    assert second == first
+    assert plan.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_plan_starts_from_user_position(planner_service):
+    # Act
+    route = await planner_service.plan(1, [1, 2, 3], latitude=37.5790, longitude=126.977)
+
+    # Assert
+    assert [building.building_id for building in route.buildings] == [2, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_plan_rejects_building_of_other_heritage(planner_service):
+    with pytest.raises(BuildingNotFoundException):
+        await planner_service.plan(1, [1, 99])
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from app.utils.cache import StaleWhileRevalidateCache
+
+
+def make_loader(values):
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return values[len(calls) - 1]
+
+    return load, calls
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_is_served_from_cache():
+    # Arrange
+    cache = StaleWhileRevalidateCache("test", max_entries=10, ttl_seconds=60, stale_seconds=60)
+    load, calls = make_loader(["v1", "v2"])
+
+    # Act
+    first = await cache.get(1, load)
+    second = await cache.get(1, load)
+
+    # Assert
+    assert (first, second) == ("v1", "v1")
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_and_revalidated_in_background():
+    # Arrange
+    cache = StaleWhileRevalidateCache("test", max_entries=10, ttl_seconds=0, stale_seconds=60)
+    load, calls = make_loader(["v1", "v2"])
+    await cache.get(1, load)
+
+    # Act
+    stale = await cache.get(1, load)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    # Assert
+    assert stale == "v1"
+    assert len(calls) == 2
+    assert cache._entries[1][1] == "v2"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_load_once():
+    # Arrange
+    cache = StaleWhileRevalidateCache("test", max_entries=10, ttl_seconds=60, stale_seconds=60)
+    release = asyncio.Event()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await release.wait()
+        return "v1"
+
+    # Act
+    first = asyncio.create_task(cache.get(1, load))
+    second = asyncio.create_task(cache.get(1, load))
+    await asyncio.sleep(0)
+    release.set()
+
+    # Assert
+    assert await first == await second == "v1"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_discards_entry_and_in_flight_load():
+    # Arrange
+    cache = StaleWhileRevalidateCache("test", max_entries=10, ttl_seconds=60, stale_seconds=60)
+    release = asyncio.Event()
+
+    async def slow_load():
+        await release.wait()
+        return "old"
+
+    # Act
+    loading = asyncio.create_task(cache.get(1, slow_load))
+    await asyncio.sleep(0)
+    cache.invalidate(1)
+    release.set()
+    await loading
+
+    # Assert
+    assert len(cache) == 0
@@ -0,0 +1,36 @@
+import pytest
+
+from app.error.heritage_exceptions import InvalidCursorException
+from app.models.enums import SortOrder
+from app.utils.cursor import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    # Arrange
+    cursor = encode_cursor("distance", SortOrder.DESC, (12.34, 56))
+
+    # Act
+    keys = decode_cursor(cursor, "distance", SortOrder.DESC)
+
+    # Assert
+    assert keys == (12.34, 56)
+
+
+@pytest.mark.parametrize(
+    "cursor, sort_by, sort_order",
+    [
+        ("not-a-cursor", "id", SortOrder.ASC),
+        (encode_cursor("id", SortOrder.ASC, (3,)), "distance", SortOrder.ASC),
+        (encode_cursor("id", SortOrder.ASC, (3,)), "id", SortOrder.DESC),
+    ],
+)
+def test_invalid_or_mismatched_cursor_raises(cursor, sort_by, sort_order):
+    # Act Assert
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor, sort_by, sort_order)
+
+
+def test_distance_cursor_round_trips_null_distance():
+    cursor = encode_cursor("distance", SortOrder.ASC, (None, 7))
+
+    assert decode_cursor(cursor, "distance", SortOrder.ASC) == (None, 7)
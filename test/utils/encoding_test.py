@@ -0,0 +1,95 @@
+import json
+
+import msgpack
+import pytest
+
+from app.schemas.heritage import (
+    CustomRouteResponse,
+    HeritageBuildingInfo,
+    HeritageListResponse,
+    HeritageRouteInfo,
+    PaginatedHeritageResponse,
+)
+from app.utils.encoding import (
+    COORDINATE_SCALE,
+    DISTANCE_SCALE,
+    ResponseFormat,
+    compact_response,
+    negotiate_response_format,
+    to_columns,
+    to_compact_payload,
+)
+
+ROUTE = CustomRouteResponse(
+    heritage_id=1,
+    distance=210.5,
+    buildings=[
+        HeritageBuildingInfo(building_id=1, name="근정전", coordinate=(126.977, 37.5786)),
+        HeritageBuildingInfo(building_id=2, name="사정전", coordinate=(126.97701, 37.5796)),
+    ],
+)
+ROUTE_COLUMNS = {"buildings": {"coordinate": COORDINATE_SCALE}}
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        (None, ResponseFormat.JSON),
+        ("application/json", ResponseFormat.JSON),
+        ("*/*", ResponseFormat.JSON),
+        ("application/msgpack, application/json;q=0.5", ResponseFormat.MSGPACK),
+        ("application/vnd.neonadeuli.columnar+json", ResponseFormat.COLUMNAR_JSON),
+    ],
+)
+def test_negotiate_response_format(accept, expected):
+    assert negotiate_response_format(accept) == expected
+
+
+def test_to_columns_quantizes_and_recurses_into_nested_lists():
+    # Act
+    columns = to_columns(
+        [
+            {
+                "route_id": 1,
+                "name": "a",
+                "buildings": [{"building_id": 3, "name": "b", "coordinate": [126.977, 37.5786]}],
+            },
+            {"route_id": 2, "name": "c", "buildings": []},
+        ],
+        {"buildings": {"coordinate": COORDINATE_SCALE}},
+        HeritageRouteInfo,
+    )
+
+    # Assert
+    assert columns == {
+        "route_id": [1, 2],
+        "name": ["a", "c"],
+        "buildings": [
+            {"building_id": [3], "name": ["b"], "coordinate": [[126977000, 37578600]]},
+            {"building_id": [], "name": [], "coordinate": []},
+        ],
+    }
+
+
+def test_compact_payload_keeps_columns_for_empty_list():
+    # Arrange
+    page = PaginatedHeritageResponse(items=[], total_count=0, page=1, limit=10)
+
+    # Act
+    payload = to_compact_payload(page, {"items": {"distance": DISTANCE_SCALE}})
+
+    # Assert
+    assert payload["items"] == {field: [] for field in HeritageListResponse.model_fields}
+
+
+def test_compact_response_round_trips_through_msgpack_and_columnar_json():
+    # Act
+    packed = msgpack.unpackb(compact_response(ROUTE, ResponseFormat.MSGPACK, ROUTE_COLUMNS).body)
+    columnar = json.loads(compact_response(ROUTE, ResponseFormat.COLUMNAR_JSON, ROUTE_COLUMNS).body)
+
+    # Assert
+    assert packed == columnar
+    assert packed["buildings"]["name"] == ["근정전", "사정전"]
+    assert packed["buildings"]["coordinate"] == [[126977000, 37578600], [126977010, 37579600]]
+    assert packed["scales"] == {"coordinate": COORDINATE_SCALE}
+    assert compact_response(ROUTE, ResponseFormat.JSON, ROUTE_COLUMNS) is None
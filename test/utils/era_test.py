@@ -0,0 +1,29 @@
+import pytest
+
+from app.models.enums import EraCategory
+from app.utils.era import normalize_era, primary_era_category
+
+
+@pytest.mark.parametrize(
+    "era, expected",
+    [
+        ("조선시대", [EraCategory.JOSEON]),
+        ("삼국:신라", [EraCategory.SILLA]),
+        ("통일신라", [EraCategory.UNIFIED_SILLA]),
+        ("조선 후기", [EraCategory.JOSEON]),
+        ("신석기시대", [EraCategory.STONE_AGE]),
+        ("고려시대~조선시대", [EraCategory.JOSEON, EraCategory.GORYEO]),
+        ("조선시대, 대한제국시대", [EraCategory.KOREAN_EMPIRE, EraCategory.JOSEON]),
+        ("고조선", []),
+        ("미상", []),
+        ("", []),
+        (None, []),
+    ],
+)
+def test_normalize_era(era, expected):
+    assert normalize_era(era) == expected
+
+
+def test_primary_era_category():
+    assert primary_era_category("삼국:고구려") == EraCategory.GOGURYEO
+    assert primary_era_category("시대미상") is None
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from app.utils.geo import decode_deltas, decode_polyline, stratified_sample
+
+
+def test_decode_polyline_matches_reference_example():
+    # Google Polyline Algorithm 문서 예시
+    latitudes, longitudes = decode_polyline("_p~iF~ps|U_ulLnnqC_mqNvxq`@")
+
+    assert latitudes.tolist() == pytest.approx([38.5, 40.7, 43.252])
+    assert longitudes.tolist() == pytest.approx([-120.2, -120.95, -126.453])
+
+
+@pytest.mark.parametrize("encoded", ["_p~iF~ps|", "_p~iF", "_p~iF ps|U"])
+def test_decode_polyline_rejects_malformed_input(encoded):
+    with pytest.raises(ValueError):
+        decode_polyline(encoded)
+
+
+def test_decode_polyline_rejects_overlong_value_and_too_many_points():
+    with pytest.raises(ValueError):
+        decode_polyline("~" * 14 + "??")
+    with pytest.raises(ValueError):
+        decode_polyline("_p~iF~ps|U_ulLnnqC_mqNvxq`@", max_points=2)
+
+
+def test_decode_deltas_rejects_values_beyond_int64():
+    with pytest.raises(ValueError):
+        decode_deltas([2**70], [0])
+
+
+def test_decode_deltas_restores_absolute_coordinates():
+    latitudes, longitudes = decode_deltas([37578600, 100, -50], [126977000, 0, 200])
+
+    assert np.allclose(latitudes, [37.5786, 37.5787, 37.57865])
+    assert np.allclose(longitudes, [126.977, 126.977, 126.9772])
+
+
+def test_decode_deltas_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        decode_deltas([1, 2], [1])
+
+
+def test_stratified_sample_spreads_selection_across_cells():
+    # Arrange: 한 셀에 100 건이 몰려 있고 나머지 세 셀에 1 건씩
+    ids = np.arange(103)
+    latitudes = np.concatenate([np.full(100, 37.01), [37.01, 37.07, 37.07]])
+    longitudes = np.concatenate([np.full(100, 127.01), [127.07, 127.01, 127.07]])
+
+    # Act
+    selected = stratified_sample(ids, latitudes, longitudes, span=0.1, grid_size=2, k=6)
+
+    # Assert: 드문 셀은 모두 포함, 남은 자리는 밀집 셀에서 ID 순으로
+    assert ids[selected].tolist() == [0, 1, 2, 100, 101, 102]
+
+
+def test_stratified_sample_returns_everything_under_limit():
+    ids = np.array([5, 3, 9])
+
+    selected = stratified_sample(ids, np.zeros(3), np.zeros(3), span=1.0, grid_size=8, k=10)
+
+    assert ids[selected].tolist() == [3, 5, 9]
@@ -0,0 +1,54 @@
+import numpy as np
+
+from app.utils.route_planner import plan_visit_order, route_length
+
+
+def line_matrix(positions):
+    positions = np.asarray(positions, dtype=np.float64)
+    return np.abs(positions[:, None] - positions[None, :])
+
+
+def test_plan_visit_order_walks_points_on_a_line_end_to_end():
+    # Arrange
+    positions = [30, 0, 50, 10, 40, 20]
+    matrix = line_matrix(positions)
+
+    # Act
+    order = plan_visit_order(matrix)
+
+    # Assert
+    visited = [positions[index] for index in order]
+    assert visited in (sorted(positions), sorted(positions, reverse=True))
+    assert route_length(matrix, order) == 50
+
+
+def test_plan_visit_order_starts_from_user_position():
+    # Arrange
+    positions = [30, 0, 50, 10, 40, 20]
+    matrix = line_matrix(positions)
+    start_distances = np.abs(np.array(positions, dtype=np.float64) - 45)
+
+    # Act
+    order = plan_visit_order(matrix, start_distances)
+
+    # Assert
+    assert [positions[index] for index in order] == [50, 40, 30, 20, 10, 0]
+    assert route_length(matrix, order, start_distances) == 55
+
+
+def test_plan_visit_order_untangles_crossing_path():
+    # Arrange: 원 위의 점을 무작위 순서로 배치하면 최근접 이웃만으로는 교차가 남을 수 있음
+    rng = np.random.default_rng(7)
+    angles = rng.permutation(np.linspace(0, 2 * np.pi, 40, endpoint=False))
+    points = np.stack([np.cos(angles), np.sin(angles)], axis=1) * 100
+    matrix = np.linalg.norm(points[:, None] - points[None, :], axis=2)
+
+    # Act
+    order = plan_visit_order(matrix)
+
+    # Assert: 원 둘레(약 628m)에서 한 변을 뺀 길이에 가까워야 함
+    assert route_length(matrix, order) < 2 * np.pi * 100
+
+
+def test_plan_visit_order_handles_single_building():
+    assert plan_visit_order(np.zeros((1, 1))) == [0]